@@ -0,0 +1,8 @@
+# Shared database access for the bulk loaders
+from .connection import connection, transaction, get_pool, close_pool, DatabaseConfigError
+from .statements import STATEMENTS, prepare, execute_prepared
+
+__all__ = [
+    'connection', 'transaction', 'get_pool', 'close_pool', 'DatabaseConfigError',
+    'STATEMENTS', 'prepare', 'execute_prepared',
+]
@@ -0,0 +1,132 @@
+"""
+Shared PostgreSQL connection pool for the bulk loaders.
+Connection settings come from the environment (the same POSTGRES_* variables
+docker-compose reads from .env). Loaders running in one process, in sequence
+or in threads, borrow connections from a single pool instead of connecting
+and disconnecting for every file.
+"""
+import atexit
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from psycopg2 import extensions, pool
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ENV_FILE = BASE_DIR / ".env"
+
+_pool = None
+_pool_slots = None
+_pool_lock = threading.Lock()
+
+
+class DatabaseConfigError(ValueError):
+    """Raised when the database connection settings are incomplete."""
+
+
+class PreparedConnection(extensions.connection):
+    """Connection that remembers which statements it has prepared (see db/statements.py)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+
+def load_environment(env_file=ENV_FILE):
+    """Load POSTGRES_* and DB_* variables from .env without overriding the environment"""
+    if not env_file.exists():
+        return
+    with open(env_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                os.environ.setdefault(key.strip(), value.strip())
+
+
+def connection_settings():
+    """psycopg2.connect keyword arguments from the environment"""
+    load_environment()
+    password = os.getenv("POSTGRES_PASSWORD")
+    if not password:
+        raise DatabaseConfigError(f"POSTGRES_PASSWORD is not set (environment or {ENV_FILE})")
+    return {
+        "dbname": os.getenv("POSTGRES_DB", "uhl_db"),
+        "user": os.getenv("POSTGRES_USER", "uhl_user"),
+        "password": password,
+        "host": os.getenv("POSTGRES_HOST", "localhost"),
+        "port": os.getenv("POSTGRES_PORT", "5432"),
+    }
+
+
+def get_pool():
+    """
+    The process-wide connection pool, created on first use
+    Holds DB_POOL_MIN (default 1) to DB_POOL_MAX (default 8) connections and is
+    safe to share between threads.
+    """
+    global _pool, _pool_slots
+    with _pool_lock:
+        if _pool is None or _pool.closed:
+            settings = connection_settings()
+            max_connections = int(os.getenv("DB_POOL_MAX", "8"))
+            _pool = pool.ThreadedConnectionPool(
+                int(os.getenv("DB_POOL_MIN", "1")),
+                max_connections,
+                connection_factory=PreparedConnection,
+                **settings
+            )
+            # ThreadedConnectionPool raises when exhausted; borrowers wait for a slot instead
+            _pool_slots = threading.BoundedSemaphore(max_connections)
+        return _pool
+
+
+def close_pool():
+    """Close every pooled connection (called at exit)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and not _pool.closed:
+            _pool.closeall()
+        _pool = None
+
+
+atexit.register(close_pool)
+
+
+@contextmanager
+def connection():
+    """
+    Borrow a pooled connection, waiting while all DB_POOL_MAX are in use
+    It goes back to the pool afterwards (closed if it broke).
+    """
+    db_pool = get_pool()
+    slots = _pool_slots
+    with slots:
+        conn = db_pool.getconn()
+        try:
+            yield conn
+        finally:
+            # Never hand the next borrower a connection mid-transaction
+            if not conn.closed and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            db_pool.putconn(conn, close=bool(conn.closed))
+
+
+@contextmanager
+def transaction():
+    """
+    Cursor in a transaction on a pooled connection
+    Commits when the block finishes and rolls back if it raises.
+    """
+    with connection() as conn:
+        try:
+            with conn.cursor() as cur:
+                yield cur
+            conn.commit()
+        except BaseException:
+            if not conn.closed:
+                conn.rollback()
+            # Statements prepared in the rolled back transaction are checked again before reuse
+            conn.prepared.clear()
+            raise
@@ -0,0 +1,130 @@
+"""
+Prepared statements for the bulk loaders.
+Each statement is prepared once per pooled connection (PREPARE name AS ...) and
+rows are sent as EXECUTE batches, so the server parses and plans each upsert
+once per connection instead of once per CSV row.
+"""
+import re
+
+from psycopg2.extras import execute_batch
+
+# Rows sent per round trip
+BATCH_SIZE = 500
+
+STATEMENTS = {
+    "insert_season": """
+        INSERT INTO Seasons (Year)
+        VALUES ($1)
+        ON CONFLICT DO NOTHING
+    """,
+    "upsert_team": """
+        INSERT INTO Teams (Name, City, Coach)
+        VALUES ($1, $2, $3)
+        ON CONFLICT (Name, City) DO UPDATE
+        SET City = EXCLUDED.City,
+            Coach = EXCLUDED.Coach
+    """,
+    "insert_team_season": """
+        INSERT INTO TeamSeasons (TeamID, SeasonID)
+        VALUES ($1, $2)
+        ON CONFLICT DO NOTHING
+    """,
+    "upsert_player": """
+        INSERT INTO Players (FirstName, LastName, Position, JerseyNumber, Email)
+        VALUES ($1, $2, $3, $4, $5)
+        ON CONFLICT (Email) DO UPDATE
+        SET FirstName = EXCLUDED.FirstName,
+            LastName = EXCLUDED.LastName,
+            Position = EXCLUDED.Position,
+            JerseyNumber = EXCLUDED.JerseyNumber
+    """,
+    "update_player_number": """
+        UPDATE Players
+        SET JerseyNumber = $1
+        WHERE PlayerID = $2
+    """,
+    "update_player_team": """
+        UPDATE Players
+        SET TeamID = $1
+        WHERE PlayerID = $2
+    """,
+    "upsert_player_team_season": """
+        INSERT INTO PlayerTeamSeasons (PlayerID, TeamID, SeasonID, IsCurrent)
+        VALUES ($1, $2, $3, $4)
+        ON CONFLICT (PlayerID, TeamID, SeasonID)
+        DO UPDATE SET IsCurrent = EXCLUDED.IsCurrent
+    """,
+    "insert_player_transfer": """
+        INSERT INTO PlayerTransfers (PlayerID, FromTeamID, ToTeamID, TransferDate)
+        VALUES ($1, $2, $3, $4)
+    """,
+    "insert_game": """
+        INSERT INTO Games (SeasonID, Date, Time, Ref1, Ref2, HomeTeamID, AwayTeamID, HomeScore, AwayScore)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+        ON CONFLICT DO NOTHING
+    """,
+    "insert_player_statistics": """
+        INSERT INTO PlayerStatistics (SeasonID, PlayerID, TeamID, GamesPlayed, Goals, Assists, PenaltyMinutes)
+        VALUES ($1, $2, $3, $4, $5, $6, $7)
+        ON CONFLICT (SeasonID, PlayerID) DO NOTHING
+    """,
+    "update_player_statistics": """
+        UPDATE PlayerStatistics
+        SET GamesPlayed = $1,
+            Goals = $2,
+            Assists = $3,
+            PenaltyMinutes = $4
+        WHERE SeasonID = $5 AND PlayerID = $6 AND TeamID = $7
+    """,
+    "insert_team_record": """
+        INSERT INTO TeamRecords (SeasonID, TeamID, Wins, Losses, Ties)
+        VALUES ($1, $2, $3, $4, $5)
+        ON CONFLICT (SeasonID, TeamID) DO NOTHING
+    """,
+    "update_team_record": """
+        UPDATE TeamRecords
+        SET Wins = $1,
+            Losses = $2,
+            Ties = $3
+        WHERE SeasonID = $4 AND TeamID = $5
+    """,
+}
+
+
+def parameter_count(sql):
+    """Number of $n parameters a statement takes"""
+    return max((int(number) for number in re.findall(r"\$(\d+)", sql)), default=0)
+
+
+def prepare(cur, name):
+    """Prepare a statement on the cursor's connection unless it already is"""
+    conn = cur.connection
+    if name in conn.prepared:
+        return
+    if name not in STATEMENTS:
+        raise KeyError(f"Unknown statement '{name}' (expected one of {', '.join(STATEMENTS)})")
+    # The session may still hold it from before a rolled back transaction
+    cur.execute("SELECT 1 FROM pg_prepared_statements WHERE name = %s", (name,))
+    if cur.fetchone() is None:
+        cur.execute(f"PREPARE {name} AS {STATEMENTS[name]}")
+    conn.prepared.add(name)
+
+
+def execute_prepared(cur, name, rows, page_size=BATCH_SIZE):
+    """
+    Run a prepared statement once per row (a sequence of parameters), page_size rows
+    per round trip; rows may be any iterable, e.g. a generator over a CSV reader
+    Returns the number of rows sent
+    """
+    prepare(cur, name)
+    placeholders = ", ".join(["%s"] * parameter_count(STATEMENTS[name]))
+    sent = 0
+
+    def counted():
+        nonlocal sent
+        for row in rows:
+            sent += 1
+            yield row
+
+    execute_batch(cur, f"EXECUTE {name} ({placeholders})", counted(), page_size=page_size)
+    return sent
@@ -1,52 +1,38 @@
 import csv
-import psycopg2
+import sys
+from pathlib import Path
+
+# Shared database access (db/) lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from db import transaction, execute_prepared  # noqa: E402
 
 def load_games_from_csv(file_path):
     try:
-        conn = psycopg2.connect(
-            dbname="uhl_db",
-            user="uhl_user",
-            password="uhl_password",
-            host="localhost",
-            port="5432"
-        )
-        cur = conn.cursor()
-        conn.autocommit = False
-
-        with open(file_path, mode='r') as file:
+        # One transaction on a pooled connection; rows go out in prepared batches
+        with transaction() as cur, open(file_path, mode='r') as file:
             csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                Ref1 = row['Ref1'] if row['Ref1'].strip() else None
-                Ref2 = row['Ref2'] if row['Ref2'].strip() else None
-
-                insert_game_query = """
-                INSERT INTO Games (SeasonID, Date, Time, Ref1, Ref2, HomeTeamID, AwayTeamID, HomeScore, AwayScore)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT DO NOTHING;
-                """
-                cur.execute(insert_game_query, (
+            execute_prepared(cur, "insert_game", (
+                (
                     row['SeasonID'],
                     row['Date'],
                     row['Time'],
-                    Ref1,
-                    Ref2,
+                    row['Ref1'] if row['Ref1'].strip() else None,
+                    row['Ref2'] if row['Ref2'].strip() else None,
                     row['HomeTeamID'],
                     row['AwayTeamID'],
                     row['HomeScore'] if row['HomeScore'] else None,
                     row['AwayScore'] if row['AwayScore'] else None
-                ))
+                )
+                for row in csv_reader
+            ))
 
-        conn.commit()
         print("Games loaded successfully")
 
     except Exception as e:
-        conn.rollback()
+        # The transaction has been rolled back
         print(f"An error occurred: {e}")
 
-    finally:
-        cur.close()
-        conn.close()
-
 if __name__ == "__main__":
     csv_file_path = 'input.csv'
-    load_games_from_csv(csv_file_path)
\ No newline at end of file
+    load_games_from_csv(csv_file_path)
@@ -3,6 +3,7 @@ UHL Configuration Management
 Centralized configuration loading with environment support.
 """
 import os
+from datetime import date
 from pathlib import Path
 
 # Base paths
@@ -40,7 +41,7 @@ DEFAULT_GAME_SPREADSHEET_ID = os.getenv(
 )
 
 ## Sheet Ranges
-GAMES_RANGE = "games!A2:Z55"
+GAMES_RANGE = "games!A1:Z55"
 PLAYERS_RANGE = "players!A2:C53"
 PLAYERS_SEASON_RANGE = "players!D2:O53"
 STANDINGS_RANGE = "standings!A2:L5"
@@ -58,19 +59,114 @@ GAME_RANGES = {
 # Game events range
 GAME_EVENTS_RANGE = "gameEvents!A1:P100"
 
+# Populated extents of the player spreadsheet sheets, resolved at runtime by
+# SheetsClient.get_sheet() so ranges grow with the data instead of truncating.
+# The last row is taken from the first column; "fallback" is used if discovery fails.
+SHEET_EXTENTS = {
+    "games": {"sheet": "games", "columns": ("A", "U"), "first_row": 1, "fallback": GAMES_RANGE},
+    "players": {"sheet": "players", "columns": ("A", "C"), "first_row": 2, "fallback": PLAYERS_RANGE},
+    "players_season": {"sheet": "players", "columns": ("D", "O"), "first_row": 2, "fallback": PLAYERS_SEASON_RANGE},
+    "standings": {"sheet": "standings", "columns": ("A", "L"), "first_row": 2, "fallback": STANDINGS_RANGE},
+    "games_played": {"sheet": "gamesPlayed", "columns": ("A", "F"), "first_row": 1, "fallback": GAMES_PLAYED_RANGE},
+    "game_events": {"sheet": "gameEvents", "columns": ("A", "K"), "first_row": 1, "fallback": GAME_EVENTS_RANGE},
+}
+# How long discovered extents are cached before re-reading sheet properties
+RANGE_DISCOVERY_TTL_SECONDS = int(os.getenv("RANGE_DISCOVERY_TTL_SECONDS", "300"))
+
+# Game events ingestion (port of appscript/gameEvents.gs)
+GAME_EVENTS_SHEET = "gameEvents"
+GAMES_PLAYED_SHEET = "gamesPlayed"
+GAME_LINKS_RANGE = "gamelinks!A2:B"
+# Only the key columns are read for de-duplication
+GAME_EVENTS_KEYS_RANGE = "gameEvents!A:B"
+GAMES_PLAYED_KEYS_RANGE = "gamesPlayed!A:C"
+
+## Sheets API Quota / Retry
+# Read requests per minute per user (service account) for the Sheets API
+SHEETS_READ_REQUESTS_PER_MINUTE = int(os.getenv("SHEETS_READ_REQUESTS_PER_MINUTE", "60"))
+SHEETS_MAX_RETRIES = int(os.getenv("SHEETS_MAX_RETRIES", "5"))
+SHEETS_BACKOFF_BASE_SECONDS = float(os.getenv("SHEETS_BACKOFF_BASE_SECONDS", "1.0"))
+SHEETS_BACKOFF_MAX_SECONDS = float(os.getenv("SHEETS_BACKOFF_MAX_SECONDS", "32.0"))
+SHEETS_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("SHEETS_CIRCUIT_FAILURE_THRESHOLD", "5"))
+SHEETS_CIRCUIT_RESET_SECONDS = float(os.getenv("SHEETS_CIRCUIT_RESET_SECONDS", "60"))
+# Concurrent requests for multi-spreadsheet fetches (AsyncSheetsClient)
+SHEETS_MAX_CONCURRENCY = int(os.getenv("SHEETS_MAX_CONCURRENCY", "8"))
+SHEETS_REQUEST_TIMEOUT_SECONDS = float(os.getenv("SHEETS_REQUEST_TIMEOUT_SECONDS", "30"))
+# Worker processes for formatting game sheets in games-batch runs (None = CPU count)
+GAMES_BATCH_WORKERS = int(os.getenv("GAMES_BATCH_WORKERS", "0")) or None
+
+## Schedule Output
+# schedule.json ("json"), schedule.ndjson with one game per line ("ndjson"), or both ("both")
+SCHEDULE_OUTPUT_FORMAT = os.getenv("SCHEDULE_OUTPUT_FORMAT", "json").lower()
+# Processes formatting schedule partitions (seasons / game-id ranges); 1 = in-process, 0 = CPU count
+SCHEDULE_WORKERS = int(os.getenv("SCHEDULE_WORKERS", "1")) or None
+# Most games per partition; larger seasons are split by game id
+SCHEDULE_PARTITION_GAMES = int(os.getenv("SCHEDULE_PARTITION_GAMES", "500"))
+
+## Season
+# Season id used for player seasons and game logs
+CURRENT_SEASON_ID = os.getenv("CURRENT_SEASON_ID", "1")
+# Year the current season starts (seasons run September to March)
+CURRENT_SEASON_YEAR = int(os.getenv(
+    "CURRENT_SEASON_YEAR", str(date.today().year if date.today().month >= 7 else date.today().year - 1)
+))
+# Worker processes for `schedule_generator.py --batch` (None = CPU count)
+SCHEDULE_BATCH_WORKERS = int(os.getenv("SCHEDULE_BATCH_WORKERS", "0")) or None
+
+## Leagues (`uhl_ops.py leagues`)
+# Registered leagues, keyed by league id:
+# {"<league>": {"name", "player_spreadsheet_id", "game_spreadsheet_id", "season_id",
+#               "teams": {"<team id>": "<team name>"}, "sheet_extents": {...}, "output_dir"}}
+# Without this file the only league is DEFAULT_LEAGUE, built from the settings above
+LEAGUES_FILE = os.getenv("LEAGUES_FILE", str(CONFIG_DIR / "leagues.json"))
+# League used by single-league commands
+DEFAULT_LEAGUE = os.getenv("DEFAULT_LEAGUE", "uhl")
+# Teams of the built-in default league by team id
+DEFAULT_TEAMS = {
+    "1": "New York",
+    "2": "Detroit",
+    "3": "Chicago",
+    "4": "Boston"
+}
+# Leagues processed at once by `uhl_ops.py leagues` (0 = all of them)
+LEAGUE_WORKERS = int(os.getenv("LEAGUE_WORKERS", "0")) or None
+
+## Leaderboards
+# Leaders kept per category (plus anyone tied with the last of them)
+LEADERS_TOP_K = int(os.getenv("LEADERS_TOP_K", "10"))
+# Games needed to qualify for rate categories (points per game, GAA)
+LEADERS_MIN_GP = int(os.getenv("LEADERS_MIN_GP", "3"))
+
+## Referee Assignment (`uhl_ops.py assign-refs`)
+# [{"name": ..., "unavailable": ["MM-DD-YYYY"], "teams": [...], "max_games_per_night": 2}]
+REFEREES_FILE = os.getenv("REFEREES_FILE", str(CONFIG_DIR / "referees.json"))
+REF_MAX_GAMES_PER_NIGHT = int(os.getenv("REF_MAX_GAMES_PER_NIGHT", "2"))
+# Referee fields filled per game (Ref1, Ref2)
+REFS_PER_GAME = int(os.getenv("REFS_PER_GAME", "2"))
+
+## Season Archive (`uhl_ops.py archive-season`)
+# Closed seasons as columnar tables, one archive/season=<id>/ partition each
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", str(OUTPUT_DIR / "archive"))
+
+## Watch Mode
+# Seconds between Drive modifiedTime checks in `uhl_ops.py watch`
+WATCH_POLL_SECONDS = float(os.getenv("WATCH_POLL_SECONDS", "30"))
+# Touching this file forces a refresh on the next poll
+WATCH_TRIGGER_FILE = os.getenv("WATCH_TRIGGER_FILE", str(OUTPUT_DIR / ".refresh"))
+# Longest wait between polls while cycles keep failing (the wait doubles per failure)
+WATCH_MAX_BACKOFF_SECONDS = float(os.getenv("WATCH_MAX_BACKOFF_SECONDS", "600"))
+
+## Read API (`uhl_ops.py serve`)
+API_HOST = os.getenv("API_HOST", "127.0.0.1")
+API_PORT = int(os.getenv("API_PORT", "8080"))
+# Seconds clients may reuse a response before revalidating with If-None-Match
+API_CACHE_MAX_AGE_SECONDS = int(os.getenv("API_CACHE_MAX_AGE_SECONDS", "15"))
+
 ## File Paths
 SERVICE_ACCOUNT_FILE = str(CREDENTIALS_DIR / "service-account-key.json")
 GOOGLE_CREDS_FILE = str(CREDENTIALS_DIR / "google-creds.json")
 TOKEN_FILE = str(CREDENTIALS_DIR / "token.json")
 
-## Team Mappings
-TEAM_NAMES = {
-    1: "New York",
-    2: "Detroit", 
-    3: "Chicago",
-    4: "Boston"
-}
-
 ## Directories
 DIRECTORIES = {
     "output": OUTPUT_DIR,
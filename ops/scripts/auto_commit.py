@@ -6,7 +6,6 @@ Automated commit, push, and release workflow for UHL operations
 
 import os
 import sys
-import json
 import subprocess
 import argparse
 from datetime import datetime
@@ -14,6 +13,10 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.json_stream import JSONStreamError, count_json_array  # noqa: E402
+
 class Colors:
     """ANSI color codes for terminal output"""
     RED = '\033[0;31m'
@@ -198,35 +201,33 @@ class GitAutoCommit:
             players_path = output_dir / 'players.json'
             goalies_path = output_dir / 'goalie_stats.json'
             
+            # Counted by streaming, so large multi-season files are never loaded whole
             if schedule_path.exists():
-                with open(schedule_path) as f:
-                    schedule_data = json.load(f)
-                    if isinstance(schedule_data, list):
-                        analysis['data_stats']['games'] = len(schedule_data)
-                    else:
-                        analysis['data_stats']['games'] = len(schedule_data.get('games', []))
+                analysis['data_stats']['games'] = self._count_items(schedule_path, 'games')
                     
             if players_path.exists():
-                with open(players_path) as f:
-                    players_data = json.load(f)
-                    if isinstance(players_data, list):
-                        analysis['data_stats']['players'] = len(players_data)
-                    else:
-                        analysis['data_stats']['players'] = len(players_data.get('players', []))
+                analysis['data_stats']['players'] = self._count_items(players_path, 'players')
                     
             if goalies_path.exists():
-                with open(goalies_path) as f:
-                    goalies_data = json.load(f)
-                    if isinstance(goalies_data, list):
-                        analysis['data_stats']['goalies'] = len(goalies_data)
-                    else:
-                        analysis['data_stats']['goalies'] = len(goalies_data.get('goalies', []))
+                analysis['data_stats']['goalies'] = self._count_items(goalies_path, 'goalies')
                     
-        except (json.JSONDecodeError, FileNotFoundError):
+        except (JSONStreamError, FileNotFoundError):
             pass
             
         return analysis
         
+    @staticmethod
+    def _count_items(path: Path, key: str) -> int:
+        """Items in a JSON list file, or in the list under key for {key: [...]} files"""
+        try:
+            return count_json_array(path)
+        except JSONStreamError:
+            try:
+                return count_json_array(path, key)
+            except JSONStreamError:
+                # An object without the key counts as empty, like .get(key, [])
+                return 0
+        
     def generate_commit_message(self, analysis: Dict[str, any], custom_msg: Optional[str] = None) -> str:
         """Generate appropriate commit message based on changes"""
         if custom_msg:
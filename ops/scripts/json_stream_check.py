@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+UHL Streaming JSON Check
+Streams JSON arrays through the stdlib fallback of src/data/json_stream.py with
+every chunk size (numbers, strings and objects split at every position) and
+compares the items with json.load. Also streams the recorded schedule.json at
+random chunk sizes and, with ijson installed, checks that both readers return
+the same items or errors for arrays, {key: [...]} objects and missing keys.
+
+Usage (from ops/):
+    python3 scripts/json_stream_check.py               # Fuzz chunk boundaries
+    python3 scripts/json_stream_check.py --samples 500 # More schedule.json chunk sizes
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+OPS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(OPS_DIR))
+
+from src.data import json_stream  # noqa: E402
+
+# Recorded schedule.json streamed at random chunk sizes
+SCHEDULE_FIXTURE = OPS_DIR.parent / "games" / "ops" / "schedule.json"
+
+# (document, key) pairs; every chunk size from 1 to the document length is tried
+CASES = [
+    ([1, 2.75, -3e5, 1.5E-3, 0, -0.0, 10, True, False, None], None),
+    (["a", "b \"quoted\" \\ c", "é☃", ""], None),
+    ([{"name": "Goalie One", "GAA": 2.75, "GP": 12}, {"GAA": 3, "SO": 0}, [], {}], None),
+    ({"meta": {"season": 1.5, "ids": [1, 22, 333]}, "count": 4.25, "games": [2.5, {"Score": "2 - 1"}, 17]}, "games"),
+    ([], None),
+]
+
+# (document, key) pairs both readers must agree on, errors included
+SHAPE_CASES = [
+    ([1, {"games": [2]}], None),
+    ([1, 2], "games"),
+    ({"games": [{"id": 1}], "meta": {"games": [9]}}, None),
+    ({"meta": {"games": [9]}, "games": [{"id": 1}, {"id": 2}]}, "games"),
+    ({"meta": {"games": [9]}}, "games"),
+    ({"games": 5}, "games"),
+    (5, None),
+]
+
+
+def stream(path, key, chunk_size):
+    json_stream.CHUNK_SIZE = chunk_size
+    try:
+        return list(json_stream.iter_json_array(path, key))
+    except json_stream.JSONStreamError as e:
+        return e
+
+
+def read_with(path, key, use_ijson):
+    """Items (or the error message) from one reader"""
+    json_stream.IJSON_AVAILABLE = use_ijson
+    try:
+        return list(json_stream.iter_json_array(path, key))
+    except json_stream.JSONStreamError as e:
+        return f"JSONStreamError: {e}"
+
+
+def check_file(path, key, chunk_sizes):
+    """Chunk sizes whose streamed items differ from json.load"""
+    with open(path) as f:
+        expected = json.load(f)
+    if key is not None:
+        expected = expected[key]
+    return [size for size in chunk_sizes if stream(path, key, size) != expected]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='UHL streaming JSON check')
+    parser.add_argument('--samples', type=int, default=100, help='Random chunk sizes tried on schedule.json')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the schedule.json chunk sizes')
+    args = parser.parse_args()
+
+    ijson_available = json_stream.IJSON_AVAILABLE
+    failures = 0
+    if ijson_available:
+        with tempfile.TemporaryDirectory() as tmp:
+            for number, (document, key) in enumerate(SHAPE_CASES, 1):
+                path = Path(tmp) / f"shape{number}.json"
+                path.write_text(json.dumps(document))
+                results = [read_with(path, key, use_ijson) for use_ijson in (True, False)]
+                if results[0] != results[1]:
+                    failures += 1
+                    print(f"❌ shape {number} (key={key}): ijson {results[0]!r} != stdlib {results[1]!r}")
+        if not failures:
+            print(f"✅ ijson and the stdlib reader agree on {len(SHAPE_CASES)} array/object shapes")
+    else:
+        print("ℹ️  ijson not installed; checking the stdlib reader only")
+
+    # The fallback decoder is what runs when ijson isn't installed
+    json_stream.IJSON_AVAILABLE = False
+    chunk_size = json_stream.CHUNK_SIZE
+    with tempfile.TemporaryDirectory() as tmp:
+        for number, (document, key) in enumerate(CASES, 1):
+            for indent in (None, 4):
+                text = json.dumps(document, indent=indent)
+                path = Path(tmp) / f"case{number}.json"
+                path.write_text(text)
+                failed = check_file(path, key, range(1, len(text) + 2))
+                label = f"case {number} (indent={indent})"
+                if failed:
+                    failures += 1
+                    print(f"❌ {label}: differs from json.load at chunk sizes {failed[:10]}")
+                else:
+                    print(f"✅ {label}: {len(text) + 1} chunk sizes match json.load")
+
+    if SCHEDULE_FIXTURE.exists():
+        size = SCHEDULE_FIXTURE.stat().st_size
+        rng = random.Random(args.seed)
+        sizes = sorted({rng.randint(1, size) for _ in range(args.samples)} | {chunk_size})
+        failed = check_file(SCHEDULE_FIXTURE, None, sizes)
+        if failed:
+            failures += 1
+            print(f"❌ schedule.json: differs from json.load at chunk sizes {failed[:10]}")
+        else:
+            print(f"✅ schedule.json: {len(sizes)} chunk sizes match json.load")
+    json_stream.CHUNK_SIZE = chunk_size
+    json_stream.IJSON_AVAILABLE = ijson_available
+
+    if failures:
+        print(f"\n❌ {failures} case(s) failed the streaming check")
+        sys.exit(1)
+    print("\n✅ Streamed items match json.load at every chunk boundary")
+
+
+if __name__ == '__main__':
+    main()
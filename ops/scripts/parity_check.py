@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+UHL Formatter Parity Check
+Runs the formatter engine (src/formatters) over recorded sheet fixtures and
+compares every output with the expected files, then reports how the output
+differs from the two formatter stacks it replaced (ops/formatters.py and the
+old src/formatters), whose outputs are recorded under parity_fixtures/baseline.
+
+Usage (from ops/):
+    python3 scripts/parity_check.py              # Compare against expected outputs
+    python3 scripts/parity_check.py --verbose    # Also list differing paths
+    python3 scripts/parity_check.py --record     # Re-record expected outputs
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import sys
+from pathlib import Path
+
+OPS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(OPS_DIR))
+
+import pandas as pd  # noqa: E402
+from src.data.schema import SCHEMAS  # noqa: E402
+from src.data.sheets_client import columns_to_frame  # noqa: E402
+from src.formatters import (  # noqa: E402
+    GameFormatter, PlayerFormatter, StandingsFormatter, GoalieStatsFormatter
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "parity_fixtures"
+INPUTS_DIR = FIXTURES_DIR / "inputs"
+EXPECTED_DIR = FIXTURES_DIR / "expected"
+BASELINE_DIRS = {
+    "ops/formatters.py": FIXTURES_DIR / "baseline" / "legacy",
+    "old src/formatters": FIXTURES_DIR / "baseline" / "src",
+}
+# Recorded schedule.json used as the goalie stats input
+SCHEDULE_FIXTURE = OPS_DIR.parent / "games" / "ops" / "schedule.json"
+
+
+def load_rows(name):
+    """Raw sheet values as returned by the Sheets API (ragged rows of strings)"""
+    with open(INPUTS_DIR / f"{name}.json") as f:
+        return json.load(f)
+
+
+def load_frame(name):
+    """DataFrame shaped like SheetsClient.get_range / get_sheet output"""
+    return pd.DataFrame(load_rows(name))
+
+
+def load_columns(name):
+    """
+    The fixture as the column-major UNFORMATTED_VALUE fetch returns it (SheetsClient.get_typed_range):
+    plain numbers as numbers, dates and times as their formatted strings, trailing blanks dropped
+    """
+    rows = load_rows(name)
+    columns = []
+    for position in range(max(len(row) for row in rows)):
+        column = [row[position] if position < len(row) else "" for row in rows]
+        column = [int(value) if isinstance(value, str) and re.fullmatch(r"-?\d+", value) else value
+                  for value in column]
+        while column and column[-1] == "":
+            column.pop()
+        columns.append(column)
+    while columns and not columns[-1]:
+        columns.pop()
+    return columns
+
+
+def load_table(name):
+    """Typed DataFrame shaped like SheetsClient.get_table output"""
+    return SCHEMAS[name].apply(columns_to_frame(load_columns(name)))
+
+
+def run_schedule():
+    return GameFormatter.build_complete_schedule(
+        load_table("games"), load_table("game_events"), load_table("games_played")
+    )
+
+
+def run_all_games():
+    # The all-games list covers the A:L columns of the games sheet, below its header row
+    df_games = load_frame("games").iloc[1:, :12].reset_index(drop=True)
+    scan = GameFormatter.scan_tbd(df_games)
+    return {
+        "season": GameFormatter.check_season_status(df_games, scan),
+        "games": GameFormatter.format_all_games(df_games, scan),
+    }
+
+
+def run_players():
+    players = PlayerFormatter.format_players(load_frame("players"))
+    seasons = PlayerFormatter.format_season_stats(load_frame("players_season"))
+    return PlayerFormatter.combine_player_data(players, seasons)
+
+
+def run_standings():
+    return StandingsFormatter.format_standings(load_frame("standings"))
+
+
+def run_goalie_stats():
+    with open(SCHEDULE_FIXTURE) as f:
+        schedule_data = json.load(f)
+    goalie_stats = GoalieStatsFormatter.calculate_goalie_stats_from_schedule(schedule_data)
+    return GoalieStatsFormatter.format_goalie_stats(goalie_stats)
+
+
+TRANSFORMS = {
+    "schedule": run_schedule,
+    "all_games": run_all_games,
+    "players": run_players,
+    "standings": run_standings,
+    "goalie_stats": run_goalie_stats,
+}
+
+
+def normalize(data):
+    """Round-trip through JSON so numpy/pandas scalars compare like the saved files"""
+    return json.loads(json.dumps(data, default=str))
+
+
+def save_output(data, path):
+    """Save one record per line so fixture diffs stay readable"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        if isinstance(data, list):
+            f.write("[\n" + ",\n".join(json.dumps(item) for item in data) + "\n]\n")
+        else:
+            json.dump(data, f, indent=1)
+            f.write("\n")
+
+
+def diff_paths(expected, actual, path="$"):
+    """List the JSON paths where two outputs differ"""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        paths = []
+        for key in list(expected) + [k for k in actual if k not in expected]:
+            if key not in actual or key not in expected:
+                paths.append(f"{path}.{key}")
+            else:
+                paths.extend(diff_paths(expected[key], actual[key], f"{path}.{key}"))
+        return paths
+    if isinstance(expected, list) and isinstance(actual, list):
+        paths = []
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            paths.extend(diff_paths(a, b, f"{path}[{i}]"))
+        if len(expected) != len(actual):
+            paths.append(f"{path} (length {len(expected)} != {len(actual)})")
+        return paths
+    return [] if expected == actual else [path]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='UHL formatter parity check')
+    parser.add_argument('--record', action='store_true', help='Re-record expected outputs from the engine')
+    parser.add_argument('--verbose', action='store_true', help='List differing paths')
+    parser.add_argument('--limit', type=int, default=10, help='Max differing paths shown per comparison')
+    args = parser.parse_args()
+
+    failures = 0
+    for name, transform in TRANSFORMS.items():
+        # Formatters print progress and warnings; keep the report readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            output = normalize(transform())
+
+        expected_path = EXPECTED_DIR / f"{name}.json"
+        if args.record:
+            save_output(output, expected_path)
+            print(f"💾 {name}: recorded {expected_path.relative_to(OPS_DIR)}")
+        elif not expected_path.exists():
+            print(f"❌ {name}: no expected output (run with --record)")
+            failures += 1
+            continue
+        else:
+            with open(expected_path) as f:
+                paths = diff_paths(json.load(f), output)
+            if paths:
+                failures += 1
+                print(f"❌ {name}: {len(paths)} differences from expected output")
+                for path in paths[:args.limit]:
+                    print(f"     {path}")
+            else:
+                print(f"✅ {name}: matches expected output")
+
+        # How the engine departs from each replaced stack
+        for label, baseline_dir in BASELINE_DIRS.items():
+            baseline_path = baseline_dir / f"{name}.json"
+            if not baseline_path.exists():
+                continue
+            with open(baseline_path) as f:
+                paths = diff_paths(json.load(f), output)
+            status = "identical" if not paths else f"{len(paths)} differences"
+            print(f"     vs {label}: {status}")
+            if args.verbose:
+                for path in paths[:args.limit]:
+                    print(f"       {path}")
+
+    if failures:
+        print(f"\n❌ {failures} transform(s) failed the parity check")
+        sys.exit(1)
+    print("\n✅ All transforms match the expected outputs")
+
+
+if __name__ == '__main__':
+    main()
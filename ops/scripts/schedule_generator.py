@@ -1,28 +1,120 @@
 #!/usr/bin/env python3
 """
-UHL Schedule Generator for 2025-2026 Season
-Generates schedule starting weekend after Labor Day through second Sunday in March
+UHL Schedule Generator
+Generates a season schedule starting weekend after Labor Day through second Sunday in March
+Matchups come from a circle-method round robin (src/scheduling/round_robin.py), so any
+number of teams, rinks and time slots is supported.
+
+Blackout dates, team unavailable dates, rest days and early/late slot balance
+come from a constraints file; the round robin is then improved with simulated
+annealing (src/scheduling/optimizer.py).
+
+Usage (from ops/):
+    python3 scripts/schedule_generator.py
+    python3 scripts/schedule_generator.py --teams teams.json --rinks North,South --slots "7:45 PM,8:45 PM,9:45 PM"
+    python3 scripts/schedule_generator.py --constraints constraints.json --optimize-seconds 10
+    python3 scripts/schedule_generator.py --referees config/referees.json   # Adds Ref1/Ref2 columns
+    python3 scripts/schedule_generator.py --year 2026 --output-dir ./output
+    python3 scripts/schedule_generator.py --batch batch.json --workers 4     # Many seasons/divisions at once
+
+constraints.json (dates as MM-DD-YYYY or YYYY-MM-DD, teams by id):
+    {
+        "blackouts": ["12-21-2025", "12-28-2025"],
+        "unavailable": {"2": ["10-05-2025"]},
+        "min_rest_days": 2
+    }
+
+batch.json (every season x division runs in its own process; division keys are
+the generator options above, file paths or inline objects for teams/constraints/referees;
+divisions are scheduled independently, so divisions sharing a rink need different slots,
+and any rink/date/slot booked by two divisions is reported as a conflict):
+    {
+        "seasons": [2024, 2025, 2026],
+        "divisions": {
+            "A": {"teams": {"1": "New York", "2": "Detroit", "3": "Chicago", "4": "Boston"}},
+            "B": {"teams": "teams_b.json", "rinks": ["North", "South"], "constraints": "constraints_b.json"}
+        },
+        "optimize_seconds": 5,
+        "seed": 1
+    }
+Outputs go to <output-dir>/schedules/season=<year>/division=<name>/ as schedule.csv plus
+schedule.parquet / schedule.feather (with pyarrow installed), listed in schedules/index.json.
 """
 
+import argparse
+import contextlib
+import io
 import json
 import datetime
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import timedelta
+from pathlib import Path
 import csv
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.scheduling.round_robin import RoundRobinSchedule  # noqa: E402
+from src.scheduling.optimizer import ScheduleConstraints, ScheduleOptimizer  # noqa: E402
+from src.scheduling.referees import RefereeAssigner  # noqa: E402
+from src.scheduling import batch  # noqa: E402
+from src.utils import config  # noqa: E402
+
+
+def parse_date(value):
+    """Parse a constraints file date (MM-DD-YYYY or YYYY-MM-DD)"""
+    for date_format in ("%m-%d-%Y", "%Y-%m-%d"):
+        try:
+            return datetime.datetime.strptime(value.strip(), date_format).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid date in constraints: {value}")
+
 class ScheduleGenerator:
-    def __init__(self):
+    def __init__(self, teams=None, time_slots=None, rinks=None, meetings=None, constraints=None,
+                 optimize_seconds=5.0, seed=None, referees=None, ref_max_games_per_night=2, year=None):
+        # Year the season starts (September); defaults to the current season
+        self.year = int(year or config.CURRENT_SEASON_YEAR)
         # Team mappings from your existing data
-        self.teams = {
+        self.teams = teams or {
             "1": "New York",
             "2": "Detroit", 
             "3": "Chicago",
             "4": "Boston"
         }
-        self.team_ids = ["1", "2", "3", "4"]
-        self.time_slots = ["7:45 PM", "8:45 PM"]
+        self.team_ids = list(self.teams)
+        self.time_slots = time_slots or ["7:45 PM", "8:45 PM"]
+        # Rink names; a Rink column is only written with more than one rink
+        self.rinks = rinks or ["Main"]
+        # Meetings of every pair of teams (None = as many as fit in the season)
+        self.meetings = meetings
+        # Parsed constraints file; without one the round robin is used as generated
+        self.constraints = self.build_constraints(constraints) if constraints else None
+        self.optimize_seconds = optimize_seconds
+        self.seed = seed
+        # Referee availability list; with it the CSV gets Ref1/Ref2 columns
+        self.referees = referees
+        self.ref_max_games_per_night = ref_max_games_per_night
+    
+    def build_constraints(self, spec):
+        """ScheduleConstraints from a constraints file (team ids -> team indexes, date strings -> dates)"""
+        unknown = [team_id for team_id in spec.get("unavailable", {}) if str(team_id) not in self.teams]
+        if unknown:
+            raise ValueError(f"Unknown team ids in constraints: {', '.join(map(str, unknown))}")
+        return ScheduleConstraints(
+            blackout_dates=[parse_date(date) for date in spec.get("blackouts", [])],
+            unavailable={
+                self.team_ids.index(str(team_id)): [parse_date(date) for date in dates]
+                for team_id, dates in spec.get("unavailable", {}).items()
+            },
+            min_rest_days=spec.get("min_rest_days", 2),
+            weights=spec.get("weights"),
+        )
         
-    def get_season_dates(self, year=2025):
+    def get_season_dates(self, year=None):
         """Calculate season start and end dates"""
+        year = year or self.year
         # Labor Day is first Monday in September
         labor_day = self.get_labor_day(year)
         
@@ -50,7 +142,7 @@ class ScheduleGenerator:
             return sept_first + timedelta(days=days_to_monday)
     
     def generate_game_dates(self, start_date, end_date):
-        """Generate all game dates (Sundays only, based on your current schedule)"""
+        """Generate all game dates (Sundays only, based on your current schedule), skipping blackouts"""
         dates = []
         current_date = start_date
         
@@ -60,89 +152,81 @@ class ScheduleGenerator:
                 dates.append(current_date)
             current_date += timedelta(days=1)
         
+        if self.constraints:
+            dates = self.constraints.open_dates(dates)
         return dates
     
-    def generate_balanced_matchups(self):
+    def build_round_robin(self, game_dates):
+        """Circle-method round robin sized to the teams, rinks, slots and season dates"""
+        if self.meetings:
+            return RoundRobinSchedule(len(self.team_ids), self.meetings, len(self.rinks), len(self.time_slots))
+        return RoundRobinSchedule.fill(len(self.team_ids), len(game_dates), len(self.rinks), len(self.time_slots))
+    
+    def generate_balanced_matchups(self, game_dates=None):
         """Generate balanced schedule ensuring fair home/away distribution"""
-        matchups = []
-        
-        # Create a more balanced approach
-        # Each team should play each other team approximately the same number of times
-        # With 4 teams and 54 games, each team plays ~13-14 games
-        
-        teams = self.team_ids.copy()
-        
-        # Generate multiple rounds to get 54 games
-        for round_num in range(15):  # 15 rounds should give us plenty
-            for i, home_team in enumerate(teams):
-                for j, away_team in enumerate(teams):
-                    if home_team != away_team:
-                        # Rotate who's home/away to ensure balance
-                        if (round_num + i + j) % 2 == 0:
-                            matchups.append((home_team, away_team))
-                        else:
-                            matchups.append((away_team, home_team))
-        
-        # Take first 54 games
-        return matchups[:54]
+        if game_dates is None:
+            game_dates = self.generate_game_dates(*self.get_season_dates())
+        schedule = self.build_round_robin(game_dates)
+        return [
+            (self.team_ids[home], self.team_ids[away])
+            for home, away in zip(schedule.home.tolist(), schedule.away.tolist())
+        ]
     
     def generate_google_sheets_data(self):
         """Generate data for Google Sheets with initial fields only"""
-        start_date, end_date = self.get_season_dates(2025)
+        start_date, end_date = self.get_season_dates()
         game_dates = self.generate_game_dates(start_date, end_date)
-        matchups = self.generate_balanced_matchups()
+        schedule = self.build_round_robin(game_dates)
         
         # Basic headers for initial Google Sheets setup
         headers = ["id", "Date", "Time", "HomeTeamID", "AwayTeamID", "Home", "Away"]
-        
-        rows = [headers]  # Start with headers
-        game_id = 1
+        if len(self.rinks) > 1:
+            headers.append("Rink")
         
         print(f"Season dates: {start_date} to {end_date}")
         print(f"Game dates available: {len(game_dates)}")
-        print(f"Need to schedule: 54 games")
-        
-        # Generate 2 games per date (27 dates × 2 games = 54 games)
-        date_idx = 0
-        while game_id <= 54 and date_idx < len(game_dates):
-            game_date = game_dates[date_idx]
-            
-            for time_slot in self.time_slots:
-                if game_id > 54:
-                    break
-                    
-                if game_id - 1 < len(matchups):
-                    home_team_id, away_team_id = matchups[game_id - 1]
-                    home_team = self.teams[home_team_id]
-                    away_team = self.teams[away_team_id]
-                    
-                    row = [
-                        str(game_id),  # id
-                        game_date.strftime("%m-%d-%Y"),  # Date
-                        time_slot,  # Time
-                        home_team_id,  # HomeTeamID
-                        away_team_id,  # AwayTeamID
-                        home_team,  # Home
-                        away_team   # Away
-                    ]
-                    
-                    rows.append(row)
-                    game_id += 1
-            
-            date_idx += 1
+        print(f"Need to schedule: {len(schedule)} games ({schedule.meetings} meetings per pair, "
+              f"{schedule.dates_needed} dates)")
         
-        return rows
+        if self.constraints:
+            optimizer = ScheduleOptimizer(schedule, game_dates, self.constraints, self.seed)
+            print(f"Optimizing for up to {self.optimize_seconds:g}s (seed violations: {optimizer.violations()})")
+            optimizer.optimize(self.optimize_seconds)
+            violations = optimizer.violations()
+            print(f"Optimized schedule: {violations}")
+            if violations["double_booked"] or violations["unavailable"]:
+                print("⚠️  Some hard constraints could not be met; add dates or relax unavailability")
+        
+        records = schedule.to_records(
+            self.team_ids, [self.teams[team_id] for team_id in self.team_ids],
+            game_dates, self.time_slots, self.rinks
+        )
+        if self.referees:
+            headers.extend(["Ref1", "Ref2"])
+            unfilled = RefereeAssigner(self.referees, self.ref_max_games_per_night).assign(records)
+            for record in records:
+                record["Ref1"] = record.get("Ref1") or "TBD"
+                record["Ref2"] = record.get("Ref2") or ""
+            if unfilled:
+                print(f"⚠️  {len(unfilled)} games still need referees")
+        return [headers] + [[record[header] for header in headers] for record in records]
     
-    def save_csv_schedule(self, filename="2025_2026_schedule.csv"):
+    def season_label(self):
+        return f"{self.year}-{self.year + 1}"
+    
+    def save_csv_schedule(self, filename=None):
         """Generate and save schedule as CSV for Google Sheets import"""
+        if filename is None:
+            filename = os.path.join(config.OUTPUT_DIR, f"{self.year}_{self.year + 1}_schedule.csv")
         rows = self.generate_google_sheets_data()
         
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
         with open(filename, 'w', newline='') as f:
             writer = csv.writer(f)
             writer.writerows(rows)
         
         print(f"\n=== Schedule Generation Complete ===")
-        print(f"Generated {len(rows)-1} games for the 2025-2026 season")
+        print(f"Generated {len(rows)-1} games for the {self.season_label()} season")
         print(f"Season runs from {rows[1][1]} to {rows[-1][1]}")
         print(f"CSV saved to: {filename}")
         print(f"\nTo import to Google Sheets:")
@@ -162,16 +246,16 @@ class ScheduleGenerator:
     
     def print_season_summary(self):
         """Print summary of the season schedule"""
-        start_date, end_date = self.get_season_dates(2025)
+        start_date, end_date = self.get_season_dates()
         game_dates = self.generate_game_dates(start_date, end_date)
-        matchups = self.generate_balanced_matchups()
+        matchups = self.generate_balanced_matchups(game_dates)
         
-        print(f"\n=== 2025-2026 UHL Season Summary ===")
-        print(f"Labor Day 2025: {self.get_labor_day(2025)}")
+        print(f"\n=== {self.season_label()} UHL Season Summary ===")
+        print(f"Labor Day {self.year}: {self.get_labor_day(self.year)}")
         print(f"Season Start: {start_date} (Sunday after Labor Day)")
         print(f"Season End: {end_date} (Second Sunday in March)")
         print(f"Total Sundays: {len(game_dates)}")
-        print(f"Total Games: 54 (2 games per Sunday)")
+        print(f"Total Games: {len(matchups)} (up to {len(self.rinks) * len(self.time_slots)} games per Sunday)")
         print(f"Teams: {', '.join(self.teams.values())}")
         
         # Count games per team
@@ -188,15 +272,186 @@ class ScheduleGenerator:
             total = home_games[team_id] + away_games[team_id]
             print(f"  {team_name}: {total} games ({home_games[team_id]} home, {away_games[team_id]} away)")
 
+def split_option(value):
+    """A comma-separated option ("7:45 PM, 8:45 PM") or list as stripped names; None stays None"""
+    if value is None:
+        return None
+    values = value.split(',') if isinstance(value, str) else value
+    return [str(item).strip() for item in values]
+
+
+def load_json_option(value):
+    """A batch option given inline or as a path to a JSON file"""
+    if isinstance(value, str):
+        with open(value) as f:
+            return json.load(f)
+    return value
+
+
+def generate_season(job):
+    """
+    Generate one season of one division and write its batch outputs
+    Runs in a worker process; returns (index entry, captured generator output,
+    (date, time, rink) of every game for the cross-division conflict check).
+    """
+    options = job["options"]
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        teams = load_json_option(options.get("teams"))
+        generator = ScheduleGenerator(
+            teams={str(team_id): name for team_id, name in teams.items()} if teams else None,
+            time_slots=split_option(options.get("slots")),
+            rinks=split_option(options.get("rinks")),
+            meetings=options.get("meetings"),
+            constraints=load_json_option(options.get("constraints")),
+            optimize_seconds=options.get("optimize_seconds", job["optimize_seconds"]),
+            seed=options.get("seed", job["seed"]),
+            referees=load_json_option(options.get("referees")),
+            ref_max_games_per_night=options.get("ref_max_games", 2),
+            year=job["season"],
+        )
+        rows = generator.generate_google_sheets_data()
+        records = [dict(zip(rows[0], row)) for row in rows[1:]]
+        entry = batch.write_season(records, job["output_dir"], job["season"], job["division"])
+    # Single-rink schedules have no Rink column
+    cells = [(record["Date"], record["Time"], record.get("Rink", generator.rinks[0])) for record in records]
+    return entry, output.getvalue(), cells
+
+
+def rink_conflicts(bookings):
+    """
+    Cells booked by more than one division of a season
+    bookings: {(season, division): [(date, time, rink)]}
+    Returns {season: [(date, time, rink, [divisions])]} in date order
+    """
+    divisions_by_cell = {}
+    for (season, division), cells in bookings.items():
+        for cell in cells:
+            divisions_by_cell.setdefault((season, cell), []).append(division)
+    conflicts = {}
+    for (season, cell), divisions in divisions_by_cell.items():
+        if len(divisions) > 1:
+            conflicts.setdefault(season, []).append((*cell, sorted(divisions)))
+    for cells in conflicts.values():
+        cells.sort(key=lambda cell: (parse_date(cell[0]), cell[1], cell[2]))
+    return conflicts
+
+
+def run_batch(spec, output_dir, workers=None):
+    """Generate every season x division of a batch spec in parallel and update the season index"""
+    seasons = [int(season) for season in spec.get("seasons", [config.CURRENT_SEASON_YEAR])]
+    divisions = spec.get("divisions") or {"A": {}}
+    jobs = [
+        {
+            "season": season,
+            "division": str(division),
+            "options": options or {},
+            "optimize_seconds": spec.get("optimize_seconds", 5.0),
+            "seed": spec.get("seed"),
+            "output_dir": output_dir,
+        }
+        for season in seasons for division, options in divisions.items()
+    ]
+    print(f"🗓️  Generating {len(jobs)} schedules ({len(seasons)} seasons x {len(divisions)} divisions)")
+    batch.warn_csv_only()
+
+    entries, failed, bookings = [], [], {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(generate_season, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            label = f"{job['season']}-{job['season'] + 1} division {job['division']}"
+            try:
+                entry, output, cells = future.result()
+            except Exception as e:
+                print(f"❌ {label}: {e}")
+                failed.append(label)
+                continue
+            entries.append(entry)
+            bookings[(job["season"], job["division"])] = cells
+            print(f"✅ {label}: {entry['games']} games ({entry['start']} to {entry['end']})")
+            # Worker output stays quiet except for warnings (unmet constraints, missing referees)
+            for line in output.splitlines():
+                if line.startswith("⚠️"):
+                    print(f"   {line}")
+
+    # Divisions are generated independently; two of them on one rink at one time can't both play
+    for season, cells in sorted(rink_conflicts(bookings).items()):
+        label = f"{season}-{season + 1}"
+        print(f"❌ {label}: {len(cells)} rink/date/slot cells booked by more than one division "
+              f"(give divisions their own rinks or slots)")
+        for date, time, rink, divisions in cells[:5]:
+            print(f"   {date} {time} {rink}: divisions {', '.join(divisions)}")
+        failed.append(f"{label} rink conflicts")
+
+    index_path = batch.write_index(entries, output_dir)
+    print(f"📇 Season index updated: {index_path} ({len(entries)} written, {len(failed)} failed)")
+    return entries, failed
+
+
 def main():
-    generator = ScheduleGenerator()
+    parser = argparse.ArgumentParser(description='UHL schedule generator')
+    parser.add_argument('--teams', help='JSON file mapping team id to team name (default: the four UHL teams)')
+    parser.add_argument('--slots', help='Comma-separated game times per date (default: "7:45 PM,8:45 PM")')
+    parser.add_argument('--rinks', help='Comma-separated rink names (default: one rink)')
+    parser.add_argument('--meetings', type=int, help='Times each pair of teams meets (default: fill the season)')
+    parser.add_argument('--constraints', help='JSON file with blackouts, team unavailable dates and min_rest_days')
+    parser.add_argument('--optimize-seconds', type=float, default=5.0, help='Time budget for the optimizer')
+    parser.add_argument('--seed', type=int, help='Random seed for a reproducible optimized schedule')
+    parser.add_argument('--referees', help='JSON referee list (name, unavailable, teams, max_games_per_night)')
+    parser.add_argument('--ref-max-games', type=int, default=2, help='Default max games per referee per night')
+    parser.add_argument('--year', type=int, help='Year the season starts (default: current season)')
+    parser.add_argument('--output-dir', default=config.OUTPUT_DIR, help='Where schedules are written')
+    parser.add_argument('--batch', help='JSON batch spec: many seasons and divisions, written under schedules/')
+    parser.add_argument('--workers', type=int, default=config.SCHEDULE_BATCH_WORKERS,
+                        help='Worker processes for --batch (default: CPU count)')
+    args = parser.parse_args()
+    
+    if args.batch:
+        with open(args.batch) as f:
+            spec = json.load(f)
+        _, failed = run_batch(spec, args.output_dir, args.workers)
+        sys.exit(1 if failed else 0)
     
-    # Print season summary
-    generator.print_season_summary()
+    teams = None
+    if args.teams:
+        with open(args.teams) as f:
+            teams = {str(team_id): name for team_id, name in json.load(f).items()}
     
-    # Generate CSV for Google Sheets
-    filename = "/Users/strings48066/git/github/hockey-league-db/ops/output/2025_2026_schedule.csv"
-    generator.save_csv_schedule(filename)
+    constraints = None
+    if args.constraints:
+        with open(args.constraints) as f:
+            constraints = json.load(f)
+    
+    referees = None
+    if args.referees:
+        with open(args.referees) as f:
+            referees = json.load(f)
+    
+    try:
+        generator = ScheduleGenerator(
+            teams=teams,
+            time_slots=split_option(args.slots),
+            rinks=split_option(args.rinks),
+            meetings=args.meetings,
+            constraints=constraints,
+            optimize_seconds=args.optimize_seconds,
+            seed=args.seed,
+            referees=referees,
+            ref_max_games_per_night=args.ref_max_games,
+            year=args.year,
+        )
+        
+        # Print season summary
+        generator.print_season_summary()
+        
+        # Generate CSV for Google Sheets
+        year = generator.year
+        generator.save_csv_schedule(os.path.join(args.output_dir, f"{year}_{year + 1}_schedule.csv"))
+    except ValueError as e:
+        # Not enough Sundays for the teams / rinks / slots / meetings requested, or a bad constraints file
+        print(f"❌ {e}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
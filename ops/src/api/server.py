@@ -0,0 +1,448 @@
+"""
+Local read API for league data.
+Serves the in-memory pipeline outputs (schedule, games, players, goalie stats,
+standings, leaders, head-to-head) over HTTP with ETag / If-None-Match revalidation, Cache-Control and
+gzip, so clients fetch only what they need and get 304s on repeat requests.
+"""
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+from src.formatters.base import team_key
+from src.formatters.head_to_head import COUNTERS
+from src.utils import config
+
+try:
+    from aiohttp import web
+except ImportError:  # optional dependency, only needed for the read API
+    web = None
+
+# Output files loaded at startup, by dataset name
+OUTPUT_FILES = {
+    "schedule": "schedule.json",
+    "players": "players.json",
+    "goalie_stats": "goalie_stats.json",
+    "standings": "standings.json",
+    "leaders": "leaders.json",
+    "head_to_head": "head_to_head.json",
+}
+# Per-player game logs (player_logs/<id>.json) are loaded as one dataset
+PLAYER_LOGS_DIR = "player_logs"
+# Watch stages whose output is a dataset
+STAGE_DATASETS = {
+    "schedule": "schedule",
+    "players": "players",
+    "goalie-stats": "goalie_stats",
+    "standings": "standings",
+    "player-logs": "player_logs",
+    "leaders": "leaders",
+    "head-to-head": "head_to_head",
+}
+# Datasets that are one JSON document instead of a list of records, with a key they must have
+DOCUMENT_DATASETS = {"leaders": "league", "head_to_head": "teams"}
+# Bulky per-game fields left out of schedule listings (served by /games/{id})
+GAME_DETAIL_FIELDS = ("Lineups", "Goals", "Penalties")
+SCHEDULE_DATE_FORMAT = "%m-%d-%Y"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# Smaller bodies are not worth compressing
+GZIP_MIN_BYTES = 1024
+BODY_CACHE_SIZE = 256
+
+# rows: per-game values used by schedule filters (schedule dataset), or the
+# team key -> matrix index / team scope of the head-to-head and leaders datasets
+Dataset = namedtuple("Dataset", ["data", "etag", "by_id", "rows", "updated_at"])
+
+
+def parse_date(value):
+    """Parse 'MM-DD-YYYY' (schedule format) or 'YYYY-MM-DD'; returns a date or None."""
+    for date_format in (SCHEDULE_DATE_FORMAT, "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value.strip(), date_format).date()
+        except (ValueError, AttributeError):
+            continue
+    return None
+
+
+def accepts_encoding(header, coding):
+    """Whether an Accept-Encoding header allows coding; q=0 (for it or for *) refuses it."""
+    wildcard = False
+    for entry in header.split(","):
+        name, _, params = entry.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        name = name.strip().lower()
+        if name == coding:
+            return quality > 0
+        if name == "*":
+            wildcard = quality > 0
+    return wildcard
+
+
+class LeagueDataStore:
+    """Latest pipeline outputs with a content ETag per dataset."""
+
+    def __init__(self):
+        self._datasets = {}
+
+    def update(self, name, data):
+        """Replace a dataset; status payloads (dicts from TBD/error handling) are ignored."""
+        is_document = name in DOCUMENT_DATASETS and isinstance(data, dict) and DOCUMENT_DATASETS[name] in data
+        if not isinstance(data, list) and not is_document:
+            return False
+
+        body = json.dumps(data, sort_keys=True, default=str).encode()
+        etag = hashlib.sha1(body).hexdigest()[:16]
+        current = self._datasets.get(name)
+        if current is not None and current.etag == etag:
+            return False
+
+        by_id = {}
+        rows = None
+        if name == "head_to_head" and is_document:
+            rows = {team_key(team): i for i, team in enumerate(data["teams"])}
+        elif name == "leaders" and is_document:
+            rows = {team_key(team): team for team in data.get("teams", {})}
+        elif not is_document:
+            by_id = {str(item.get("id", "")): item for item in data if isinstance(item, dict)}
+        if name == "schedule":
+            rows = [
+                (
+                    {key: value for key, value in game.items() if key not in GAME_DETAIL_FIELDS},
+                    parse_date(str(game.get("Date", ""))),
+                    str(game.get("Home", "")).lower(),
+                    str(game.get("Away", "")).lower(),
+                    str(game.get("Played", "")).lower() == "y",
+                )
+                for game in data
+            ]
+        # Swapped in one assignment so request handlers always see a consistent version
+        self._datasets[name] = Dataset(data, etag, by_id, rows, time.time())
+        return True
+
+    def get(self, name):
+        return self._datasets.get(name)
+
+    def load_output_dir(self, output_dir):
+        """Load the last saved outputs so the API can answer before the first refresh."""
+        for name, filename in OUTPUT_FILES.items():
+            path = os.path.join(output_dir, filename)
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r') as f:
+                    self.update(name, json.load(f))
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️  Could not load {path}: {e}")
+
+        logs_dir = os.path.join(output_dir, PLAYER_LOGS_DIR)
+        if os.path.isdir(logs_dir):
+            logs = []
+            for filename in sorted(os.listdir(logs_dir)):
+                if filename.endswith(".json") and filename != "index.json":
+                    try:
+                        with open(os.path.join(logs_dir, filename), 'r') as f:
+                            logs.append(json.load(f))
+                    except (OSError, json.JSONDecodeError) as e:
+                        print(f"⚠️  Could not load {filename}: {e}")
+            self.update("player_logs", logs)
+
+    def on_stage(self, stage, output):
+        """WatchOperations listener: publish refreshed stage outputs."""
+        name = STAGE_DATASETS.get(stage)
+        if stage == "player-logs" and output is not None:
+            # PlayerLogIndex -> list of logs, looked up by player id
+            output = list(output.logs.values())
+        elif stage in ("leaders", "head-to-head") and output is not None:
+            output = output.to_dict()
+        if name and self.update(name, output):
+            print(f"🌐 API serving updated {name}")
+
+
+class ResponseCache:
+    """Small LRU of serialized (and gzipped) bodies keyed by ETag."""
+
+    def __init__(self, size=BODY_CACHE_SIZE):
+        self.size = size
+        self._bodies = OrderedDict()
+
+    def get(self, key):
+        body = self._bodies.get(key)
+        if body is not None:
+            self._bodies.move_to_end(key)
+        return body
+
+    def put(self, key, body):
+        self._bodies[key] = body
+        self._bodies.move_to_end(key)
+        while len(self._bodies) > self.size:
+            self._bodies.popitem(last=False)
+
+
+class ReadAPI:
+    """aiohttp handlers over a LeagueDataStore."""
+
+    def __init__(self, store, max_age=None):
+        if web is None:
+            raise ImportError("aiohttp is required for the read API (pip install aiohttp)")
+        self.store = store
+        self.max_age = config.API_CACHE_MAX_AGE_SECONDS if max_age is None else max_age
+        self.cache = ResponseCache()
+
+    def create_app(self):
+        app = web.Application()
+        app.router.add_get("/schedule", self.schedule)
+        app.router.add_get("/games/{game_id}", self.game)
+        app.router.add_get("/players", self.players)
+        app.router.add_get("/players/{player_id}", self.player)
+        app.router.add_get("/players/{player_id}/games", self.player_games)
+        app.router.add_get("/goalies", self.goalies)
+        app.router.add_get("/standings", self.standings)
+        app.router.add_get("/leaders", self.leaders)
+        app.router.add_get("/head-to-head", self.head_to_head)
+        app.router.add_get("/status", self.status)
+        return app
+
+    # -- response helpers --
+
+    @staticmethod
+    def _error(status, message):
+        return web.json_response({"error": message}, status=status)
+
+    def _dataset(self, name):
+        dataset = self.store.get(name)
+        if dataset is None:
+            raise web.HTTPServiceUnavailable(
+                text=json.dumps({"error": f"{name} not available yet"}), content_type="application/json"
+            )
+        return dataset
+
+    def _respond(self, request, dataset, build_payload):
+        """
+        Serve a JSON payload derived from one dataset
+        The ETag combines the dataset version and the request path + query, so a
+        matching If-None-Match gets a 304 without building or serializing anything.
+        Gzipped bodies are a different representation and carry a "-gz" tag.
+        """
+        query = "&".join(f"{key}={value}" for key, value in sorted(request.query.items()))
+        variant = hashlib.sha1(f"{request.path}?{query}".encode()).hexdigest()[:8]
+        etag = f'"{dataset.etag}-{variant}"'
+        gzip_etag = f'"{dataset.etag}-{variant}-gz"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={self.max_age}",
+            "Vary": "Accept-Encoding",
+        }
+
+        if_none_match = request.headers.get("If-None-Match", "")
+        candidates = {tag.strip().replace("W/", "", 1) for tag in if_none_match.split(",")}
+        if gzip_etag in candidates or etag in candidates or "*" in candidates:
+            # Confirm the representation the client already has
+            if gzip_etag in candidates and etag not in candidates:
+                headers["ETag"] = gzip_etag
+            return web.Response(status=304, headers=headers)
+
+        accepts_gzip = accepts_encoding(request.headers.get("Accept-Encoding", ""), "gzip")
+        cached = self.cache.get((etag, accepts_gzip))
+        if cached is None:
+            body = json.dumps(build_payload(), default=str).encode()
+            compressed = accepts_gzip and len(body) >= GZIP_MIN_BYTES
+            if compressed:
+                body = gzip.compress(body, compresslevel=6)
+            cached = (body, compressed)
+            self.cache.put((etag, accepts_gzip), cached)
+
+        body, compressed = cached
+        if compressed:
+            headers["ETag"] = gzip_etag
+            headers["Content-Encoding"] = "gzip"
+        return web.Response(body=body, headers=headers, content_type="application/json")
+
+    # -- handlers --
+
+    async def schedule(self, request):
+        """
+        GET /schedule?team=&date=&from=&to=&played=&page=&per_page=
+        Game summaries without lineups, goals and penalties (see /games/{id}).
+        Dates may be MM-DD-YYYY or YYYY-MM-DD; played is y/n.
+        """
+        dataset = self._dataset("schedule")
+        query = request.query
+
+        team = query.get("team", "").strip().lower()
+        dates = {}
+        for key in ("date", "from", "to"):
+            if key in query:
+                dates[key] = parse_date(query[key])
+                if dates[key] is None:
+                    return self._error(400, f"Invalid {key}: {query[key]}")
+        played = query.get("played", "").strip().lower()
+        if played and played not in ("y", "n", "true", "false"):
+            return self._error(400, f"Invalid played: {query['played']}")
+        try:
+            page = int(query.get("page", 1))
+            per_page = int(query.get("per_page", DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return self._error(400, "page and per_page must be integers")
+        if page < 1 or not 1 <= per_page <= MAX_PAGE_SIZE:
+            return self._error(400, f"page must be >= 1 and per_page between 1 and {MAX_PAGE_SIZE}")
+
+        def build_payload():
+            matches = []
+            for summary, game_date, home, away, is_played in dataset.rows:
+                if team and team not in (home, away):
+                    continue
+                if played and is_played != (played in ("y", "true")):
+                    continue
+                if dates and game_date is None:
+                    continue
+                if "date" in dates and game_date != dates["date"]:
+                    continue
+                if "from" in dates and game_date < dates["from"]:
+                    continue
+                if "to" in dates and game_date > dates["to"]:
+                    continue
+                matches.append(summary)
+
+            start = (page - 1) * per_page
+            return {
+                "total": len(matches),
+                "page": page,
+                "per_page": per_page,
+                "games": matches[start:start + per_page],
+            }
+
+        return self._respond(request, dataset, build_payload)
+
+    async def game(self, request):
+        """GET /games/{id} - full game entry with lineups, goals and penalties"""
+        dataset = self._dataset("schedule")
+        game = dataset.by_id.get(request.match_info["game_id"])
+        if game is None:
+            return self._error(404, f"Game {request.match_info['game_id']} not found")
+        return self._respond(request, dataset, lambda: game)
+
+    @staticmethod
+    def _filter_by_team(records, team):
+        """Keep players/goalies with a season on the given team id"""
+        if not team:
+            return records
+        return [
+            record for record in records
+            if any(str(season.get("Team", "")) == team for season in record.get("seasons", []))
+        ]
+
+    async def players(self, request):
+        """GET /players?team=<team id>"""
+        dataset = self._dataset("players")
+        team = request.query.get("team", "").strip()
+        return self._respond(request, dataset, lambda: self._filter_by_team(dataset.data, team))
+
+    async def player(self, request):
+        """GET /players/{id}"""
+        dataset = self._dataset("players")
+        player = dataset.by_id.get(request.match_info["player_id"])
+        if player is None:
+            return self._error(404, f"Player {request.match_info['player_id']} not found")
+        return self._respond(request, dataset, lambda: player)
+
+    async def player_games(self, request):
+        """GET /players/{id}/games - game log with season and career totals"""
+        dataset = self._dataset("player_logs")
+        log = dataset.by_id.get(request.match_info["player_id"])
+        if log is None:
+            return self._error(404, f"No game log for player {request.match_info['player_id']}")
+        return self._respond(request, dataset, lambda: log)
+
+    async def goalies(self, request):
+        """GET /goalies?team=<team id>"""
+        dataset = self._dataset("goalie_stats")
+        team = request.query.get("team", "").strip()
+        return self._respond(request, dataset, lambda: self._filter_by_team(dataset.data, team))
+
+    async def standings(self, request):
+        """GET /standings"""
+        dataset = self._dataset("standings")
+        return self._respond(request, dataset, lambda: dataset.data)
+
+    async def leaders(self, request):
+        """GET /leaders?team= - league leaders, or one team's leaders"""
+        dataset = self._dataset("leaders")
+        team = request.query.get("team", "")
+        if not team:
+            return self._respond(request, dataset, lambda: {
+                key: value for key, value in dataset.data.items() if key != "teams"
+            })
+        scope = dataset.rows.get(team_key(team))
+        if scope is None:
+            return self._error(404, f"No leaders for team {team}")
+        return self._respond(request, dataset, lambda: {
+            "season": dataset.data["season"], "team": scope, **dataset.data["teams"][scope]
+        })
+
+    async def head_to_head(self, request):
+        """
+        GET /head-to-head?team=&opponent=
+        One pairing's record, goals and last meeting, or the whole matrix without a team.
+        """
+        dataset = self._dataset("head_to_head")
+        team, opponent = request.query.get("team", ""), request.query.get("opponent", "")
+        if not team:
+            return self._respond(request, dataset, lambda: dataset.data)
+
+        matrix = dataset.data
+        i = dataset.rows.get(team_key(team))
+        if i is None:
+            return self._error(404, f"Team {team} not found")
+        if opponent:
+            j = dataset.rows.get(team_key(opponent))
+            if j is None:
+                return self._error(404, f"Team {opponent} not found")
+            opponents = [j]
+        else:
+            opponents = [j for j in range(len(matrix["teams"])) if j != i]
+
+        def build_payload():
+            records = []
+            for j in opponents:
+                counts = {name: matrix[name][i][j] for name in COUNTERS}
+                records.append({
+                    "team": matrix["teams"][i],
+                    "opponent": matrix["teams"][j],
+                    "GP": counts["W"] + counts["L"] + counts["T"],
+                    **counts,
+                    "last": matrix["last"][i][j],
+                })
+            return records[0] if opponent else records
+
+        return self._respond(request, dataset, build_payload)
+
+    async def status(self, request):
+        """GET /status - dataset versions and update times (never cached)"""
+        datasets = {}
+        for name in list(OUTPUT_FILES) + ["player_logs"]:
+            dataset = self.store.get(name)
+            datasets[name] = None if dataset is None else {
+                "etag": dataset.etag,
+                "records": len(dataset.data) if isinstance(dataset.data, list) else None,
+                "updated_at": datetime.fromtimestamp(dataset.updated_at).isoformat(timespec="seconds"),
+            }
+        return web.json_response({"datasets": datasets}, headers={"Cache-Control": "no-store"})
+
+
+def run_server(store, host=None, port=None):
+    """Serve the read API until interrupted"""
+    host = host or config.API_HOST
+    port = port or config.API_PORT
+    app = ReadAPI(store).create_app()
+    print(f"🌐 Read API listening on http://{host}:{port}")
+    web.run_app(app, host=host, port=port, print=None)
@@ -0,0 +1,316 @@
+"""
+Season archive.
+Stores each closed season's games, events, lineups and player stats as
+columnar tables partitioned by season (archive/season=<id>/<table>.arrow).
+Arrow IPC files are memory-mapped on load and only the requested columns are
+read. pyarrow is required (requirements.txt); without it each table is written
+as a directory of .npy columns instead, with a warning, and memory-mapped the
+same way.
+"""
+import json
+import os
+import shutil
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.formatters.goalie_stats import GoalieStatsFormatter
+from src.formatters.player_logs import event_player, penalty_minutes
+
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:  # degraded .npy layout, see SeasonArchive.write_season
+    pa = None
+    ARROW_AVAILABLE = False
+
+TABLES = ("games", "events", "lineups", "stats")
+META_FILE = "meta.json"
+STAT_COLUMNS = ("GP", "G", "A", "PTS", "PIM", "GWG", "GS")
+LINEUP_STATS = ("g", "a", "pts", "pim")
+
+
+def to_int(value, default=0):
+    """Integer from a sheet value ('3', '3.0', '', None)"""
+    try:
+        return int(float(str(value).strip()))
+    except (TypeError, ValueError):
+        return default
+
+
+def codes(values):
+    """(unique values, code of each value) for a string array"""
+    if len(values) == 0:
+        return np.array([], dtype=str), np.zeros(0, dtype=np.intp)
+    return np.unique(values, return_inverse=True)
+
+
+def text(value):
+    return str(value if value is not None else "").strip()
+
+
+def games_table(schedule):
+    """One row per game; scores are -1 until the game is played"""
+    played = np.array([text(game.get("Played")).lower() == "y" for game in schedule], dtype=bool)
+    home_scores, away_scores = GoalieStatsFormatter.parse_scores([game.get("Score", "") for game in schedule])
+    return {
+        "game_id": np.array([to_int(game.get("id"), -1) for game in schedule], dtype=np.int32),
+        "date": np.array(
+            pd.to_datetime([text(game.get("Date")) for game in schedule], format="%m-%d-%Y", errors="coerce"),
+            dtype="datetime64[D]",
+        ),
+        "time": np.array([text(game.get("Time")) for game in schedule], dtype=str),
+        "home": np.array([text(game.get("Home")) for game in schedule], dtype=str),
+        "away": np.array([text(game.get("Away")) for game in schedule], dtype=str),
+        "home_score": np.where(played, home_scores, -1).astype(np.int16),
+        "away_score": np.where(played, away_scores, -1).astype(np.int16),
+        "played": played,
+        "ref1": np.array([text(game.get("Ref1")) for game in schedule], dtype=str),
+        "ref2": np.array([text(game.get("Ref2")) for game in schedule], dtype=str),
+    }
+
+
+def events_table(schedule):
+    """Goals and penalties of every game, one row per event"""
+    rows = []
+    for game in schedule:
+        game_id = to_int(game.get("id"), -1)
+        for goal in game.get("Goals") or []:
+            rows.append((game_id, "goal", to_int(goal.get("id")), text(goal.get("Time")), text(goal.get("Team")),
+                         event_player(goal.get("ScoredBy")), event_player(goal.get("Asst1")),
+                         event_player(goal.get("Asst2")), "", 0))
+        for penalty in game.get("Penalties") or []:
+            rows.append((game_id, "penalty", to_int(penalty.get("id")), text(penalty.get("Time")),
+                         text(penalty.get("Team")), event_player(penalty.get("Player")), "", "",
+                         text(penalty.get("Infraction")), penalty_minutes(penalty.get("Minutes"))))
+    columns = list(zip(*rows)) or [()] * 10
+    return {
+        "game_id": np.array(columns[0], dtype=np.int32),
+        "type": np.array(columns[1], dtype=str),
+        "event_id": np.array(columns[2], dtype=np.int16),
+        "time": np.array(columns[3], dtype=str),
+        "team": np.array(columns[4], dtype=str),
+        "player": np.array(columns[5], dtype=str),
+        "asst1": np.array(columns[6], dtype=str),
+        "asst2": np.array(columns[7], dtype=str),
+        "infraction": np.array(columns[8], dtype=str),
+        "minutes": np.array(columns[9], dtype=np.int16),
+    }
+
+
+def lineups_table(schedule):
+    """Every player who dressed for every game, with their line"""
+    rows = []
+    for game in schedule:
+        game_id = to_int(game.get("id"), -1)
+        lineups = game.get("Lineups") or {}
+        for side in ("Home", "Away"):
+            team = text(game.get(side))
+            for player in lineups.get(side) or []:
+                name = text(player.get("name"))
+                if not name:
+                    continue
+                rows.append((game_id, side, team, name, text(player.get("pos")).upper(), text(player.get("no")),
+                             *(to_int(player.get(stat)) for stat in LINEUP_STATS)))
+    columns = list(zip(*rows)) or [()] * (6 + len(LINEUP_STATS))
+    table = {
+        "game_id": np.array(columns[0], dtype=np.int32),
+        "side": np.array(columns[1], dtype=str),
+        "team": np.array(columns[2], dtype=str),
+        "name": np.array(columns[3], dtype=str),
+        "pos": np.array(columns[4], dtype=str),
+        "no": np.array(columns[5], dtype=str),
+    }
+    for offset, stat in enumerate(LINEUP_STATS, 6):
+        table[stat] = np.array(columns[offset], dtype=np.int16)
+    return table
+
+
+def stats_table(players, season):
+    """Season lines of players.json for one season"""
+    rows = []
+    for player in players or []:
+        for line in player.get("seasons") or []:
+            if text(line.get("id")) != str(season):
+                continue
+            rows.append((to_int(player.get("id"), -1), text(player.get("firstName")), text(player.get("lastName")),
+                         text(line.get("Team")), text(line.get("Position")).upper(), text(line.get("JerseyNumber")),
+                         *(to_int(line.get(stat)) for stat in STAT_COLUMNS)))
+    columns = list(zip(*rows)) or [()] * (6 + len(STAT_COLUMNS))
+    table = {
+        "player_id": np.array(columns[0], dtype=np.int32),
+        "first_name": np.array(columns[1], dtype=str),
+        "last_name": np.array(columns[2], dtype=str),
+        "team": np.array(columns[3], dtype=str),
+        "position": np.array(columns[4], dtype=str),
+        "jersey": np.array(columns[5], dtype=str),
+    }
+    for offset, stat in enumerate(STAT_COLUMNS, 6):
+        table[stat] = np.array(columns[offset], dtype=np.int16)
+    return table
+
+
+class SeasonArchive:
+    """
+    Columnar archive of closed seasons under one root directory
+    Tables: games, events, lineups (from schedule.json) and stats (players.json).
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def partition(self, season):
+        return os.path.join(self.root, f"season={season}")
+
+    def seasons(self):
+        """Archived season ids, oldest first"""
+        if not os.path.isdir(self.root):
+            return []
+        seasons = [
+            name.split("=", 1)[1] for name in os.listdir(self.root)
+            if name.startswith("season=") and os.path.exists(os.path.join(self.root, name, META_FILE))
+        ]
+        return sorted(seasons, key=lambda season: (not season.isdigit(), int(season) if season.isdigit() else 0, season))
+
+    def meta(self, season):
+        with open(os.path.join(self.partition(season), META_FILE), 'r') as f:
+            return json.load(f)
+
+    def write_season(self, season, schedule, players=None):
+        """
+        Archive one season, replacing any earlier archive of it
+        Returns the partition's metadata (format and rows per table)
+        """
+        tables = {
+            "games": games_table(schedule),
+            "events": events_table(schedule),
+            "lineups": lineups_table(schedule),
+            "stats": stats_table(players, season),
+        }
+        directory = self.partition(season)
+        # Written next to the old partition and swapped in, so readers never see half a season
+        staging = f"{directory}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        storage = "arrow" if ARROW_AVAILABLE else "npy"
+        if not ARROW_AVAILABLE:
+            print("⚠️  pyarrow not installed; archiving as .npy columns "
+                  "(pip install -r requirements.txt for Arrow tables)")
+        for name, columns in tables.items():
+            if storage == "arrow":
+                self._write_arrow(os.path.join(staging, f"{name}.arrow"), columns)
+            else:
+                self._write_npy(os.path.join(staging, name), columns)
+
+        meta = {
+            "season": str(season),
+            "format": storage,
+            "archivedAt": datetime.now().isoformat(timespec="seconds"),
+            "rows": {name: len(next(iter(columns.values()))) for name, columns in tables.items()},
+        }
+        with open(os.path.join(staging, META_FILE), 'w') as f:
+            json.dump(meta, f, indent=4)
+
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(staging, directory)
+        return meta
+
+    @staticmethod
+    def _write_arrow(path, columns):
+        table = pa.table({
+            # Arrow has no fixed-width unicode type; strings become variable-length utf8
+            name: values.tolist() if values.dtype.kind == "U" else values for name, values in columns.items()
+        })
+        # Uncompressed IPC so columns can be used straight from the memory map
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    @staticmethod
+    def _write_npy(directory, columns):
+        os.makedirs(directory)
+        for name, values in columns.items():
+            np.save(os.path.join(directory, f"{name}.npy"), values, allow_pickle=False)
+        with open(os.path.join(directory, "columns.json"), 'w') as f:
+            json.dump(list(columns), f)
+
+    def columns(self, table, season, columns=None):
+        """
+        Column arrays of one table of one season, memory-mapped
+        Only the requested columns are opened; numeric columns are views of the
+        file, so reading them costs page faults rather than parsing.
+        """
+        if table not in TABLES:
+            raise ValueError(f"Unknown archive table '{table}' (expected one of {', '.join(TABLES)})")
+        directory = self.partition(season)
+        arrow_path = os.path.join(directory, f"{table}.arrow")
+        if os.path.exists(arrow_path):
+            if not ARROW_AVAILABLE:
+                raise ImportError(f"{arrow_path} is an Arrow file; install pyarrow to read it")
+            arrow_table = pa.ipc.open_file(pa.memory_map(arrow_path, 'r')).read_all()
+            if columns is not None:
+                arrow_table = arrow_table.select(list(columns))
+            return {
+                name: arrow_table.column(name).to_numpy() for name in arrow_table.column_names
+            }
+
+        table_dir = os.path.join(directory, table)
+        if not os.path.isdir(table_dir):
+            raise FileNotFoundError(f"Season {season} has no archived {table} table in {self.root}")
+        with open(os.path.join(table_dir, "columns.json"), 'r') as f:
+            names = json.load(f)
+        if columns is not None:
+            unknown = [name for name in columns if name not in names]
+            if unknown:
+                raise KeyError(f"Unknown {table} columns: {', '.join(unknown)}")
+            names = list(columns)
+        return {
+            name: np.load(os.path.join(table_dir, f"{name}.npy"), mmap_mode='r', allow_pickle=False)
+            for name in names
+        }
+
+    def coded_columns(self, table, season, columns=None):
+        """
+        Like columns, but each string column comes back as (dictionary, codes): its
+        distinct values and an integer code per row. Arrow string columns are
+        dictionary-encoded, so no Python str is built per row.
+        """
+        directory = self.partition(season)
+        arrow_path = os.path.join(directory, f"{table}.arrow")
+        if not (ARROW_AVAILABLE and os.path.exists(arrow_path)):
+            return {
+                name: codes(values) if values.dtype.kind == "U" else values
+                for name, values in self.columns(table, season, columns).items()
+            }
+
+        arrow_table = pa.ipc.open_file(pa.memory_map(arrow_path, 'r')).read_all()
+        if columns is not None:
+            arrow_table = arrow_table.select(list(columns))
+        result = {}
+        for name in arrow_table.column_names:
+            column = arrow_table.column(name)
+            if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+                encoded = column.combine_chunks().dictionary_encode()
+                result[name] = (
+                    encoded.dictionary.to_numpy(zero_copy_only=False).astype(str),
+                    encoded.indices.to_numpy(zero_copy_only=False).astype(np.intp),
+                )
+            else:
+                result[name] = column.to_numpy()
+        return result
+
+    def load(self, table, seasons=None, columns=None):
+        """
+        One table over several seasons (all archived seasons if None) as a DataFrame
+        A season column is added; columns limits what is read from disk.
+        """
+        frames = []
+        for season in (self.seasons() if seasons is None else [str(season) for season in seasons]):
+            arrays = self.columns(table, season, columns)
+            frame = pd.DataFrame(arrays)
+            frame.insert(0, "season", season)
+            frames.append(frame)
+        if not frames:
+            return pd.DataFrame(columns=["season"] + list(columns or []))
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,186 @@
+"""
+Asyncio Google Sheets client for fetching many spreadsheets at once.
+Uses the same service account credentials as SheetsClient and one pooled
+HTTP session, so a slate of game sheets costs about one round-trip.
+"""
+import asyncio
+
+import pandas as pd
+from google.auth.transport.requests import Request
+from google.oauth2 import service_account
+from config import settings as config
+from src.data.rate_limit import (
+    RETRYABLE_STATUS_CODES, SheetsUnavailableError, get_default_guard, parse_retry_after
+)
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, only needed for concurrent fetches
+    aiohttp = None
+
+SHEETS_API_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+
+
+class SheetsRequestError(RuntimeError):
+    """Raised when a spreadsheet request fails with a non-retryable status (400/403/404...)."""
+
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.status = status
+
+
+class AsyncSheetsClient:
+    """Concurrent values:batchGet client with bounded concurrency and connection pooling."""
+
+    def __init__(self, max_concurrency=None, guard=None, credentials=None):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncSheetsClient (pip install aiohttp)")
+
+        self.max_concurrency = max_concurrency or config.SHEETS_MAX_CONCURRENCY
+        # Shared with SheetsClient so sync and async callers draw from one quota
+        self.guard = guard or get_default_guard()
+        self.credentials = credentials or service_account.Credentials.from_service_account_file(
+            config.SERVICE_ACCOUNT_FILE, scopes=SCOPES
+        )
+        self.session = None
+        # Spreadsheets the last fetch_many() could not fetch (id -> exception)
+        self.failures = {}
+        self._semaphore = None
+        self._token_lock = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=60)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=config.SHEETS_REQUEST_TIMEOUT_SECONDS)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._token_lock = asyncio.Lock()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
+
+    async def _get_token(self):
+        """Return a valid access token, refreshing it once for all concurrent callers."""
+        async with self._token_lock:
+            if not self.credentials.valid:
+                await asyncio.to_thread(self.credentials.refresh, Request())
+            return self.credentials.token
+
+    async def batch_get(self, spreadsheet_id, ranges):
+        """
+        Fetch several ranges from one spreadsheet in a single request
+        Args:
+            spreadsheet_id: The spreadsheet to read
+            ranges: dict of name -> A1 range, or a list of A1 ranges
+        Returns dict of name (or range) -> pandas DataFrame
+        Raises SheetsUnavailableError if the API keeps returning 429/5xx, and
+        SheetsRequestError if the spreadsheet can't be read (e.g. 403/404)
+        """
+        named = ranges if isinstance(ranges, dict) else {r: r for r in ranges}
+        names = list(named)
+        params = [("ranges", named[name]) for name in names]
+        url = f"{SHEETS_API_URL}/{spreadsheet_id}/values:batchGet"
+
+        payload = await self._request(url, params, f"Fetching {len(names)} ranges from {spreadsheet_id}")
+        value_ranges = payload.get("valueRanges", [])
+        results = {}
+        for name, value_range in zip(names, value_ranges):
+            values = value_range.get("values", [])
+            results[name] = pd.DataFrame(values) if values else pd.DataFrame()
+        return results
+
+    async def _request(self, url, params, description):
+        """
+        GET with the shared rate limiter, retry policy and circuit breaker
+        429/5xx responses, connection errors and timeouts are retried and counted
+        by the breaker; other error statuses raise SheetsRequestError at once.
+        """
+        policy = self.guard.policy
+        last_error = None
+
+        for attempt in range(policy.max_retries + 1):
+            self.guard.breaker.before_call()
+            delay = self.guard.limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            token = await self._get_token()
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    async with self.session.get(
+                        url, params=params, headers={"Authorization": f"Bearer {token}"}
+                    ) as response:
+                        status = response.status
+                        if status == 200:
+                            payload = await response.json()
+                            self.guard.breaker.record_success()
+                            return payload
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        body = await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            else:
+                if status not in RETRYABLE_STATUS_CODES:
+                    raise SheetsRequestError(f"{description} returned HTTP {status}: {body[:200]}", status)
+                last_error = f"HTTP {status}"
+
+            self.guard.breaker.record_failure()
+            if attempt == policy.max_retries:
+                break
+            wait = policy.backoff(attempt, retry_after)
+            print(f"⚠️  {description} failed with {last_error}; "
+                  f"retrying in {wait:.1f}s ({attempt + 1}/{policy.max_retries})")
+            await asyncio.sleep(wait)
+
+        raise SheetsUnavailableError(
+            f"{description} failed after {policy.max_retries} retries ({last_error})"
+        )
+
+    async def fetch_many(self, spreadsheet_ids, ranges):
+        """
+        Fetch the same ranges from many spreadsheets concurrently
+        Args:
+            spreadsheet_ids: Iterable of spreadsheet IDs
+            ranges: dict of name -> A1 range (e.g. config.GAME_RANGES) or list of A1 ranges
+        Returns dict of spreadsheet_id -> {name: DataFrame} for the spreadsheets that could
+        be fetched; the others are reported and kept in self.failures (id -> exception).
+        Raises SheetsUnavailableError if the API was unavailable for every spreadsheet.
+        """
+        spreadsheet_ids = list(dict.fromkeys(spreadsheet_ids))
+        # One failing spreadsheet must not cancel the others
+        results = await asyncio.gather(
+            *(self.batch_get(spreadsheet_id, ranges) for spreadsheet_id in spreadsheet_ids),
+            return_exceptions=True
+        )
+
+        frames, self.failures = {}, {}
+        for spreadsheet_id, result in zip(spreadsheet_ids, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                print(f"❌ Could not fetch {spreadsheet_id}: {result}")
+                self.failures[spreadsheet_id] = result
+            else:
+                frames[spreadsheet_id] = result
+        if spreadsheet_ids and not frames and all(
+            isinstance(error, SheetsUnavailableError) for error in self.failures.values()
+        ):
+            raise next(iter(self.failures.values()))
+        return frames
+
+
+def fetch_many(spreadsheet_ids, ranges=None, max_concurrency=None):
+    """
+    Synchronous helper around AsyncSheetsClient.fetch_many
+    Defaults to the per-game scoresheet ranges in config.GAME_RANGES.
+    """
+    async def _run():
+        async with AsyncSheetsClient(max_concurrency=max_concurrency) as client:
+            return await client.fetch_many(spreadsheet_ids, ranges or config.GAME_RANGES)
+
+    return asyncio.run(_run())
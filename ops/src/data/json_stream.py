@@ -0,0 +1,188 @@
+"""
+Streaming JSON reader.
+Iterates the items of a JSON array file (schedule.json, players.json) or an
+NDJSON file (schedule.ndjson) one at a time, so memory stays at one item
+however large the file grows. JSON arrays use ijson when installed and an
+incremental json.JSONDecoder otherwise.
+"""
+import itertools
+import json
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:  # optional dependency; the stdlib decoder below is used instead
+    ijson = None
+    IJSON_AVAILABLE = False
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
+# Characters that can continue a JSON number
+NUMBER_CHARACTERS = "0123456789+-.eE"
+
+
+class JSONStreamError(ValueError):
+    """Raised when a streamed file is not valid JSON or not an array."""
+
+
+def iter_json_array(filepath, key=None, fields=None):
+    """
+    Yield the items of the top-level JSON array in filepath, or of the array
+    under key in a top-level object ({"games": [...]})
+    fields keeps only those keys of each item. Stopping early (break, islice)
+    closes the file without reading the rest.
+    """
+    fields = tuple(fields) if fields is not None else None
+    with open(filepath, 'r') as f:
+        items = _ijson_items(f, key) if IJSON_AVAILABLE else _decoder_items(f, key)
+        for item in items:
+            if fields is not None and isinstance(item, dict):
+                item = {field: item[field] for field in fields if field in item}
+            yield item
+
+
+def iter_ndjson(filepath, fields=None):
+    """
+    Yield the objects of an NDJSON file, one per line
+    A last line without its newline is still being written and is skipped.
+    """
+    fields = tuple(fields) if fields is not None else None
+    with open(filepath, 'r') as f:
+        for number, line in enumerate(f, 1):
+            if not line.endswith("\n"):
+                return
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise JSONStreamError(f"Invalid JSON on line {number} of {filepath}: {e}") from e
+            if fields is not None and isinstance(item, dict):
+                item = {field: item[field] for field in fields if field in item}
+            yield item
+
+
+def count_json_array(filepath, key=None):
+    """Number of items in the array, streamed without keeping any of them"""
+    return sum(1 for _ in iter_json_array(filepath, key, fields=()))
+
+
+def _ijson_items(f, key):
+    try:
+        # use_float keeps numbers as int/float like json.load (not Decimal)
+        events = ijson.parse(f, use_float=True)
+        prefix = ""
+        if key is not None:
+            # Skip top-level members until the requested key, as _decoder_items does
+            _ijson_expect(f, events, "", "start_map", "{")
+            while True:
+                event_prefix, event, value = next(events, ("", "end_map", None))
+                if event_prefix == "" and event == "end_map":
+                    raise JSONStreamError(f"Key '{key}' not found in {f.name}")
+                if event_prefix == "" and event == "map_key" and value == key:
+                    break
+            prefix = key
+        first = _ijson_expect(f, events, prefix, "start_array", "[")
+        # Hand the array (its start event included) back to ijson to build the items
+        yield from ijson.items(itertools.chain([first], events), f"{prefix}.item" if prefix else "item")
+    except ijson.JSONError as e:
+        raise JSONStreamError(f"Invalid JSON in {f.name}: {e}") from e
+
+
+def _ijson_expect(f, events, prefix, expected, character):
+    """Next parse event, raising like _Reader.expect unless it starts the expected container"""
+    event = next(events, None)
+    if event is None or event[:2] != (prefix, expected):
+        found = {"start_map": "{", "start_array": "["}.get(event[1], str(event[2])) if event else ""
+        raise JSONStreamError(f"Invalid JSON in {f.name}: expected one of {character!r}, found {found!r}")
+    return event
+
+
+class _Reader:
+    """Text buffer over a file that refills on demand"""
+
+    def __init__(self, f):
+        self.f = f
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def fill(self):
+        """Read another chunk; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what has been consumed so the buffer stays about one item long
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character without consuming it ('' at end of file)"""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.fill():
+                return ""
+
+    def expect(self, characters):
+        character = self.peek()
+        if character not in characters or not character:
+            raise JSONStreamError(f"Invalid JSON in {self.f.name}: expected one of {characters!r}, found {character!r}")
+        self.position += 1
+        return character
+
+    def value(self, decoder):
+        """Decode the next complete JSON value, reading more of the file as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as e:
+                if self.fill():
+                    continue
+                raise JSONStreamError(f"Invalid JSON in {self.f.name}: {e}") from e
+            # A number is only complete once a character that can't continue it follows:
+            # raw_decode accepts 2 from a chunk ending in "2." or "2e"
+            if self._number_may_continue(value, end) and self.fill():
+                continue
+            self.position = end
+            return value
+
+    def _number_may_continue(self, value, end):
+        """True if value is a number and only number characters follow it to the end of the buffer"""
+        if self.eof or isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        return not self.buffer[end:].lstrip(NUMBER_CHARACTERS)
+
+
+def _decoder_items(f, key):
+    reader = _Reader(f)
+    decoder = json.JSONDecoder()
+
+    if key is not None:
+        # Skip object members until the requested key
+        reader.expect("{")
+        while True:
+            if reader.peek() == "}":
+                raise JSONStreamError(f"Key '{key}' not found in {f.name}")
+            name = reader.value(decoder)
+            reader.expect(":")
+            if name == key:
+                break
+            reader.value(decoder)
+            if reader.expect(",}") == "}":
+                raise JSONStreamError(f"Key '{key}' not found in {f.name}")
+
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value(decoder)
+        if reader.expect(",]") == "]":
+            return
@@ -0,0 +1,117 @@
+"""
+Dynamic A1 range discovery for Google Sheets.
+Reads each sheet's gridProperties and last populated row once, caches them,
+and builds ranges that cover exactly the populated extent.
+"""
+import time
+
+
+def column_to_index(column):
+    """Convert a column letter ('A', 'Z', 'AA') to a 1-based index."""
+    index = 0
+    for char in column.upper():
+        index = index * 26 + (ord(char) - ord('A') + 1)
+    return index
+
+
+def index_to_column(index):
+    """Convert a 1-based column index to its letter ('A', 'Z', 'AA')."""
+    column = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        column = chr(ord('A') + remainder) + column
+    return column
+
+
+class RangeDiscovery:
+    """Resolves named sheet extents (config.SHEET_EXTENTS) to exact A1 ranges."""
+
+    def __init__(self, service, guard, extents, ttl_seconds=300):
+        self.service = service
+        self.guard = guard
+        self.extents = extents
+        self.ttl_seconds = ttl_seconds
+        self._cache = {}
+
+    def invalidate(self, spreadsheet_id=None):
+        """Drop cached extents for one spreadsheet, or for all of them."""
+        if spreadsheet_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(spreadsheet_id, None)
+
+    def _load(self, spreadsheet_id):
+        """
+        Fetch sheet grid sizes and the last populated row of every key column.
+        Costs two API calls per spreadsheet regardless of how many extents are defined.
+        """
+        metadata = self.guard.call(
+            self.service.spreadsheets().get(
+                spreadsheetId=spreadsheet_id,
+                fields="sheets.properties(title,gridProperties(rowCount,columnCount))"
+            ).execute,
+            f"Reading sheet properties of {spreadsheet_id}"
+        )
+        grid = {
+            sheet["properties"]["title"]: sheet["properties"].get("gridProperties", {})
+            for sheet in metadata.get("sheets", [])
+        }
+
+        # One key column per (sheet, first column) pair, read column-major in a single batchGet
+        key_columns = []
+        for spec in self.extents.values():
+            key = (spec["sheet"], spec["columns"][0])
+            if spec["sheet"] in grid and key not in key_columns:
+                key_columns.append(key)
+
+        last_rows = {}
+        if key_columns:
+            ranges = [
+                f"{sheet}!{column}1:{column}{grid[sheet].get('rowCount', 1)}"
+                for sheet, column in key_columns
+            ]
+            result = self.guard.call(
+                self.service.spreadsheets().values().batchGet(
+                    spreadsheetId=spreadsheet_id, ranges=ranges, majorDimension="COLUMNS"
+                ).execute,
+                f"Discovering populated rows in {spreadsheet_id}"
+            )
+            for key, value_range in zip(key_columns, result.get("valueRanges", [])):
+                values = value_range.get("values", [])
+                last_rows[key] = len(values[0]) if values else 0
+
+        entry = {"loaded_at": time.monotonic(), "grid": grid, "last_rows": last_rows}
+        self._cache[spreadsheet_id] = entry
+        return entry
+
+    def _get(self, spreadsheet_id):
+        entry = self._cache.get(spreadsheet_id)
+        if entry is None or time.monotonic() - entry["loaded_at"] > self.ttl_seconds:
+            entry = self._load(spreadsheet_id)
+        return entry
+
+    def resolve(self, spreadsheet_id, name):
+        """
+        Build the A1 range for a named extent
+        Returns e.g. 'gameEvents!A1:K412', or None if the sheet has no data rows.
+        Raises KeyError if the extent or its sheet does not exist.
+        """
+        spec = self.extents[name]
+        sheet = spec["sheet"]
+        first_column, last_column = spec["columns"]
+        first_row = spec.get("first_row", 1)
+
+        entry = self._get(spreadsheet_id)
+        if sheet not in entry["grid"]:
+            raise KeyError(f"Sheet '{sheet}' not found in spreadsheet {spreadsheet_id}")
+
+        last_row = entry["last_rows"].get((sheet, first_column), 0)
+        if last_row < first_row:
+            return None
+
+        # Never ask for columns beyond the sheet's grid
+        column_count = entry["grid"][sheet].get("columnCount")
+        if column_count and column_to_index(last_column) > column_count:
+            last_column = index_to_column(column_count)
+
+        return f"{sheet}!{first_column}{first_row}:{last_column}{last_row}"
@@ -0,0 +1,223 @@
+"""
+Quota-aware request throttling for the Google Sheets API.
+Provides a shared rate limiter, retry with exponential backoff and a circuit breaker.
+"""
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httplib2
+from google.auth.exceptions import TransportError
+from googleapiclient.errors import HttpError
+
+# HTTP status codes that are worth retrying (quota exhaustion and server-side errors)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Failures before any HTTP status arrives (socket timeouts, resets, DNS), retried like 5xx
+TRANSPORT_ERRORS = (OSError, httplib2.HttpLib2Error, TransportError)
+
+
+class SheetsUnavailableError(RuntimeError):
+    """Raised when the Sheets API keeps failing after all retries."""
+
+
+class CircuitOpenError(SheetsUnavailableError):
+    """Raised when the circuit breaker is open and calls are short-circuited."""
+
+
+class RateLimiter:
+    """Thread-safe token bucket sized to the per-minute Sheets quota."""
+
+    def __init__(self, requests_per_minute=60, burst=None):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst or requests_per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Reserve one request slot.
+        Returns the number of seconds the caller must wait before sending.
+        Callers only hold the lock while booking a slot, so concurrent
+        fetches are spaced out rather than serialized.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """Block until a request slot is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class CircuitBreaker:
+    """Stops calling the API after repeated failures and retries after a cool-down."""
+
+    def __init__(self, failure_threshold=5, reset_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Current state: 'closed', 'open' or 'half_open'."""
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self):
+        """Raise CircuitOpenError if calls are currently blocked."""
+        with self._lock:
+            if self._state() == "open":
+                remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+                raise CircuitOpenError(
+                    f"Sheets API circuit open after {self.failures} failures; retry in {remaining:.0f}s"
+                )
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold or self._state() == "half_open":
+                self.opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for retryable Sheets errors."""
+
+    def __init__(self, max_retries=5, base_delay=1.0, max_delay=32.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt, retry_after=None):
+        """Seconds to wait before the given retry attempt (0-based)."""
+        if retry_after is not None:
+            return min(float(retry_after), self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+def is_retryable(error):
+    """Check whether an HttpError is a transient quota or server error."""
+    return isinstance(error, HttpError) and error.resp.status in RETRYABLE_STATUS_CODES
+
+
+def parse_retry_after(value):
+    """
+    Seconds to wait from a Retry-After header value, either delay-seconds ('30')
+    or an HTTP date ('Wed, 21 Oct 2026 07:28:00 GMT'); None if missing or invalid
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_after_seconds(error):
+    """Read the Retry-After header from an HttpError, if present."""
+    try:
+        return parse_retry_after(error.resp.get("retry-after"))
+    except AttributeError:
+        return None
+
+
+class RequestGuard:
+    """
+    Bundles the rate limiter, retry policy and circuit breaker.
+    One guard is shared by every client in the process so all callers
+    draw from the same quota.
+    """
+
+    def __init__(self, limiter=None, breaker=None, policy=None):
+        self.limiter = limiter or RateLimiter()
+        self.breaker = breaker or CircuitBreaker()
+        self.policy = policy or RetryPolicy()
+
+    def call(self, request_fn, description="Sheets request"):
+        """
+        Run request_fn() under the quota, retrying transient failures
+        (429/5xx responses and transport errors such as timeouts and resets).
+        Non-retryable HttpErrors are raised immediately.
+        Raises SheetsUnavailableError once retries are exhausted.
+        """
+        last_error = None
+        for attempt in range(self.policy.max_retries + 1):
+            self.breaker.before_call()
+            self.limiter.acquire()
+            try:
+                result = request_fn()
+            except (HttpError, *TRANSPORT_ERRORS) as err:
+                if isinstance(err, HttpError):
+                    if not is_retryable(err):
+                        raise
+                    failure, retry_after = f"HTTP {err.resp.status}", retry_after_seconds(err)
+                else:
+                    failure, retry_after = type(err).__name__, None
+                last_error = err
+                self.breaker.record_failure()
+                if attempt == self.policy.max_retries:
+                    break
+                delay = self.policy.backoff(attempt, retry_after)
+                print(f"⚠️  {description} failed with {failure}; "
+                      f"retrying in {delay:.1f}s ({attempt + 1}/{self.policy.max_retries})")
+                time.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+        raise SheetsUnavailableError(
+            f"{description} failed after {self.policy.max_retries} retries: "
+            f"{str(last_error) or type(last_error).__name__}"
+        )
+
+
+_default_guard = None
+_default_guard_lock = threading.Lock()
+
+
+def get_default_guard():
+    """Return the process-wide RequestGuard configured from settings."""
+    global _default_guard
+    with _default_guard_lock:
+        if _default_guard is None:
+            from config import settings as config
+            _default_guard = RequestGuard(
+                limiter=RateLimiter(config.SHEETS_READ_REQUESTS_PER_MINUTE),
+                breaker=CircuitBreaker(config.SHEETS_CIRCUIT_FAILURE_THRESHOLD,
+                                       config.SHEETS_CIRCUIT_RESET_SECONDS),
+                policy=RetryPolicy(config.SHEETS_MAX_RETRIES,
+                                   config.SHEETS_BACKOFF_BASE_SECONDS,
+                                   config.SHEETS_BACKOFF_MAX_SECONDS),
+            )
+        return _default_guard
@@ -0,0 +1,216 @@
+"""
+Column views of archived schedules.
+Reads the games, lineups and events tables of one or more archived seasons
+(src/data/archive.py) as memory-mapped arrays and computes goalie stats and
+standings from them with numpy, without building a dict per game.
+"""
+import numpy as np
+
+from src.data.archive import codes
+from src.formatters.base import team_key
+from src.utils import leagues
+
+GAME_COLUMNS = ("game_id", "date", "home", "away", "home_score", "away_score", "played")
+LINEUP_COLUMNS = ("game_id", "side", "name", "pos")
+EVENT_COLUMNS = ("type", "team", "minutes")
+
+
+def merge_codes(coded):
+    """
+    (unique values, codes) over several (dictionary, codes) pairs, codes concatenated
+    Only values some code points at are kept, so the result is the same as coding
+    the strings themselves.
+    """
+    if not coded:
+        return codes([])
+    offsets = np.cumsum([0] + [len(dictionary) for dictionary, _ in coded[:-1]])
+    used, inverse = np.unique(
+        np.concatenate([offset + value_codes for offset, (_, value_codes) in zip(offsets, coded)]),
+        return_inverse=True,
+    )
+    values, remap = codes(np.concatenate([dictionary for dictionary, _ in coded])[used])
+    return values, remap[inverse]
+
+
+class ScheduleColumns:
+    """
+    Games of the given archived seasons (all if None) as parallel arrays
+    Games: played, home_score, away_score, home / away (codes into teams), season
+    (index into seasons). Goalies: goalie_game (row into the game arrays),
+    goalie_home, goalie (codes into goalie_names). With one season the numeric
+    game columns are the memory-mapped arrays themselves; names are read as
+    dictionary codes, never as one Python str per row.
+    """
+
+    def __init__(self, archive, seasons=None):
+        self.seasons = archive.seasons() if seasons is None else [str(season) for season in seasons]
+        games = [archive.coded_columns("games", season, GAME_COLUMNS) for season in self.seasons]
+        lineups = [archive.coded_columns("lineups", season, LINEUP_COLUMNS) for season in self.seasons]
+
+        def column(tables, name):
+            arrays = [table[name] for table in tables]
+            if len(arrays) == 1:
+                return arrays[0]
+            return np.concatenate(arrays) if arrays else np.zeros(0)
+
+        self.played = column(games, "played").astype(bool, copy=False)
+        self.home_score = column(games, "home_score")
+        self.away_score = column(games, "away_score")
+        self.date = column(games, "date")
+        self.game_id = column(games, "game_id")
+        self.season = np.repeat(np.arange(len(games)), [len(table["game_id"]) for table in games])
+        self.teams, team_codes = merge_codes([table["home"] for table in games] + [table["away"] for table in games])
+        self.home, self.away = np.split(team_codes, 2) if len(team_codes) else (team_codes, team_codes)
+
+        # Goalie lines, each pointing at its game's row
+        goalie_games, goalie_home, goalie_names = [], [], []
+        offset = 0
+        for table, lineup in zip(games, lineups):
+            game_ids = np.asarray(table["game_id"])
+            roles, role_codes = lineup["pos"]
+            sides, side_codes = lineup["side"]
+            names, name_codes = lineup["name"]
+            is_goalie = (roles == "G")[role_codes]
+            lineup_games = np.asarray(lineup["game_id"])[is_goalie]
+            if len(game_ids):
+                order = np.argsort(game_ids, kind="stable")
+                positions = np.minimum(np.searchsorted(game_ids, lineup_games, sorter=order), len(order) - 1)
+                rows = order[positions]
+                matched = game_ids[rows] == lineup_games
+                goalie_games.append(rows[matched] + offset)
+                goalie_home.append((sides == "Home")[side_codes][is_goalie][matched])
+                goalie_names.append((names, name_codes[is_goalie][matched]))
+            offset += len(game_ids)
+        self.goalie_game = np.concatenate(goalie_games) if goalie_games else np.zeros(0, dtype=np.intp)
+        self.goalie_home = np.concatenate(goalie_home) if goalie_home else np.zeros(0, dtype=bool)
+        self.goalie_names, self.goalie = merge_codes(goalie_names)
+
+        self._archive = archive
+
+    def goalie_stats(self):
+        """
+        Goalie totals keyed by name, like GoalieStatsFormatter.calculate_goalie_stats_from_schedule
+        (without the per-game list); a goalie's team is the one they played most for,
+        the earliest on ties.
+        """
+        played = self.played[self.goalie_game]
+        rows = self.goalie_game[played]
+        home_side = self.goalie_home[played]
+        goalie = self.goalie[played]
+        goalie_count, team_count = len(self.goalie_names), len(self.teams)
+        if not len(rows):
+            return {}
+
+        goals_for = np.where(home_side, self.home_score[rows], self.away_score[rows]).astype(np.int64)
+        goals_against = np.where(home_side, self.away_score[rows], self.home_score[rows]).astype(np.int64)
+        team = np.where(home_side, self.home[rows], self.away[rows])
+
+        def total(weights=None):
+            return np.bincount(goalie, weights=weights, minlength=goalie_count).astype(np.int64)
+
+        gp = total()
+        wins = total(goals_for > goals_against)
+        losses = total(goals_for < goals_against)
+        shutouts = total(goals_against == 0)
+        against = total(goals_against)
+
+        # Primary team: most games, then first appearance
+        pair = goalie * team_count + team
+        pair_games = np.bincount(pair, minlength=goalie_count * team_count).reshape(goalie_count, team_count)
+        first_seen = np.full(goalie_count * team_count, len(pair))
+        np.minimum.at(first_seen, pair, np.arange(len(pair)))
+        first_seen = first_seen.reshape(goalie_count, team_count)
+        primary = np.argmax(pair_games * (len(pair) + 1) + (len(pair) - first_seen), axis=1)
+
+        stats = {}
+        for index, name in enumerate(self.goalie_names.tolist()):
+            if not gp[index]:
+                continue
+            stats[name] = {
+                'name': name,
+                'team': str(self.teams[primary[index]]),
+                'gp': int(gp[index]),
+                'w': int(wins[index]),
+                'l': int(losses[index]),
+                't': int(gp[index] - wins[index] - losses[index]),
+                'so': int(shutouts[index]),
+                'ga': int(against[index]),
+                'gaa': round(int(against[index]) / int(gp[index]), 2),
+            }
+        return stats
+
+    def standings(self, league=None):
+        """
+        Standings rows in StandingsFormatter.STANDINGS_COLUMNS order for every team,
+        ordered by points then goal difference; points are 2 per win and 1 per tie
+        Team ids come from the league (default: the registry's default league); teams
+        missing from it get an empty id.
+        """
+        league = league or leagues.get_league()
+        played = np.flatnonzero(self.played)
+        team_count = len(self.teams)
+        home, away = self.home[played], self.away[played]
+        home_score = self.home_score[played].astype(np.int64)
+        away_score = self.away_score[played].astype(np.int64)
+
+        def count(teams, weights=None):
+            return np.bincount(teams, weights=weights, minlength=team_count).astype(np.int64)
+
+        home_wins, home_losses = count(home, home_score > away_score), count(home, home_score < away_score)
+        away_wins, away_losses = count(away, away_score > home_score), count(away, away_score < home_score)
+        home_ties = count(home) - home_wins - home_losses
+        away_ties = count(away) - away_wins - away_losses
+        goals_for = count(home, home_score) + count(away, away_score)
+        goals_against = count(home, away_score) + count(away, home_score)
+
+        # Penalty minutes from the events tables (event rows may spell teams without spaces)
+        keys = {team_key(team): index for index, team in enumerate(self.teams.tolist())}
+        pim = np.zeros(team_count, dtype=np.int64)
+        for season in self.seasons:
+            events = self._archive.coded_columns("events", season, EVENT_COLUMNS)
+            types, type_codes = events["type"]
+            penalties = (types == "penalty")[type_codes]
+            event_teams, team_codes = merge_codes([(events["team"][0], events["team"][1][penalties])])
+            minutes = np.bincount(team_codes, weights=np.asarray(events["minutes"])[penalties],
+                                  minlength=len(event_teams))
+            for event_team, total in zip(event_teams.tolist(), minutes.tolist()):
+                if team_key(event_team) in keys:
+                    pim[keys[team_key(event_team)]] += int(total)
+
+        # Streaks follow game order (season, date, id)
+        order = played[np.lexsort((self.game_id[played], self.date[played], self.season[played]))]
+        rows = []
+        for index, team in enumerate(self.teams.tolist()):
+            wins = int(home_wins[index] + away_wins[index])
+            losses = int(home_losses[index] + away_losses[index])
+            ties = int(home_ties[index] + away_ties[index])
+            rows.append({
+                "id": league.team_id(team, ""),
+                "Team": team,
+                "W": wins,
+                "L": losses,
+                "T": ties,
+                "P": 2 * wins + ties,
+                "GF": int(goals_for[index]),
+                "GA": int(goals_against[index]),
+                "PIM": int(pim[index]),
+                "Home": f"{home_wins[index]}-{home_losses[index]}-{home_ties[index]}",
+                "Away": f"{away_wins[index]}-{away_losses[index]}-{away_ties[index]}",
+                "Streak": self._streak(order, index),
+            })
+        rows.sort(key=lambda row: (-row["P"], -(row["GF"] - row["GA"]), row["Team"]))
+        return rows
+
+    def _streak(self, order, team):
+        """Current streak like 'W-2' from the team's games in order"""
+        is_home = self.home[order] == team
+        mine = order[is_home | (self.away[order] == team)]
+        if not len(mine):
+            return ""
+        mine_home = self.home[mine] == team
+        goals_for = np.where(mine_home, self.home_score[mine], self.away_score[mine])
+        goals_against = np.where(mine_home, self.away_score[mine], self.home_score[mine])
+        results = np.where(goals_for > goals_against, "W", np.where(goals_for < goals_against, "L", "T"))
+        changes = np.flatnonzero(results != results[-1])
+        length = len(results) - (changes[-1] + 1 if len(changes) else 0)
+        return f"{results[-1]}-{length}"
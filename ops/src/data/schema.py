@@ -0,0 +1,148 @@
+"""
+Declarative sheet schemas.
+Each schema names the columns of a sheet by position with a dtype and
+nullability, and is applied once at fetch time to produce a typed DataFrame.
+"""
+from collections import namedtuple
+
+import pandas as pd
+
+
+class SchemaError(ValueError):
+    """Raised when sheet data no longer matches its declared layout."""
+
+
+Column = namedtuple("Column", ["name", "position", "dtype", "nullable"])
+Column.__new__.__defaults__ = ("str", True)
+
+
+class SheetSchema:
+    """Column layout of one sheet."""
+
+    def __init__(self, name, columns, header=False, strip=True):
+        self.name = name
+        self.columns = list(columns)
+        self.header = header
+        self.strip = strip
+
+    @property
+    def column_names(self):
+        return [column.name for column in self.columns]
+
+    def _check_header(self, header_row):
+        """Fail fast if the sheet's header no longer matches the declared columns."""
+        for column in self.columns:
+            if column.position >= len(header_row) and column.nullable:
+                continue
+            found = header_row[column.position] if column.position < len(header_row) else None
+            found = "" if found is None or pd.isna(found) else str(found).strip()
+            if found.lower() != column.name.lower():
+                raise SchemaError(
+                    f"{self.name}: expected column '{column.name}' at position {column.position}, "
+                    f"found '{found}'"
+                )
+
+    def _convert(self, series, column):
+        if column.dtype == "int":
+            return pd.to_numeric(series, errors="coerce").astype("Int64")
+        if column.dtype == "float":
+            return pd.to_numeric(series, errors="coerce")
+        values = series.astype("object").where(series.notna(), "").astype(str)
+        if self.strip:
+            values = values.str.strip()
+        return values.mask(values.str.lower().isin(["nan", "none"]), "")
+
+    def apply(self, df):
+        """
+        Build a typed DataFrame with named columns
+        Rows missing a non-nullable value are dropped (blank sheet rows).
+        Raises SchemaError if the header row or column count has drifted.
+        """
+        if df.empty:
+            return self.empty()
+
+        if self.header:
+            self._check_header(df.iloc[0].tolist())
+            df = df.iloc[1:]
+
+        # Ragged trailing columns may be absent when they are blank in every row,
+        # but a header-less sheet must at least reach its last required column
+        required_width = max(
+            [column.position + 1 for column in self.columns if not column.nullable] or [0]
+        )
+        if len(df.columns) < required_width:
+            raise SchemaError(
+                f"{self.name}: expected at least {required_width} columns, got {len(df.columns)}"
+            )
+
+        typed = {}
+        for column in self.columns:
+            if column.position < len(df.columns):
+                series = df.iloc[:, column.position]
+            else:
+                series = pd.Series([None] * len(df), index=df.index, dtype="object")
+            typed[column.name] = self._convert(series, column)
+        result = pd.DataFrame(typed, columns=self.column_names).reset_index(drop=True)
+
+        for column in self.columns:
+            if not column.nullable:
+                values = result[column.name]
+                missing = values.isna() if column.dtype != "str" else values.eq("")
+                result = result[~missing]
+        return result.reset_index(drop=True)
+
+    def empty(self):
+        """Empty DataFrame with this schema's columns."""
+        return pd.DataFrame(columns=self.column_names)
+
+
+# games: populated by the league office, header in row 1
+GAMES_SCHEMA = SheetSchema("games", [
+    Column("SeasonId", 0),
+    Column("id", 1, "str", False),
+    Column("Date", 2),
+    Column("Time", 3),
+    Column("HomeTeamID", 4),
+    Column("AwayTeamID", 5),
+    Column("Home", 6),
+    Column("Away", 7),
+    Column("HomeScore", 8),
+    Column("AwayScore", 9),
+    Column("Ref1", 10),
+    Column("Ref2", 11),
+    Column("GameLink", 14),
+    Column("Score", 15),
+    Column("Played", 16),
+], header=True, strip=False)
+
+# gameEvents: written by the game events ingestion, header in row 1
+GAME_EVENTS_SCHEMA = SheetSchema("gameEvents", [
+    Column("id", 0),
+    Column("gameId", 1, "str", False),
+    Column("eventTime", 2),
+    Column("Team", 3),
+    Column("ScoredBy", 4),
+    Column("Asst1", 5),
+    Column("Asst2", 6),
+    Column("PenaltyPlayer", 7),
+    Column("Infraction", 8),
+    Column("PIM", 9),
+    Column("GWG", 10, "int"),
+], header=True)
+
+# gamesPlayed: one row per player per game, header in row 1
+GAMES_PLAYED_SCHEMA = SheetSchema("gamesPlayed", [
+    Column("gameId", 0, "str", False),
+    Column("team", 1, "str", False),
+    Column("playerName", 2, "str", False),
+    Column("position", 3),
+    Column("jerseyNumber", 4),
+    Column("sub", 5, "int"),
+], header=True)
+
+# Schemas by SHEET_EXTENTS name, used by SheetsClient.get_table()
+SCHEMAS = {
+    "games": GAMES_SCHEMA,
+    "game_events": GAME_EVENTS_SCHEMA,
+    "games_played": GAMES_PLAYED_SCHEMA,
+}
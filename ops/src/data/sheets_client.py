@@ -2,15 +2,45 @@
 Shared Google Sheets client for UHL operations.
 Consolidates authentication and data fetching logic.
 """
+import hashlib
+
 import pandas as pd
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from config import settings as config
+from src.data.rate_limit import get_default_guard
+from src.data.range_discovery import RangeDiscovery
+from src.data.schema import SCHEMAS
+
+
+def typed_column(values, length):
+    """
+    Build a Series from one unformatted column.
+    Blank cells become missing values; all-numeric columns get a numeric dtype
+    (nullable Int64 when every value is integral).
+    """
+    padded = [None if value == "" else value for value in values] + [None] * (length - len(values))
+    present = [value for value in padded if value is not None]
+    
+    if present and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+        series = pd.Series(padded, dtype='float64')
+        if all(float(value).is_integer() for value in present):
+            return series.astype('Int64')
+        return series
+    return pd.Series(padded, dtype='object')
+
+
+def columns_to_frame(columns):
+    """Build a typed DataFrame from column-major values (ragged columns are padded)."""
+    length = max(len(column) for column in columns)
+    return pd.DataFrame({i: typed_column(column, length) for i, column in enumerate(columns)})
+
 
 class SheetsClient:
-    def __init__(self, player_spreadsheet_id=None, game_spreadsheet_id=None):
-        """Initialize the Google Sheets client with spreadsheet IDs"""
+    def __init__(self, player_spreadsheet_id=None, game_spreadsheet_id=None, guard=None, readonly=True,
+                 sheet_extents=None):
+        """Initialize the Google Sheets client with spreadsheet IDs (and a league's sheet extents)"""
         
         # Use provided IDs or fall back to config defaults (environment loaded automatically)
         self.player_spreadsheet_id = (
@@ -23,45 +53,65 @@ class SheetsClient:
             config.DEFAULT_GAME_SPREADSHEET_ID
         )
         
+        # Rate limiter, retry policy and circuit breaker shared by all clients
+        self.guard = guard or get_default_guard()
+        
+        self.readonly = readonly
+        self.credentials = None
         self.service = None
         self._authenticate()
+        
+        # Resolves named sheets to their populated extent (cached per spreadsheet)
+        self.sheet_extents = sheet_extents or config.SHEET_EXTENTS
+        self.discovery = RangeDiscovery(
+            self.service, self.guard, self.sheet_extents, config.RANGE_DISCOVERY_TTL_SECONDS
+        )
     
     def _authenticate(self):
         """Authenticate with Google Sheets API using service account"""
         try:
             credentials = service_account.Credentials.from_service_account_file(
                 config.SERVICE_ACCOUNT_FILE,
-                scopes=['https://www.googleapis.com/auth/spreadsheets.readonly']
+                scopes=[
+                    'https://www.googleapis.com/auth/spreadsheets.readonly' if self.readonly
+                    else 'https://www.googleapis.com/auth/spreadsheets'
+                ]
             )
+            self.credentials = credentials
             self.service = build('sheets', 'v4', credentials=credentials)
             print("✅ Successfully authenticated with service account")
         except Exception as e:
             print(f"❌ Authentication failed: {e}")
             raise
     
-    def get_range(self, range_name, spreadsheet_type='player'):
+    def _spreadsheet_id(self, spreadsheet_type):
+        """Resolve 'player' or 'game' to a spreadsheet ID"""
+        if spreadsheet_type == 'game':
+            if not self.game_spreadsheet_id:
+                raise ValueError("Game spreadsheet ID not provided")
+            return self.game_spreadsheet_id
+        return self.player_spreadsheet_id
+    
+    def get_range(self, range_name, spreadsheet_type='player', required=False):
         """
         Fetch data from a specific range in the spreadsheet
         Args:
             range_name: The range to fetch (e.g., 'Sheet1!A1:C10')
             spreadsheet_type: 'player' or 'game' to determine which spreadsheet to use
+            required: raise HttpError instead of returning an empty DataFrame, for
+                reads where "unreadable" must not be mistaken for "empty"
         Returns pandas DataFrame
+        Raises SheetsUnavailableError if the API keeps returning 429/5xx
         """
         # Determine which spreadsheet ID to use
-        if spreadsheet_type == 'game':
-            spreadsheet_id = self.game_spreadsheet_id
-            if not spreadsheet_id:
-                raise ValueError("Game spreadsheet ID not provided")
-        else:
-            spreadsheet_id = self.player_spreadsheet_id
+        spreadsheet_id = self._spreadsheet_id(spreadsheet_type)
             
         try:
             sheet = self.service.spreadsheets()
-            result = (
-                sheet.values()
-                .get(spreadsheetId=spreadsheet_id, range=range_name)
-                .execute()
-            )
+            request = sheet.values().get(spreadsheetId=spreadsheet_id, range=range_name)
+            # Transient quota/server errors are retried and eventually raised
+            # rather than turned into an empty DataFrame
+            result = self.guard.call(request.execute, f"Fetching {range_name}")
             values = result.get("values", [])
             
             if not values:
@@ -74,8 +124,76 @@ class SheetsClient:
             
         except HttpError as err:
             print(f"Error fetching range {range_name}: {err}")
+            if required:
+                raise
             return pd.DataFrame()
     
+    def get_typed_range(self, range_name, spreadsheet_type='player'):
+        """
+        Fetch a range column-major with unformatted values
+        Numbers arrive as numbers, so each column is built directly with a proper
+        dtype (Int64 / float64 / object) instead of parsing formatted strings cell
+        by cell. Dates, times and durations keep their formatted strings
+        (e.g. '09-08-2024', '7:45'), which is what the outputs carry.
+        Args:
+            range_name: The range to fetch (e.g., 'Sheet1!A1:C10')
+            spreadsheet_type: 'player' or 'game' to determine which spreadsheet to use
+        Returns pandas DataFrame with integer column labels like get_range
+        Raises SheetsUnavailableError if the API keeps returning 429/5xx
+        """
+        spreadsheet_id = self._spreadsheet_id(spreadsheet_type)
+        
+        try:
+            request = self.service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=range_name,
+                majorDimension='COLUMNS',
+                valueRenderOption='UNFORMATTED_VALUE',
+                dateTimeRenderOption='FORMATTED_STRING'
+            )
+            result = self.guard.call(request.execute, f"Fetching {range_name}")
+        except HttpError as err:
+            print(f"Error fetching range {range_name}: {err}")
+            return pd.DataFrame()
+        
+        columns = result.get("values", [])
+        if not columns:
+            print(f"No data found in range: {range_name}")
+            return pd.DataFrame()
+        
+        return columns_to_frame(columns)
+    
+    def get_sheet(self, name, spreadsheet_type='player', typed=False):
+        """
+        Fetch the populated extent of a named sheet from the client's sheet extents
+        Args:
+            name: Extent name (e.g., 'games', 'game_events', 'games_played')
+            spreadsheet_type: 'player' or 'game' to determine which spreadsheet to use
+            typed: Fetch column-major unformatted values (see get_typed_range)
+        Returns pandas DataFrame; falls back to the static range if discovery fails
+        """
+        spec = self.sheet_extents[name]
+        fetch = self.get_typed_range if typed else self.get_range
+        try:
+            range_name = self.discovery.resolve(self._spreadsheet_id(spreadsheet_type), name)
+        except (HttpError, KeyError) as err:
+            print(f"⚠️  Range discovery failed for {name} ({err}); using {spec['fallback']}")
+            return fetch(spec["fallback"], spreadsheet_type)
+        
+        if range_name is None:
+            print(f"No data found in sheet: {spec['sheet']}")
+            return pd.DataFrame()
+        return fetch(range_name, spreadsheet_type)
+    
+    def get_table(self, name, spreadsheet_type='player'):
+        """
+        Fetch a named sheet column-major with unformatted values and apply its
+        schema (src/data/schema.py)
+        Returns a DataFrame with named, typed columns
+        Raises SchemaError if the sheet layout has drifted
+        """
+        return SCHEMAS[name].apply(self.get_sheet(name, spreadsheet_type, typed=True))
+    
     def get_range_with_headers(self, range_name, spreadsheet_type='player'):
         """
         Fetch data with first row as headers
@@ -89,3 +207,105 @@ class SheetsClient:
             df.columns = df.iloc[0]
             df = df[1:].reset_index(drop=True)
         return df
+    
+    def batch_update_values(self, updates, spreadsheet_type='player'):
+        """
+        Write several ranges in a single values.batchUpdate call
+        Args:
+            updates: dict of A1 range -> list of rows
+            spreadsheet_type: 'player' or 'game' to determine which spreadsheet to use
+        Returns the number of updated cells
+        Requires a client created with readonly=False
+        """
+        if self.readonly:
+            raise ValueError("SheetsClient was created read-only; pass readonly=False to write")
+        
+        data = [
+            {"range": range_name, "values": rows}
+            for range_name, rows in updates.items() if rows
+        ]
+        if not data:
+            return 0
+        
+        request = self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=self._spreadsheet_id(spreadsheet_type),
+            body={"valueInputOption": "USER_ENTERED", "data": data}
+        )
+        result = self.guard.call(request.execute, f"Writing {len(data)} ranges")
+        return result.get("totalUpdatedCells", 0)
+    
+    def append_values(self, range_name, rows, spreadsheet_type='player'):
+        """
+        Append rows after the last row of the table in range_name (values.append)
+        Args:
+            range_name: A1 range locating the table (e.g., 'gameEvents!A1')
+            rows: list of rows to append
+            spreadsheet_type: 'player' or 'game' to determine which spreadsheet to use
+        Returns the number of updated cells
+        Requires a client created with readonly=False
+        """
+        if self.readonly:
+            raise ValueError("SheetsClient was created read-only; pass readonly=False to write")
+        if not rows:
+            return 0
+        
+        # The API finds the end of the table, so a stale row count can't overwrite data
+        request = self.service.spreadsheets().values().append(
+            spreadsheetId=self._spreadsheet_id(spreadsheet_type),
+            range=range_name,
+            valueInputOption="USER_ENTERED",
+            insertDataOption="INSERT_ROWS",
+            body={"values": rows}
+        )
+        result = self.guard.call(request.execute, f"Appending {len(rows)} rows to {range_name}")
+        return result.get("updates", {}).get("updatedCells", 0)
+
+
+def frame_fingerprint(df):
+    """Content hash of a DataFrame, used to tell which fetched datasets changed."""
+    digest = hashlib.sha1(str(df.shape).encode())
+    if not df.empty:
+        digest.update(pd.util.hash_pandas_object(df.astype("string"), index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class WarmSheetsClient(SheetsClient):
+    """
+    SheetsClient that keeps fetched sheets in memory until refresh() is called.
+    Used by the watch daemon so every stage reads the same warm, typed datasets
+    instead of refetching them.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._frames = {}
+    
+    def get_sheet(self, name, spreadsheet_type='player', typed=False):
+        key = (spreadsheet_type, name, typed)
+        if key not in self._frames:
+            self._frames[key] = super().get_sheet(name, spreadsheet_type, typed)
+        # Formatters may rename columns in place; never hand out the cached frame itself
+        return self._frames[key].copy()
+    
+    def refresh(self, spreadsheet_type=None):
+        """Drop cached sheets and discovered extents for one spreadsheet type, or for all."""
+        if spreadsheet_type is None:
+            self._frames.clear()
+            self.discovery.invalidate()
+            return
+        
+        self._frames = {key: df for key, df in self._frames.items() if key[0] != spreadsheet_type}
+        try:
+            self.discovery.invalidate(self._spreadsheet_id(spreadsheet_type))
+        except ValueError:
+            pass
+    
+    def fingerprints(self, names, spreadsheet_type='player'):
+        """
+        Fetch (or reuse) the named sheets and return {name: content hash}
+        Sheets with a schema are hashed from the typed fetch get_table() reuses.
+        """
+        return {
+            name: frame_fingerprint(self.get_sheet(name, spreadsheet_type, typed=name in SCHEMAS))
+            for name in names
+        }
@@ -1,10 +1,14 @@
 # Formatter modules
 from .base import BaseFormatter, OutputManager
-from .schedule import GameFormatter, ScheduleFormatter
+from .schedule import GameFormatter
 from .players import PlayerFormatter
 from .goalie_stats import GoalieStatsFormatter, StandingsFormatter
+from .player_logs import PlayerLogIndex
+from .head_to_head import HeadToHeadMatrix
+from .leaders import Leaderboards
 
 __all__ = [
-    'BaseFormatter', 'OutputManager', 'GameFormatter', 'ScheduleFormatter',
-    'PlayerFormatter', 'GoalieStatsFormatter', 'StandingsFormatter'
+    'BaseFormatter', 'OutputManager', 'GameFormatter',
+    'PlayerFormatter', 'GoalieStatsFormatter', 'StandingsFormatter', 'PlayerLogIndex',
+    'HeadToHeadMatrix', 'Leaderboards'
 ]
@@ -1,9 +1,21 @@
 """
 Base formatter class with common functionality.
 """
+import contextlib
 import json
 import pandas as pd
 import os
+from collections import namedtuple
+from src.data.json_stream import iter_json_array, iter_ndjson
+
+
+# Result of BaseFormatter.scan_tbd: cells/rows are boolean masks
+TBDScan = namedtuple("TBDScan", ["cells", "rows", "tbd_count", "valid_count"])
+
+
+def team_key(team):
+    """Team name ignoring case and spacing (event rows may say 'NewYork' for 'New York')"""
+    return "".join(str(team or "").split()).lower()
 
 
 class BaseFormatter:
@@ -21,23 +33,33 @@ class BaseFormatter:
         return None
     
     @staticmethod
-    def check_tbd_content(df):
-        """Check if DataFrame contains TBD placeholder content."""
+    def scan_tbd(df):
+        """
+        Find TBD placeholder content in a single vectorized pass.
+        A row is TBD if any cell contains 'TBD' (any case) or its first cell is blank.
+        Returns TBDScan with the per-cell mask, the row mask and the counts,
+        so callers can share one scan instead of rescanning the frame.
+        """
         if df.empty:
-            return True
-            
-        # Count TBD vs actual data
-        tbd_count = 0
-        valid_count = 0
+            empty_mask = pd.Series(dtype=bool)
+            return TBDScan(pd.DataFrame(dtype=bool), empty_mask, 0, 0)
         
-        for _, row in df.iterrows():
-            row_str = ' '.join(str(val) for val in row.values)
-            if 'TBD' in row_str.upper() or pd.isna(row.iloc[0]) or str(row.iloc[0]).strip() == '':
-                tbd_count += 1
-            else:
-                valid_count += 1
+        text = df.astype("string")
+        cells = text.apply(lambda column: column.str.contains("TBD", case=False, na=False))
+        first_blank = text.iloc[:, 0].isna() | text.iloc[:, 0].str.strip().eq("").fillna(True)
+        rows = cells.any(axis=1) | first_blank
+        
+        tbd_count = int(rows.sum())
+        return TBDScan(cells, rows, tbd_count, len(df) - tbd_count)
+    
+    @classmethod
+    def check_tbd_content(cls, df, scan=None):
+        """Check if DataFrame contains mostly TBD placeholder content."""
+        if df.empty:
+            return True
         
-        return tbd_count > valid_count
+        scan = scan or cls.scan_tbd(df)
+        return scan.tbd_count > scan.valid_count
     
     @staticmethod
     def safe_column_assignment(df, expected_columns):
@@ -49,22 +71,158 @@ class BaseFormatter:
         return df
 
 
+class JSONArrayWriter:
+    """
+    Writes a JSON array one item at a time, byte-for-byte what json.dump(items, indent=...)
+    writes. Items go to <file>.tmp, which replaces the file when the writer closes without
+    error, so readers never see a half-written array.
+    """
+    
+    def __init__(self, filepath, indent=4):
+        self.filepath = filepath
+        self.indent = indent
+        self.count = 0
+        self._file = None
+    
+    def __enter__(self):
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(f"{self.filepath}.tmp", 'w')
+        return self
+    
+    def write(self, item):
+        if self.indent is None:
+            self._file.write(("[" if not self.count else ", ") + json.dumps(item))
+        else:
+            # Nested lines are shifted one level, as json.dump does for items of a list
+            prefix = " " * self.indent
+            text = json.dumps(item, indent=self.indent).replace("\n", "\n" + prefix)
+            self._file.write(("[\n" if not self.count else ",\n") + prefix + text)
+        self.count += 1
+    
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            if not self.count:
+                self._file.write("[]")
+            else:
+                self._file.write("]" if self.indent is None else "\n]")
+        self._file.close()
+        if exc_type is None:
+            os.replace(f"{self.filepath}.tmp", self.filepath)
+        else:
+            os.remove(f"{self.filepath}.tmp")
+        return False
+
+
+class NDJSONWriter:
+    """
+    Writes one JSON object per line, flushing each line so readers can tail the file
+    while it is written. append=True adds to an existing file.
+    """
+    
+    def __init__(self, filepath, append=False):
+        self.filepath = filepath
+        self.append = append
+        self.count = 0
+        self._file = None
+    
+    def __enter__(self):
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.filepath, 'a' if self.append else 'w')
+        return self
+    
+    def write(self, item):
+        self._file.write(json.dumps(item, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.count += 1
+    
+    def __exit__(self, exc_type, exc, traceback):
+        self._file.close()
+        return False
+
+
 class OutputManager:
-    """Handles saving data to various output formats."""
+    """Handles saving and loading JSON output files."""
     
     @staticmethod
-    def save_json(data, filepath):
+    def save_json(data, filepath, indent=4):
         """Save data as JSON file."""
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
         with open(filepath, 'w') as f:
-            json.dump(data, f, indent=4)
+            json.dump(data, f, indent=indent)
+        print(f"Data saved to {filepath}")
+    
+    @staticmethod
+    def save_ndjson(items, filepath, append=False):
+        """Write an iterable (e.g. a generator) as NDJSON as items are produced; returns the count"""
+        with NDJSONWriter(filepath, append) as writer:
+            for item in items:
+                writer.write(item)
+        print(f"Data saved to {filepath}")
+        return writer.count
+    
+    @staticmethod
+    def save_stream(items, json_path=None, ndjson_path=None, collect=None):
+        """
+        Write items to a JSON array file and/or an NDJSON file as they are produced,
+        appending them to collect (a list) if given; returns the number written
+        """
+        with contextlib.ExitStack() as stack:
+            writers = [stack.enter_context(JSONArrayWriter(json_path))] if json_path else []
+            if ndjson_path:
+                writers.append(stack.enter_context(NDJSONWriter(ndjson_path)))
+            count = 0
+            for item in items:
+                for writer in writers:
+                    writer.write(item)
+                if collect is not None:
+                    collect.append(item)
+                count += 1
+        for path in (json_path, ndjson_path):
+            if path:
+                print(f"Data saved to {path}")
+        return count
     
     @staticmethod
     def save_pretty_json(data, filepath):
         """Save data as pretty-formatted JSON."""
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
         with open(filepath, 'w') as f:
             json.dump(data, f, indent=4, sort_keys=True)
+    
+    @staticmethod
+    def load_json(filepath):
+        """Load data from JSON file, or None if it is missing or invalid."""
+        try:
+            with open(filepath, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            print(f"File not found: {filepath}")
+            return None
+        except json.JSONDecodeError:
+            print(f"Invalid JSON in file: {filepath}")
+            return None
+    
+    @staticmethod
+    def stream_json(filepath, key=None, fields=None):
+        """
+        Iterator over the items of a JSON array (or .ndjson) file, one at a time
+        (see src/data/json_stream.py), or None if the file is missing.
+        Invalid JSON raises JSONStreamError while iterating.
+        """
+        if not os.path.exists(filepath):
+            print(f"File not found: {filepath}")
+            return None
+        if filepath.endswith(".ndjson"):
+            return iter_ndjson(filepath, fields)
+        return iter_json_array(filepath, key, fields)
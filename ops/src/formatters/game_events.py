@@ -0,0 +1,126 @@
+"""
+Game events formatters.
+Python port of appscript/gameEvents.gs: turns one game sheet into
+gameEvents and gamesPlayed rows for the master spreadsheet.
+"""
+import pandas as pd
+from .base import BaseFormatter
+
+
+GAME_EVENTS_HEADERS = ['id', 'gameId', 'eventTime', 'Team', 'ScoredBy', 'Asst1', 'Asst2',
+                       'PenaltyPlayer', 'Infraction', 'PIM', 'GWG']
+GAMES_PLAYED_HEADERS = ['gameId', 'team', 'playerName', 'position', 'jerseyNumber', 'sub']
+
+
+def _cell(row, index):
+    """Return a stripped cell value from a ragged sheet row, or '' if missing."""
+    if index >= len(row):
+        return ""
+    value = row[index]
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ""
+    return str(value).strip()
+
+
+class GameEventsFormatter(BaseFormatter):
+    """Builds gameEvents and gamesPlayed rows from a single game spreadsheet."""
+
+    @staticmethod
+    def get_game_info(game_info):
+        """Read gameId and the two team names from the GameInfo row."""
+        if game_info.empty:
+            return None
+        row = game_info.iloc[0].tolist()
+        game_id, home_team, away_team = _cell(row, 0), _cell(row, 2), _cell(row, 3)
+        if not game_id or not home_team or not away_team:
+            return None
+        return {"gameId": game_id, "home": home_team, "away": away_team}
+
+    @classmethod
+    def build_event_rows(cls, game_id, home_team, away_team, goals_df, penalties_df):
+        """
+        Build gameEvents rows for one game.
+        Goals get ids like '12-G-1' and penalties '12-P-1', and the
+        game-winning goal is flagged with GWG = 1.
+        """
+        goal_rows = []
+        if goals_df is not None and not goals_df.empty:
+            for row in goals_df.itertuples(index=False):
+                time, team, scored_by = _cell(row, 0), _cell(row, 1), _cell(row, 2)
+                if not (time and team and scored_by):
+                    continue
+                goal_rows.append([
+                    f"{game_id}-G-{len(goal_rows) + 1}", game_id, time, team, scored_by,
+                    _cell(row, 3), _cell(row, 4), '', '', '', 0
+                ])
+
+        penalty_rows = []
+        if penalties_df is not None and not penalties_df.empty:
+            for row in penalties_df.itertuples(index=False):
+                time, team, player = _cell(row, 0), _cell(row, 1), _cell(row, 2)
+                if not (time and team and player):
+                    continue
+                penalty_rows.append([
+                    f"{game_id}-P-{len(penalty_rows) + 1}", game_id, time, team, '', '', '',
+                    player, _cell(row, 3), _cell(row, 4), ''
+                ])
+
+        cls.mark_game_winning_goal(goal_rows, home_team, away_team)
+        return goal_rows + penalty_rows
+
+    @staticmethod
+    def mark_game_winning_goal(goal_rows, home_team, away_team):
+        """Flag the goal that put the winner one ahead of the loser's final score."""
+        final = {home_team: 0, away_team: 0}
+        for goal in goal_rows:
+            final[goal[3]] = final.get(goal[3], 0) + 1
+
+        if final[home_team] == final[away_team]:
+            return None
+        winner, loser = (home_team, away_team) if final[home_team] > final[away_team] else (away_team, home_team)
+
+        winner_goals = 0
+        for goal in goal_rows:
+            if goal[3] != winner:
+                continue
+            winner_goals += 1
+            if winner_goals == final[loser] + 1:
+                goal[10] = 1
+                return goal[0]
+        return None
+
+    @staticmethod
+    def build_games_played_rows(game_id, team, lineup_df):
+        """Build gamesPlayed rows for one team, skipping scratched players."""
+        rows = []
+        if lineup_df is None or lineup_df.empty:
+            return rows
+
+        for row in lineup_df.itertuples(index=False):
+            name, position, number, status = _cell(row, 0), _cell(row, 1), _cell(row, 2), _cell(row, 3)
+            if not name or status.lower() == 'scratch':
+                continue
+            rows.append([game_id, team, name, position, number, 1 if status.lower() == 'sub' else 0])
+        return rows
+
+    @classmethod
+    def format_game_sheet(cls, frames):
+        """
+        Build all destination rows for one game spreadsheet
+        Args:
+            frames: dict of DataFrames keyed like config.GAME_RANGES
+        Returns {"gameId", "events", "games_played"} or None if game info is missing
+        """
+        info = cls.get_game_info(frames.get("game_info", pd.DataFrame()))
+        if info is None:
+            return None
+
+        game_id = info["gameId"]
+        events = cls.build_event_rows(
+            game_id, info["home"], info["away"], frames.get("goals"), frames.get("penalties")
+        )
+        games_played = (
+            cls.build_games_played_rows(game_id, info["home"], frames.get("team1_lineup")) +
+            cls.build_games_played_rows(game_id, info["away"], frames.get("team2_lineup"))
+        )
+        return {"gameId": game_id, "events": events, "games_played": games_played}
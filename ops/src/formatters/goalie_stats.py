@@ -1,155 +1,252 @@
 """
-Goalie statistics formatters.
+Goalie statistics and standings formatters.
 """
-import json
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
 from .base import BaseFormatter
+from src.utils import leagues
+
+# The schedule.json fields goalie stats are computed from
+GOALIE_GAME_FIELDS = ("id", "Home", "Away", "Played", "Score", "Lineups")
 
 
 class GoalieStatsFormatter(BaseFormatter):
-    """Handles formatting and calculation of goalie statistics."""
+    """Calculates goalie statistics from the played games in schedule.json."""
     
     @classmethod
-    def calculate_goalie_stats_from_schedule(cls, schedule_file_path):
-        """Calculate goalie statistics from schedule.json file."""
-        try:
-            with open(schedule_file_path, 'r') as f:
-                schedule_data = json.load(f)
+    def goalie_games(cls, games):
+        """
+        Yield the played games of an iterable of games, trimmed to what goalie stats need
+        (lineups keep only goalies), so a streamed schedule is never held in memory whole.
+        """
+        for game in games:
+            if str(game.get('Played', '')).lower() != 'y':
+                continue
+            lineups = game.get('Lineups') or {}
+            yield {
+                **{field: game[field] for field in GOALIE_GAME_FIELDS if field in game and field != 'Lineups'},
+                'Lineups': {
+                    side: cls.find_goalies_in_lineup(lineups.get(side) or []) for side in ('Home', 'Away')
+                },
+            }
+    
+    @staticmethod
+    def calculate_goalie_stats_from_schedule(schedule_data):
+        """
+        Calculate comprehensive goalie statistics from schedule data with deduplication
+        Results come from each game's Score string, which is set even when the game
+        sheet's goal list is incomplete.
+        """
+        # Track all stats for each goalie across all teams
+        all_goalie_data = defaultdict(lambda: defaultdict(lambda: {
+            'gp': 0,
+            'w': 0,
+            'l': 0,
+            't': 0,
+            'so': 0,
+            'ga': 0,
+            'games': []
+        }))
+        
+        played_games = [game for game in schedule_data if game.get('Played', '').lower() == 'y']
+        
+        # Parse every score string in one vectorized pass
+        home_scores, away_scores = GoalieStatsFormatter.parse_scores(
+            [game.get('Score', '') for game in played_games]
+        )
+        
+        for game, home_score, away_score in zip(played_games, home_scores.tolist(), away_scores.tolist()):
+            game_id = game.get('id', '')
+            home_team = game.get('Home', '')
+            away_team = game.get('Away', '')
             
-            goalie_stats = {}
+            # Find goalies in lineups
+            home_goalies = GoalieStatsFormatter.find_goalies_in_lineup(game.get('Lineups', {}).get('Home', []))
+            away_goalies = GoalieStatsFormatter.find_goalies_in_lineup(game.get('Lineups', {}).get('Away', []))
             
-            for game in schedule_data:
-                # Only process played games
-                if game.get('Played', '').lower() != 'y':
-                    continue
-                
-                home_team = game.get('Home', '')
-                away_team = game.get('Away', '')
-                home_lineup = game.get('Lineups', {}).get('Home', [])
-                away_lineup = game.get('Lineups', {}).get('Away', [])
-                goals = game.get('Goals', [])
-                
-                # Find goalies in lineups
-                home_goalie = cls._find_goalie_in_lineup(home_lineup)
-                away_goalie = cls._find_goalie_in_lineup(away_lineup)
+            # Process home team goalies
+            for goalie in home_goalies:
+                goalie_name = goalie['name']
+                stats = all_goalie_data[goalie_name][home_team]
+                stats['gp'] += 1
+                stats['ga'] += away_score
                 
-                if not home_goalie and not away_goalie:
-                    continue
+                # Determine W/L/T
+                if home_score > away_score:
+                    stats['w'] += 1
+                elif home_score < away_score:
+                    stats['l'] += 1
+                else:
+                    stats['t'] += 1
                 
-                # Calculate goals against for each team
-                home_goals_against = len([g for g in goals if g.get('Team') != home_team])
-                away_goals_against = len([g for g in goals if g.get('Team') != away_team])
-                
-                # Determine winner
-                home_goals_for = len([g for g in goals if g.get('Team') == home_team])
-                away_goals_for = len([g for g in goals if g.get('Team') == away_team])
+                # Check for shutout
+                if away_score == 0:
+                    stats['so'] += 1
+                    
+                stats['games'].append({
+                    'game_id': game_id,
+                    'team': home_team,
+                    'opponent': away_team,
+                    'ga_in_game': away_score,
+                    'result': 'W' if home_score > away_score else 'L' if home_score < away_score else 'T'
+                })
+            
+            # Process away team goalies
+            for goalie in away_goalies:
+                goalie_name = goalie['name']
+                stats = all_goalie_data[goalie_name][away_team]
+                stats['gp'] += 1
+                stats['ga'] += home_score
                 
-                # Process home goalie
-                if home_goalie:
-                    cls._update_goalie_stats(
-                        goalie_stats, home_goalie, home_team,
-                        home_goals_for, away_goals_for, home_goals_against
-                    )
+                # Determine W/L/T
+                if away_score > home_score:
+                    stats['w'] += 1
+                elif away_score < home_score:
+                    stats['l'] += 1
+                else:
+                    stats['t'] += 1
                 
-                # Process away goalie
-                if away_goalie:
-                    cls._update_goalie_stats(
-                        goalie_stats, away_goalie, away_team,
-                        away_goals_for, home_goals_for, away_goals_against
-                    )
-            
-            # Convert to list format
-            stats_list = []
-            for goalie_name, stats in goalie_stats.items():
-                stats_list.append({
-                    "name": goalie_name,
-                    "team": stats["team"],
-                    "GP": stats["GP"],
-                    "GS": stats["GS"],
-                    "W": stats["W"],
-                    "L": stats["L"],
-                    "T": stats["T"],
-                    "SO": stats["SO"],
-                    "GA": stats["GA"],
-                    "GAA": round(stats["GA"] / max(stats["GP"], 1), 2)
+                # Check for shutout
+                if home_score == 0:
+                    stats['so'] += 1
+                    
+                stats['games'].append({
+                    'game_id': game_id,
+                    'team': away_team,
+                    'opponent': home_team,
+                    'ga_in_game': home_score,
+                    'result': 'W' if away_score > home_score else 'L' if away_score < home_score else 'T'
                 })
+        
+        # Now deduplicate: combine all stats for each goalie under their primary team
+        deduplicated_stats = {}
+        
+        for goalie_name, team_stats in all_goalie_data.items():
+            # Find primary team (team with most games played)
+            primary_team = max(team_stats.keys(), key=lambda team: team_stats[team]['gp'])
+            
+            # Combine all stats across all teams
+            combined_stats = {
+                'name': goalie_name,
+                'team': primary_team,
+                'gp': 0,
+                'w': 0,
+                'l': 0,
+                't': 0,
+                'so': 0,
+                'ga': 0,
+                'gaa': 0.0,
+                'games': []
+            }
             
-            return stats_list
+            # Sum up stats from all teams
+            for team, stats in team_stats.items():
+                combined_stats['gp'] += stats['gp']
+                combined_stats['w'] += stats['w']
+                combined_stats['l'] += stats['l']
+                combined_stats['t'] += stats['t']
+                combined_stats['so'] += stats['so']
+                combined_stats['ga'] += stats['ga']
+                combined_stats['games'].extend(stats['games'])
             
-        except Exception as e:
-            print(f"Error calculating goalie stats: {e}")
-            return []
+            # Calculate GAA
+            if combined_stats['gp'] > 0:
+                combined_stats['gaa'] = round(combined_stats['ga'] / combined_stats['gp'], 2)
+            
+            deduplicated_stats[goalie_name] = combined_stats
+        
+        return deduplicated_stats
     
     @staticmethod
-    def _find_goalie_in_lineup(lineup):
-        """Find the goalie in a team lineup."""
-        for player in lineup:
-            if player.get('pos') == 'G':
-                return player.get('name')
-        return None
+    def find_goalies_in_lineup(lineup):
+        """Find all goalies in a team's lineup"""
+        return [player for player in lineup if player.get('pos', '').upper() == 'G']
     
     @staticmethod
-    def _update_goalie_stats(goalie_stats, goalie_name, team, goals_for, goals_against_team, goals_against):
-        """Update statistics for a specific goalie."""
-        if goalie_name not in goalie_stats:
-            goalie_stats[goalie_name] = {
-                "team": team,
-                "GP": 0,
-                "GS": 0,
-                "W": 0,
-                "L": 0,
-                "T": 0,
-                "SO": 0,
-                "GA": 0
-            }
+    def parse_scores(score_strings):
+        """
+        Parse score strings like 'Chicago 2 - 1 Detroit' in one vectorized pass
+        Returns (home_scores, away_scores) as integer numpy arrays; unparseable scores are 0, 0
+        """
+        if len(score_strings) == 0:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+        
+        scores = pd.Series(score_strings, dtype='object').fillna('').astype(str)
+        extracted = scores.str.extract(r'(\d+)\s+-\s+(\d+)')
+        home_scores = pd.to_numeric(extracted[0], errors='coerce').fillna(0).astype(int).to_numpy()
+        away_scores = pd.to_numeric(extracted[1], errors='coerce').fillna(0).astype(int).to_numpy()
+        return home_scores, away_scores
+    
+    @staticmethod
+    def format_goalie_stats(goalie_stats, league=None):
+        """
+        Format deduplicated goalie stats to match player schema with seasons
+        Team ids and the season id come from the league (default: the registry's default league)
+        """
+        league = league or leagues.get_league()
+        # Teams missing from the league keep its first team id
+        default_team_id = next(iter(league.teams), "")
+        formatted = []
         
-        stats = goalie_stats[goalie_name]
-        stats["GP"] += 1
-        stats["GS"] += 1
-        stats["GA"] += goals_against
+        # Sort goalies by GAA (ascending) then by GP (descending)
+        sorted_goalies = sorted(
+            [(name, stats) for name, stats in goalie_stats.items() if stats['gp'] > 0],
+            key=lambda x: (x[1]['gaa'], -x[1]['gp'])
+        )
         
-        # Determine game result
-        if goals_for > goals_against_team:
-            stats["W"] += 1
-        elif goals_for < goals_against_team:
-            stats["L"] += 1
-        else:
-            stats["T"] += 1
+        for i, (goalie_name, stats) in enumerate(sorted_goalies, 1):
+            # Split name into first and last name
+            name_parts = goalie_name.split(' ', 1)
+            first_name = name_parts[0] if len(name_parts) > 0 else goalie_name
+            last_name = name_parts[1] if len(name_parts) > 1 else ""
+            
+            # Map team name to team ID
+            team_id = league.team_id(stats['team'], default_team_id)
+            
+            goalie_record = {
+                "id": str(i),
+                "firstName": first_name,
+                "lastName": last_name,
+                "seasons": [
+                    {
+                        "id": league.season_id,
+                        "Team": team_id,
+                        "Position": "G",
+                        "GP": str(stats['gp']),
+                        "GS": str(stats['gp']),  # Games Started = Games Played for goalies
+                        "W": str(stats['w']),
+                        "L": str(stats['l']),
+                        "T": str(stats['t']),
+                        "SO": str(stats['so']),
+                        "GA": str(stats['ga']),
+                        "GAA": f"{stats['gaa']:.2f}"
+                    }
+                ]
+            }
+            
+            formatted.append(goalie_record)
         
-        # Check for shutout
-        if goals_against == 0:
-            stats["SO"] += 1
+        return formatted
 
 
 class StandingsFormatter(BaseFormatter):
     """Handles formatting of team standings data."""
     
+    STANDINGS_COLUMNS = ["id", "Team", "W", "L", "T", "P", "GF", "GA", "PIM", "Home", "Away", "Streak"]
+    
     @classmethod
     def format_standings(cls, df):
-        """Format standings data from Google Sheets."""
-        empty_check = cls.handle_empty_data(df, "standings")
-        if empty_check:
-            return empty_check.get("data", [])
-        
-        try:
-            # Check for TBD content
-            if cls.check_tbd_content(df):
-                print("⚠️  Warning: Standings data contains TBD content")
-                return []
-            
-            expected_columns = ["id", "Team", "W", "L", "T", "P", "GF", "GA", "PIM", "Home", "Away", "Streak"]
-            
-            if len(df.columns) < len(expected_columns):
-                print(f"⚠️  Warning: Found {len(df.columns)} columns for standings, expected {len(expected_columns)}")
-                return []
-            
-            df_standings = df.iloc[:, :len(expected_columns)].copy()
-            df_standings.columns = expected_columns
-            
-            # Remove rows with missing essential data
-            df_standings = df_standings.dropna(subset=['Team'])
-            
-            return df_standings.to_dict(orient='records')
-            
-        except Exception as e:
-            print(f"⚠️  Error processing standings data: {e}")
+        """
+        Format standings data from Google Sheets
+        Blank trailing cells, which the sheet does not return, are filled with ''.
+        """
+        if df.empty:
             return []
+        
+        columns = cls.STANDINGS_COLUMNS
+        df_standings = df.iloc[:, :len(columns)].copy()
+        df_standings.columns = columns[:len(df_standings.columns)]
+        df_standings = df_standings.reindex(columns=columns, fill_value='').fillna('')
+        return df_standings.to_dict(orient='records')
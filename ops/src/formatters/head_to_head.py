@@ -0,0 +1,205 @@
+"""
+Head-to-head formatter.
+Team x team matrix of records, goals and last meetings, built from the played
+games of schedule.json in one vectorized pass and kept as numpy arrays so
+tiebreakers and preview pages can look up any pairing in constant time.
+"""
+import numpy as np
+import pandas as pd
+from .base import BaseFormatter, team_key
+from .goalie_stats import GoalieStatsFormatter
+
+# Per-pairing counters, row team vs column opponent
+COUNTERS = ("W", "L", "T", "GF", "GA")
+SCHEDULE_DATE_FORMAT = "%m-%d-%Y"
+
+
+class HeadToHeadMatrix(BaseFormatter):
+    """
+    Records of every team against every other team.
+    Cell [i, j] is team i's record against team j, so [j, i] mirrors it.
+    Games are remembered by id with a fingerprint of their teams, date and score,
+    so adding the same schedule again only applies games that are new since the
+    last update.
+    """
+
+    def __init__(self, teams=None):
+        self.teams = []
+        self.index = {}
+        self.counts = {name: np.zeros((0, 0), dtype=np.int32) for name in COUNTERS}
+        self.last_date = np.zeros((0, 0), dtype="datetime64[D]")
+        self.last_game = np.zeros((0, 0), dtype="<U16")
+        self.last_gf = np.zeros((0, 0), dtype=np.int32)
+        self.last_ga = np.zeros((0, 0), dtype=np.int32)
+        # Game id -> fingerprint() of every game applied
+        self.games = {}
+        # Games applied by the last add_games() call
+        self.added = 0
+        self._add_teams(teams or [])
+
+    def _add_teams(self, names):
+        """Grow the matrices for teams not seen yet"""
+        new_teams = []
+        for name in names:
+            key = team_key(name)
+            if key and key not in self.index:
+                self.index[key] = len(self.teams) + len(new_teams)
+                new_teams.append(str(name).strip())
+        if not new_teams:
+            return
+
+        self.teams.extend(new_teams)
+        pad = ((0, len(new_teams)), (0, len(new_teams)))
+        self.counts = {name: np.pad(matrix, pad) for name, matrix in self.counts.items()}
+        self.last_date = np.pad(self.last_date, pad, constant_values=np.datetime64("NaT"))
+        self.last_game = np.pad(self.last_game, pad, constant_values="")
+        self.last_gf = np.pad(self.last_gf, pad)
+        self.last_ga = np.pad(self.last_ga, pad)
+
+    @classmethod
+    def from_schedule(cls, schedule, teams=None):
+        """Build the matrix from every played game of a schedule"""
+        return cls(teams).add_games(schedule)
+
+    @staticmethod
+    def _played(schedule):
+        return [
+            game for game in schedule
+            if str(game.get('Played', '')).lower() == 'y'
+            and team_key(game.get('Home')) and team_key(game.get('Away'))
+        ]
+
+    @staticmethod
+    def fingerprint(game):
+        """Home, away, date and score of a game: everything its matrix cells depend on"""
+        return "|".join([
+            team_key(game.get('Home')), team_key(game.get('Away')),
+            str(game.get('Date', '')).strip(), str(game.get('Score', '')),
+        ])
+
+    def needs_rebuild(self, schedule):
+        """True if a game already applied has since changed teams, date or score, or is no longer played"""
+        played = {str(game.get('id', '')): self.fingerprint(game) for game in self._played(schedule)}
+        return any(played.get(game_id) != fingerprint for game_id, fingerprint in self.games.items())
+
+    def add_games(self, schedule):
+        """Apply the played games not applied yet (their count is left in self.added)"""
+        games = [game for game in self._played(schedule) if str(game.get('id', '')) not in self.games]
+        self.added = len(games)
+        if not games:
+            return self
+
+        self._add_teams(sorted({game['Home'] for game in games} | {game['Away'] for game in games}, key=team_key))
+        home = np.array([self.index[team_key(game['Home'])] for game in games])
+        away = np.array([self.index[team_key(game['Away'])] for game in games])
+        home_scores, away_scores = GoalieStatsFormatter.parse_scores([game.get('Score', '') for game in games])
+
+        # Every game seen from both sides: (team, opponent, goals for, goals against)
+        team = np.concatenate([home, away])
+        opponent = np.concatenate([away, home])
+        goals_for = np.concatenate([home_scores, away_scores]).astype(np.int32)
+        goals_against = np.concatenate([away_scores, home_scores]).astype(np.int32)
+
+        cells = (team, opponent)
+        np.add.at(self.counts["W"], cells, goals_for > goals_against)
+        np.add.at(self.counts["L"], cells, goals_for < goals_against)
+        np.add.at(self.counts["T"], cells, goals_for == goals_against)
+        np.add.at(self.counts["GF"], cells, goals_for)
+        np.add.at(self.counts["GA"], cells, goals_against)
+
+        # Last meeting per pairing: latest date, then highest game id
+        dates = pd.to_datetime(
+            pd.Series([game.get('Date', '') for game in games], dtype='object'),
+            format=SCHEDULE_DATE_FORMAT, errors='coerce'
+        ).to_numpy(dtype="datetime64[D]")
+        game_ids = np.array([str(game.get('id', '')) for game in games])
+        id_numbers = pd.to_numeric(pd.Series(game_ids), errors='coerce').fillna(-1).to_numpy()
+        dates = np.concatenate([dates, dates])
+        game_ids = np.concatenate([game_ids, game_ids])
+        id_numbers = np.concatenate([id_numbers, id_numbers])
+
+        # Undated games sort first so they never replace a dated meeting
+        order = np.lexsort((id_numbers, np.where(np.isnat(dates), np.datetime64("0001-01-01", "D"), dates)))
+        last_first = order[::-1]
+        pairs = team[last_first] * len(self.teams) + opponent[last_first]
+        _, first_positions = np.unique(pairs, return_index=True)
+        latest = last_first[first_positions]
+
+        rows, cols = team[latest], opponent[latest]
+        current = self.last_date[rows, cols]
+        newer = (
+            (self.last_game[rows, cols] == "")
+            | np.isnat(current)
+            | (~np.isnat(dates[latest]) & (dates[latest] >= current))
+        )
+        rows, cols, latest = rows[newer], cols[newer], latest[newer]
+        self.last_game = self.last_game.astype(np.result_type(self.last_game, game_ids))
+        self.last_date[rows, cols] = dates[latest]
+        self.last_game[rows, cols] = game_ids[latest]
+        self.last_gf[rows, cols] = goals_for[latest]
+        self.last_ga[rows, cols] = goals_against[latest]
+
+        for game in games:
+            self.games[str(game.get('id', ''))] = self.fingerprint(game)
+        return self
+
+    def _last_meeting(self, i, j):
+        if not self.last_game[i, j]:
+            return None
+        date = self.last_date[i, j]
+        return {
+            "gameId": str(self.last_game[i, j]),
+            "date": "" if np.isnat(date) else pd.Timestamp(date).strftime(SCHEDULE_DATE_FORMAT),
+            "GF": int(self.last_gf[i, j]),
+            "GA": int(self.last_ga[i, j]),
+        }
+
+    def record(self, team, opponent):
+        """Head-to-head record of team against opponent, or None if either team is unknown"""
+        i, j = self.index.get(team_key(team)), self.index.get(team_key(opponent))
+        if i is None or j is None:
+            return None
+        counts = {name: int(matrix[i, j]) for name, matrix in self.counts.items()}
+        return {
+            "team": self.teams[i],
+            "opponent": self.teams[j],
+            "GP": counts["W"] + counts["L"] + counts["T"],
+            **counts,
+            "last": self._last_meeting(i, j),
+        }
+
+    def to_dict(self):
+        """JSON form: team list plus one row-per-team matrix per counter"""
+        size = len(self.teams)
+        return {
+            "teams": list(self.teams),
+            **{name: matrix.tolist() for name, matrix in self.counts.items()},
+            "last": [[self._last_meeting(i, j) for j in range(size)] for i in range(size)],
+        }
+
+    def save(self, path):
+        """Save the arrays (and applied games) as a compressed .npz"""
+        np.savez_compressed(
+            path,
+            teams=np.array(self.teams, dtype=str),
+            last_date=self.last_date,
+            last_game=self.last_game,
+            last_gf=self.last_gf,
+            last_ga=self.last_ga,
+            game_ids=np.array(list(self.games), dtype=str),
+            game_fingerprints=np.array(list(self.games.values()), dtype=str),
+            **self.counts,
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Load a matrix saved with save()"""
+        with np.load(path, allow_pickle=False) as saved:
+            matrix = cls(saved["teams"].tolist())
+            matrix.counts = {name: saved[name].astype(np.int32) for name in COUNTERS}
+            matrix.last_date = saved["last_date"]
+            matrix.last_game = saved["last_game"]
+            matrix.last_gf = saved["last_gf"]
+            matrix.last_ga = saved["last_ga"]
+            matrix.games = dict(zip(saved["game_ids"].tolist(), saved["game_fingerprints"].tolist()))
+        return matrix
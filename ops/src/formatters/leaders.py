@@ -0,0 +1,168 @@
+"""
+Leaderboard formatter.
+Top-k skater and goalie leaders per category for the league and each team,
+selected with heaps from the player game log index so only the scopes touched
+by newly processed games are recomputed.
+"""
+import heapq
+from collections import Counter, namedtuple
+from .base import BaseFormatter, team_key
+
+# qualify: only players with the minimum games played are ranked (rate stats)
+Category = namedtuple("Category", ["name", "stat", "descending", "qualify"])
+
+SKATER_CATEGORIES = (
+    Category("points", "PTS", True, False),
+    Category("goals", "G", True, False),
+    Category("assists", "A", True, False),
+    Category("pim", "PIM", True, False),
+    Category("gwg", "GWG", True, False),
+    Category("points_per_game", "PPG", True, True),
+)
+GOALIE_CATEGORIES = (
+    Category("gaa", "GAA", False, True),
+    Category("wins", "W", True, False),
+    Category("shutouts", "SO", True, False),
+)
+GROUPS = {"skaters": SKATER_CATEGORIES, "goalies": GOALIE_CATEGORIES}
+LEAGUE_SCOPE = "league"
+
+
+def skater_entry(log, season_id):
+    """Season totals of one player, or None if they did not play that season"""
+    totals = log["seasons"].get(str(season_id))
+    if not totals or not totals["GP"]:
+        return None
+    return {**totals, "PPG": round(totals["PTS"] / totals["GP"], 2)}
+
+
+def goalie_entry(log, season_id):
+    """Season goaltending totals of one player, or None if they did not play in goal"""
+    games = [
+        game for game in log["games"]
+        if game["season"] == str(season_id) and str(game.get("pos", "")).upper() == 'G'
+    ]
+    if not games:
+        return None
+    results = Counter(game["result"] for game in games)
+    goals_against = sum(game.get("GA", 0) for game in games)
+    return {
+        "GP": len(games),
+        "W": results['W'],
+        "L": results['L'],
+        "T": results['T'],
+        "GA": goals_against,
+        "SO": sum(1 for game in games if game.get("GA", 0) == 0),
+        "GAA": round(goals_against / len(games), 2),
+    }
+
+
+def season_team(log, season_id):
+    """Team a player played most of the season for (the latest one on ties)"""
+    teams = [game["team"] for game in log["games"] if game["season"] == str(season_id)]
+    counts = Counter(team_key(team) for team in teams)
+    best = max(counts.values())
+    return next(team for team in reversed(teams) if counts[team_key(team)] == best)
+
+
+class Leaderboards(BaseFormatter):
+    """
+    Leaders of one season, kept per scope (league and every team) and category.
+    Each board holds the top_k entries plus everyone tied with the last of them.
+    """
+
+    def __init__(self, season_id="1", top_k=10, min_gp=3):
+        self.season_id = str(season_id)
+        self.top_k = top_k
+        self.min_gp = min_gp
+        # group -> player id -> entry (id, name, team and season totals)
+        self.entries = {group: {} for group in GROUPS}
+        # group -> scope -> player ids
+        self.members = {group: {} for group in GROUPS}
+        # scope -> group -> category -> rows
+        self.boards = {}
+
+    def update(self, index, player_ids=None):
+        """
+        Refresh the entries of the given players (all players if None) from a
+        PlayerLogIndex and recompute the boards of the scopes they were or are in
+        Returns the scopes that were recomputed
+        """
+        player_ids = list(index.logs) if player_ids is None else list(player_ids)
+        dirty = set()
+
+        for player_id in player_ids:
+            log = index.get(player_id)
+            entries = {"skaters": None, "goalies": None}
+            team = None
+            if log is not None:
+                entries = {"skaters": skater_entry(log, self.season_id), "goalies": goalie_entry(log, self.season_id)}
+                if entries["skaters"] is not None:
+                    team = season_team(log, self.season_id)
+
+            for group, stats in entries.items():
+                old = self.entries[group].pop(player_id, None)
+                if old is not None:
+                    self.members[group][old["team"]].discard(player_id)
+                    self.members[group][LEAGUE_SCOPE].discard(player_id)
+                    dirty.update((LEAGUE_SCOPE, old["team"]))
+                if stats is not None:
+                    self.entries[group][player_id] = {"id": player_id, "name": log["name"], "team": team, **stats}
+                    self.members[group].setdefault(team, set()).add(player_id)
+                    self.members[group].setdefault(LEAGUE_SCOPE, set()).add(player_id)
+                    dirty.update((LEAGUE_SCOPE, team))
+
+        for scope in dirty:
+            self._rebuild_scope(scope)
+        return dirty
+
+    def _rebuild_scope(self, scope):
+        boards = {}
+        for group, categories in GROUPS.items():
+            entries = [self.entries[group][player_id] for player_id in self.members[group].get(scope, ())]
+            boards[group] = {category.name: self.select(entries, category) for category in categories}
+        if any(rows for group in boards.values() for rows in group.values()):
+            self.boards[scope] = boards
+        else:
+            self.boards.pop(scope, None)
+
+    def select(self, entries, category):
+        """
+        Top-k rows of one category with a heap (no full sort of every entry)
+        Entries tied with the k-th are kept, and tied entries share a rank.
+        """
+        sign = 1 if category.descending else -1
+        qualified = [
+            (sign * entry[category.stat], entry) for entry in entries
+            if (not category.qualify or entry["GP"] >= self.min_gp)
+            # A zero is not a lead in counting stats
+            and (not category.descending or entry[category.stat] > 0)
+        ]
+        top = heapq.nlargest(self.top_k, qualified, key=lambda item: item[0])
+        if len(top) == self.top_k:
+            cutoff = top[-1][0]
+            top = [item for item in top if item[0] > cutoff] + [item for item in qualified if item[0] == cutoff]
+        top.sort(key=lambda item: (-item[0], item[1]["name"]))
+
+        rows = []
+        for position, (key, entry) in enumerate(top, 1):
+            rank = rows[-1]["rank"] if rows and top[position - 2][0] == key else position
+            rows.append({
+                "rank": rank,
+                "id": entry["id"],
+                "name": entry["name"],
+                "team": entry["team"],
+                "GP": entry["GP"],
+                "value": entry[category.stat],
+            })
+        return rows
+
+    def to_dict(self):
+        """leaders.json: league boards plus one set of boards per team"""
+        return {
+            "season": self.season_id,
+            "top": self.top_k,
+            "minGP": self.min_gp,
+            LEAGUE_SCOPE: self.boards.get(LEAGUE_SCOPE, {}),
+            "teams": {scope: boards for scope, boards in sorted(self.boards.items()) if scope != LEAGUE_SCOPE},
+        }
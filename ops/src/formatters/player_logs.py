@@ -0,0 +1,211 @@
+"""
+Player game log formatter.
+Builds a per-player index of every game played, with the player's line, plus
+season and career totals, in a single pass over schedule.json.
+"""
+import hashlib
+import json
+import re
+from .base import BaseFormatter, team_key
+from .goalie_stats import GoalieStatsFormatter
+
+STAT_FIELDS = ("GP", "G", "A", "PTS", "PIM", "GWG")
+
+
+def normalize_name(name):
+    """Lowercase a player name and collapse whitespace, for matching lineups to players.json"""
+    return " ".join(str(name or "").split()).lower()
+
+
+def event_player(value):
+    """Player name from a goal/penalty field; sheets export blanks as None or 'null'"""
+    name = str(value or "").strip()
+    return "" if name.lower() in ("null", "none") else name
+
+
+def penalty_minutes(value):
+    """Penalty minutes from values like '3', '3:00' or None"""
+    match = re.match(r"\s*(\d+)", str(value or ""))
+    return int(match.group(1)) if match else 0
+
+
+def empty_totals():
+    return dict.fromkeys(STAT_FIELDS, 0)
+
+
+class PlayerLogIndex(BaseFormatter):
+    """
+    Game logs keyed by player id.
+    Lineups only carry names, so players are matched to players.json ids by
+    name; players missing from players.json (subs, spare goalies) are keyed
+    by a slug of their name.
+    """
+
+    def __init__(self, players=None):
+        self._ids_by_name = {}
+        for player in players or []:
+            name = normalize_name(f"{player.get('firstName', '')} {player.get('lastName', '')}")
+            if name:
+                self._ids_by_name[name] = str(player.get("id", ""))
+        self.logs = {}
+        # (season, game id) -> fingerprint of every game added
+        self._games_seen = {}
+        # Ids of the players whose logs changed in the last add_schedule()
+        self.changed = set()
+
+    def player_id(self, name):
+        """Resolve a lineup/event name to a player id (or name slug)"""
+        normalized = normalize_name(name)
+        return self._ids_by_name.get(normalized) or re.sub(r"[^a-z0-9]+", "-", normalized).strip("-")
+
+    def get(self, player_id):
+        """Game log of one player, or None"""
+        return self.logs.get(str(player_id))
+
+    def find(self, name):
+        """Game log of a player by name, or None"""
+        return self.logs.get(self.player_id(name))
+
+    def _log(self, player_id, name):
+        log = self.logs.get(player_id)
+        if log is None:
+            log = {"id": player_id, "name": " ".join(str(name).split()), "games": [], "seasons": {}, "career": empty_totals()}
+            self.logs[player_id] = log
+        return log
+
+    @staticmethod
+    def fingerprint(game):
+        return hashlib.sha1(json.dumps(game, sort_keys=True, default=str).encode()).hexdigest()
+
+    def needs_rebuild(self, schedule, season_id="1"):
+        """True if a game already added has since been edited or is no longer played"""
+        played = {
+            (str(season_id), str(game.get('id', ''))): game
+            for game in schedule if str(game.get('Played', '')).lower() == 'y'
+        }
+        return any(
+            key not in played or self.fingerprint(played[key]) != fingerprint
+            for key, fingerprint in self._games_seen.items() if key[0] == str(season_id)
+        )
+
+    def add_schedule(self, schedule, season_id="1"):
+        """
+        Add the played games of a schedule not added yet; score strings are parsed in
+        one vectorized pass. The players whose logs changed are left in self.changed.
+        """
+        played_games = [
+            game for game in schedule
+            if str(game.get('Played', '')).lower() == 'y'
+            and (str(season_id), str(game.get('id', ''))) not in self._games_seen
+        ]
+        home_scores, away_scores = GoalieStatsFormatter.parse_scores(
+            [game.get('Score', '') for game in played_games]
+        )
+        self.changed = set()
+        for game, home_score, away_score in zip(played_games, home_scores.tolist(), away_scores.tolist()):
+            self.changed.update(self.add_game(game, season_id, home_score, away_score))
+        return self
+
+    def add_game(self, game, season_id="1", home_score=None, away_score=None):
+        """
+        Add one played game to the index (games already added are skipped)
+        Returns the ids of the players whose logs changed
+        """
+        game_key = (str(season_id), str(game.get('id', '')))
+        if game_key in self._games_seen:
+            return []
+        self._games_seen[game_key] = self.fingerprint(game)
+
+        if home_score is None or away_score is None:
+            home_scores, away_scores = GoalieStatsFormatter.parse_scores([game.get('Score', '')])
+            home_score, away_score = int(home_scores[0]), int(away_scores[0])
+
+        teams = {"Home": game.get('Home', ''), "Away": game.get('Away', '')}
+        scores = {"Home": home_score, "Away": away_score}
+        lines = {}
+
+        def line_for(name, side):
+            player_id = self.player_id(name)
+            if player_id not in lines:
+                opponent_side = "Away" if side == "Home" else "Home"
+                result = 'W' if scores[side] > scores[opponent_side] else 'L' if scores[side] < scores[opponent_side] else 'T'
+                lines[player_id] = (name, {
+                    "gameId": str(game.get('id', '')),
+                    "season": str(season_id),
+                    "date": game.get('Date', ''),
+                    "team": teams[side],
+                    "opponent": teams[opponent_side],
+                    "home": side == "Home",
+                    "pos": "",
+                    "no": "",
+                    "status": "",
+                    "G": 0,
+                    "A": 0,
+                    "PTS": 0,
+                    "PIM": 0,
+                    "GWG": 0,
+                    "result": result,
+                })
+            return lines[player_id][1]
+
+        sides = {team_key(teams["Home"]): "Home", team_key(teams["Away"]): "Away"}
+
+        def side_of(team):
+            return sides.get(team_key(team))
+
+        for side in ("Home", "Away"):
+            for player in game.get('Lineups', {}).get(side, []):
+                name = player.get('name', '')
+                if not str(name).strip() or str(player.get('status', '')).lower() == 'scratch':
+                    continue
+                line = line_for(name, side)
+                line.update(pos=player.get('pos', ''), no=player.get('no', ''), status=player.get('status', ''))
+                if str(line["pos"]).upper() == 'G':
+                    # Goalies are charged every goal against their team
+                    line["GA"] = scores["Away" if side == "Home" else "Home"]
+
+        # The winner's goal number (loser's score + 1) is the game winner
+        winner = "Home" if home_score > away_score else "Away" if away_score > home_score else None
+        winner_goals = 0
+        for goal in game.get('Goals', []):
+            side = side_of(goal.get('Team'))
+            if side is None:
+                continue
+            scorer = event_player(goal.get('ScoredBy'))
+            if scorer:
+                line = line_for(scorer, side)
+                line["G"] += 1
+                if side == winner:
+                    winner_goals += 1
+                    if winner_goals == min(home_score, away_score) + 1:
+                        line["GWG"] += 1
+            # Older schedule files spell the assist fields Assist1/Assist2
+            for field, legacy_field in (("Asst1", "Assist1"), ("Asst2", "Assist2")):
+                assist = event_player(goal.get(field) or goal.get(legacy_field))
+                if assist:
+                    line_for(assist, side)["A"] += 1
+
+        for penalty in game.get('Penalties', []):
+            side = side_of(penalty.get('Team'))
+            player = event_player(penalty.get('Player'))
+            if side is not None and player:
+                line_for(player, side)["PIM"] += penalty_minutes(penalty.get('Minutes'))
+
+        for player_id, (name, line) in lines.items():
+            line["PTS"] = line["G"] + line["A"]
+            log = self._log(player_id, name)
+            log["games"].append(line)
+            season = log["seasons"].setdefault(line["season"], empty_totals())
+            for totals in (season, log["career"]):
+                totals["GP"] += 1
+                for field in STAT_FIELDS[1:]:
+                    totals[field] += line[field]
+
+        return list(lines)
+
+    def summary(self):
+        """Compact index of every player: id, name and career totals"""
+        return [
+            {"id": log["id"], "name": log["name"], **log["career"]}
+            for log in sorted(self.logs.values(), key=lambda log: log["name"])
+        ]
@@ -1,99 +1,66 @@
 """
 Player data formatters.
 """
-import pandas as pd
 from .base import BaseFormatter
+from src.utils import leagues
 
 
 class PlayerFormatter(BaseFormatter):
     """Handles formatting of player data and statistics."""
-    
+
+    PLAYER_COLUMNS = ["id", "firstName", "lastName"]
+    SEASON_COLUMNS = ["Team", "JerseyNumber", "Position", "GP", "G", "A", "PTS", "PIM", "GWG"]
+
     @classmethod
     def format_players(cls, df):
-        """Format players data from Google Sheets."""
-        empty_check = cls.handle_empty_data(df, "players")
-        if empty_check:
-            return empty_check.get("data", [])
-        
+        """Format basic player info with TBD handling"""
+        if df.empty:
+            return []
+
+        if len(df.columns) < len(cls.PLAYER_COLUMNS):
+            print(f"⚠️  Warning: Expected {len(cls.PLAYER_COLUMNS)} columns for players, got {len(df.columns)}. Likely TBD data.")
+            return []
+
         try:
-            # Check for TBD content
-            if cls.check_tbd_content(df):
-                print("⚠️  Warning: Player data contains TBD content")
-                return []
-            
-            expected_columns = ["id", "firstName", "lastName"]
-            
-            if len(df.columns) < len(expected_columns):
-                print(f"⚠️  Warning: Found {len(df.columns)} columns, expected at least {len(expected_columns)}")
-                return []
-            
-            # Use only the first 3 columns for basic player info
-            df_players = df.iloc[:, :3].copy()
-            df_players.columns = expected_columns
-            
-            # Remove any rows with missing essential data
-            df_players = df_players.dropna(subset=['firstName', 'lastName'])
-            
+            df_players = df.iloc[:, :len(cls.PLAYER_COLUMNS)].copy()
+            df_players.columns = cls.PLAYER_COLUMNS
             return df_players.to_dict(orient='records')
-            
         except Exception as e:
             print(f"⚠️  Error processing players data: {e}")
             return []
-    
-    @classmethod 
-    def format_season_stats(cls, df):
-        """Format player season statistics from Google Sheets."""
+
+    @classmethod
+    def format_season_stats(cls, df, season_id=None):
+        """
+        Format player season statistics with TBD handling
+        season_id defaults to the registry's default league's season
+        """
         if df.empty:
             return []
-        
+
+        if len(df.columns) < len(cls.SEASON_COLUMNS):
+            print(f"⚠️  Warning: Expected {len(cls.SEASON_COLUMNS)} columns for season stats, got {len(df.columns)}. Likely TBD data.")
+            return []
+
         try:
-            # Check for TBD content
-            if cls.check_tbd_content(df):
-                print("⚠️  Warning: Season stats contain TBD content")
-                return []
-            
-            expected_columns = ["Team", "JerseyNumber", "Position", "GP", "G", "A", "PTS", "PIM", "GWG", "id"]
-            
-            if len(df.columns) < len(expected_columns):
-                print(f"⚠️  Warning: Found {len(df.columns)} columns for season stats, expected {len(expected_columns)}")
-                return []
-            
-            df_stats = df.iloc[:, :len(expected_columns)].copy()
-            df_stats.columns = expected_columns
-            
-            # Remove rows with missing essential data
-            df_stats = df_stats.dropna(subset=['Team', 'Position'])
-            
+            df_stats = df.iloc[:, :len(cls.SEASON_COLUMNS)].copy()
+            df_stats.columns = cls.SEASON_COLUMNS
+            # Season id; players and season stats share sheet rows, so the player is matched by position
+            df_stats["id"] = str(season_id or leagues.get_league().season_id)
             return df_stats.to_dict(orient='records')
-            
         except Exception as e:
             print(f"⚠️  Error processing season stats: {e}")
             return []
-    
+
     @staticmethod
     def combine_player_data(players, seasons):
-        """Combine player data with their season statistics."""
-        if not players:
-            return []
-        
-        # Group seasons by player id
-        seasons_by_player = {}
-        for season in seasons:
-            player_id = str(season.get('id', ''))
-            if player_id not in seasons_by_player:
-                seasons_by_player[player_id] = []
-            seasons_by_player[player_id].append(season)
-        
-        # Combine with player data
-        combined = []
-        for player in players:
-            player_id = str(player.get('id', ''))
-            player_seasons = seasons_by_player.get(player_id, [])
-            
-            combined_player = {
-                **player,
-                "seasons": player_seasons
-            }
-            combined.append(combined_player)
-        
-        return combined
+        """Combine player info with the season stats row at the same sheet position"""
+        combined_data = []
+        for i, player in enumerate(players):
+            combined_data.append({
+                "id": player["id"],
+                "firstName": player["firstName"],
+                "lastName": player["lastName"],
+                "seasons": [seasons[i]] if i < len(seasons) else []
+            })
+        return combined_data
@@ -22,30 +22,42 @@ class GameFormatter(BaseFormatter):
             raise ValueError(f"Expected 8 columns for lineups, but got {len(df.columns)} columns")
 
     @classmethod
-    def format_all_games(cls, df):
-        """Format games schedule data from Google Sheets."""
-        empty_check = cls.handle_empty_data(df, "games")
-        if empty_check:
-            return empty_check
+    def format_all_games(cls, df, scan=None):
+        """
+        Format games schedule data from Google Sheets (handles TBD data during season startup)
+        Pass the TBDScan used for check_season_status to avoid rescanning the sheet.
+        """
+        if df.empty:
+            return {
+                "message": "No games data found",
+                "status": "no_data",
+                "games": []
+            }
         
+        # Handle TBD/placeholder data during season startup
         try:
-            expected_columns = ["SeasonId", "id", "Date", "Time", "Home", "Away", 
-                              "HomeTeam", "AwayTeam", "HomeScore", "AwayScore", "Ref1", "Ref2"]
+            # Expected columns from your structure
+            expected_columns = ["SeasonId", "id", "Date", "Time", "Home", "Away", "HomeTeam", "AwayTeam", "HomeScore", "AwayScore", "Ref1", "Ref2"]
             
-            # Check for TBD data during season startup
+            # If we have fewer columns than expected, it might be TBD data
             if len(df.columns) < len(expected_columns):
                 print(f"⚠️  Warning: Found {len(df.columns)} columns, expected {len(expected_columns)}. Likely TBD data.")
+                
+                # Return empty schedule for TBD scenarios
                 return {
                     "message": "Season not yet started - TBD data detected",
                     "status": "pending",
                     "games": []
                 }
             
-            df = cls.safe_column_assignment(df, expected_columns)
+            # Columns past Ref2 (GameLink, Score, Played) are not part of the games list
+            df = df.iloc[:, :len(expected_columns)]
+            scan = scan or cls.scan_tbd(df)
+            df = cls.safe_column_assignment(df.copy(), expected_columns)
             
-            # Filter out TBD or empty data
-            df_clean = df.dropna(subset=['Date', 'Home', 'Away'])
-            df_clean = df_clean[~df_clean['Date'].astype(str).str.contains('TBD|tbd', case=False, na=False)]
+            # Filter out rows with TBD or empty essential data (TBD dates come from the shared scan)
+            tbd_dates = scan.cells.iloc[:, expected_columns.index('Date')].to_numpy()
+            df_clean = df[~tbd_dates].dropna(subset=['Date', 'Home', 'Away'])
             
             if df_clean.empty:
                 return {
@@ -61,25 +73,26 @@ class GameFormatter(BaseFormatter):
             }
             
         except Exception as e:
-            print(f"⚠️  Error processing games data: {e}")
+            print(f"⚠️  Error processing games data (likely TBD content): {e}")
             return {
-                "message": "Unable to process games data",
+                "message": "Unable to process games data - season may not be started",
                 "status": "error",
                 "error": str(e),
                 "games": []
             }
     
     @classmethod
-    def check_season_status(cls, df):
+    def check_season_status(cls, df, scan=None):
         """Check if season is active, planning, or TBD"""
         if df.empty:
             return {"status": "no_data", "message": "No schedule data found", "ready_for_play": False}
         
-        is_tbd = cls.check_tbd_content(df)
-        tbd_count = sum(1 for _, row in df.iterrows() if cls._row_is_tbd(row))
-        valid_count = len(df) - tbd_count
+        # Count TBD vs actual data in one vectorized pass
+        scan = scan or cls.scan_tbd(df)
+        tbd_count = scan.tbd_count
+        valid_count = scan.valid_count
         
-        if is_tbd:
+        if cls.check_tbd_content(df, scan):
             return {
                 "status": "planning",
                 "message": f"Season in planning phase ({tbd_count} TBD, {valid_count} scheduled)",
@@ -90,81 +103,303 @@ class GameFormatter(BaseFormatter):
         else:
             return {
                 "status": "active", 
-                "message": f"Season active ({valid_count} games scheduled)",
+                "message": f"Season active ({valid_count} games scheduled, {tbd_count} TBD)",
                 "ready_for_play": True,
                 "tbd_count": tbd_count,
                 "valid_count": valid_count
             }
     
     @staticmethod
-    def _row_is_tbd(row):
-        """Check if a row contains TBD data."""
-        row_str = ' '.join(str(val) for val in row.values)
-        return 'TBD' in row_str.upper() or pd.isna(row.iloc[0]) or str(row.iloc[0]).strip() == ''
-
-
-class ScheduleFormatter(BaseFormatter):
-    """Handles complete schedule formatting with games, events, and lineups."""
-    
-    @classmethod
-    def format_complete_schedule(cls, games_data, events_data, lineups_data):
-        """Format complete schedule combining games, events, and lineups."""
-        try:
-            schedule = []
+    def events_to_goals_penalties(events):
+        """
+        Build goal and penalty entries from typed gameEvents rows of one game
+        Args:
+            events: DataFrame with GAME_EVENTS_SCHEMA columns
+        """
+        goals = []
+        penalties = []
+        
+        for event in events.itertuples(index=False):
+            # A goal has ScoredBy; a penalty has PenaltyPlayer (Infraction may be blank)
+            if event.ScoredBy:
+                goals.append({
+                    "id": len(goals) + 1,
+                    "Time": event.eventTime,
+                    "Team": event.Team,
+                    "ScoredBy": event.ScoredBy,
+                    "Asst1": event.Asst1 or None,
+                    "Asst2": event.Asst2 or None
+                })
             
-            for game in games_data:
-                game_id = str(game.get('id', ''))
+            if event.PenaltyPlayer:
+                penalties.append({
+                    "id": len(penalties) + 1,
+                    "Time": event.eventTime,
+                    "Team": event.Team,
+                    "Player": event.PenaltyPlayer,
+                    "Infraction": event.Infraction,
+                    "Minutes": event.PIM
+                })
+        
+        return {"goals": goals, "penalties": penalties}
+    
+    @staticmethod
+    def get_events_for_game(events_df, game_id):
+        """Extract goals and penalties for a specific game from the typed gameEvents table"""
+        if events_df.empty:
+            return {"goals": [], "penalties": []}
+        
+        return GameFormatter.events_to_goals_penalties(events_df[events_df["gameId"] == str(game_id)])
+    
+    @staticmethod
+    def _lineup_player(player_id, row):
+        """Create a lineup entry from a typed gamesPlayed row"""
+        return {
+            "id": player_id,
+            "name": row.playerName,
+            "pos": row.position,
+            "no": row.jerseyNumber,
+            "status": "sub" if row.sub == 1 else "active",
+            "g": "0",   # Goals (would be calculated from events)
+            "a": "0",   # Assists (would be calculated from events)
+            "pts": "0", # Points (would be calculated from events)
+            "pim": "0"  # Penalty minutes (would be calculated from events)
+        }
+    
+    @staticmethod
+    def extract_lineups_from_games_played(games_played_df):
+        """Extract lineup data from the typed gamesPlayed table organized by game ID"""
+        if games_played_df.empty:
+            return {}
+        
+        lineups_by_game = {}
+        
+        # All players are listed under Home; Home/Away is resolved against the schedule later
+        for game_id, rows in games_played_df.groupby("gameId", sort=False):
+            lineups_by_game[game_id] = {
+                "Home": [
+                    GameFormatter._lineup_player(i, row)
+                    for i, row in enumerate(rows.itertuples(index=False), 1)
+                ],
+                "Away": []
+            }
+        
+        return lineups_by_game
+    
+    @staticmethod
+    def build_complete_schedule(games_df, events_df, games_played_df=None):
+        """
+        Build complete schedule with games, events, and lineups
+        Args:
+            games_df, events_df, games_played_df: typed tables from SheetsClient.get_table
+            ('games', 'game_events', 'games_played')
+        """
+        return list(GameFormatter.iter_complete_schedule(games_df, events_df, games_played_df))
+    
+    @staticmethod
+    def iter_complete_schedule(games_df, events_df, games_played_df=None):
+        """
+        Yield the schedule entries of build_complete_schedule one game at a time,
+        so they can be written out as they are formatted
+        """
+        # Index events and lineup rows by game once instead of rescanning them per game
+        events_by_game = {}
+        if events_df is not None and not events_df.empty:
+            events_by_game = {
+                game_id: GameFormatter.events_to_goals_penalties(rows)
+                for game_id, rows in events_df.groupby("gameId", sort=False)
+            }
+        
+        players_by_game = {}
+        if games_played_df is not None and not games_played_df.empty:
+            players_by_game = {
+                game_id: rows for game_id, rows in games_played_df.groupby("gameId", sort=False)
+            }
+        
+        no_events = {"goals": [], "penalties": []}
+        
+        for game in games_df.itertuples(index=False):
+            try:
+                score = game.Score
+                # If score field is empty, generate it from team names and scores
+                if not score.strip():
+                    if game.HomeScore and game.AwayScore:
+                        score = f"{game.Home} {game.HomeScore} - {game.AwayScore} {game.Away}"
+                    else:
+                        score = f"{game.Home}  -  {game.Away}"
                 
-                # Get events for this game
-                game_events = [event for event in events_data if str(event.get('gameId', '')) == game_id]
+                # Organize this game's players by Home/Away based on team match
+                home_lineup = []
+                away_lineup = []
+                if game.id in players_by_game:
+                    for row in players_by_game[game.id].itertuples(index=False):
+                        if row.team == game.Home:
+                            home_lineup.append(GameFormatter._lineup_player(len(home_lineup) + len(away_lineup) + 1, row))
+                        elif row.team == game.Away:
+                            away_lineup.append(GameFormatter._lineup_player(len(home_lineup) + len(away_lineup) + 1, row))
                 
-                # Get lineups for this game
-                game_lineups = lineups_data.get(game_id, {"Home": [], "Away": []})
+                game_events = events_by_game.get(game.id, no_events)
                 
-                # Build complete game object
-                complete_game = {
-                    **game,
-                    "Lineups": game_lineups,
-                    "Goals": cls._extract_goals(game_events),
-                    "Penalties": cls._extract_penalties(game_events)
+                # Create schedule entry with correct column mapping
+                schedule_entry = {
+                    "id": game.id,
+                    "Date": game.Date,
+                    "Home": game.Home,
+                    "Away": game.Away,
+                    "Time": game.Time,
+                    "Ref1": game.Ref1,
+                    "Ref2": game.Ref2,
+                    "GameLink": game.GameLink if game.GameLink else f"/gameSummary/{int(game.id) - 1}",  # Use GameLink from sheet or calculate
+                    "Score": score,
+                    "Played": game.Played or "N",
+                    "Lineups": {
+                        "Home": home_lineup,
+                        "Away": away_lineup
+                    },
+                    "Goals": game_events['goals'],
+                    "Penalties": game_events['penalties']
                 }
                 
-                schedule.append(complete_game)
-                
-            return schedule
+            except Exception as e:
+                print(f"Error processing game: {e}")
+                continue
             
-        except Exception as e:
-            print(f"Error formatting complete schedule: {e}")
-            return []
+            yield schedule_entry
     
     @staticmethod
-    def _extract_goals(events):
-        """Extract goal events from game events."""
-        goals = []
-        for event in events:
-            if event.get('ScoredBy'):  # Goal event
-                goals.append({
-                    "id": len(goals) + 1,
-                    "Time": event.get('eventTime', ''),
-                    "Team": event.get('Team', ''),
-                    "ScoredBy": event.get('ScoredBy', ''),
-                    "Asst1": event.get('Asst1') or None,
-                    "Asst2": event.get('Asst2') or None
-                })
-        return goals
+    def format_game_sheet(frames):
+        """
+        Format one game spreadsheet into a schedule entry
+        Args:
+            frames: dict of DataFrames keyed like config.GAME_RANGES
+                    (game_info, team1_lineup, team2_lineup, goals, penalties)
+        Returns schedule entry dict, or None if the sheet has no game info
+        """
+        empty = pd.DataFrame()
+        game_info = frames.get("game_info", empty)
+        if game_info.empty:
+            return None
+
+        home_lineup = GameFormatter.format_lineups(frames.get("team1_lineup", empty))
+        away_lineup = GameFormatter.format_lineups(frames.get("team2_lineup", empty))
+        goals = GameFormatter.format_goals(frames.get("goals", empty))
+        penalties = GameFormatter.format_penalties(frames.get("penalties", empty))
+
+        return GameFormatter.create_schedule_entry(
+            game_info, home_lineup, away_lineup, goals, penalties
+        )
+
+    @staticmethod
+    def merge_into_schedule(schedule, games):
+        """
+        Merge processed game entries into an existing schedule list by game id.
+        Non-empty fields from the game sheet win; empty strings, lists and dicts keep the
+        existing value, and Lineups sides merge separately. Games not yet in the schedule
+        are appended.
+        """
+        def is_empty(value):
+            if isinstance(value, dict):
+                return all(is_empty(item) for item in value.values())
+            return value in ("", None) or (isinstance(value, list) and not value)
+
+        def merge(existing, game):
+            for key, value in game.items():
+                if is_empty(value):
+                    continue
+                if isinstance(value, dict) and isinstance(existing.get(key), dict):
+                    existing[key] = dict(existing[key])
+                    merge(existing[key], value)
+                else:
+                    existing[key] = value
+
+        merged = [dict(game) for game in (schedule or [])]
+        index_by_id = {str(game.get("id", "")): i for i, game in enumerate(merged)}
+
+        for game in games:
+            game_id = str(game.get("id", ""))
+            if game_id in index_by_id:
+                merge(merged[index_by_id[game_id]], game)
+            else:
+                index_by_id[game_id] = len(merged)
+                merged.append(dict(game))
+
+        return merged
+
+    @staticmethod
+    def create_schedule_entry(game_info, home_lineup, away_lineup, goals, penalties):
+        """Create a schedule entry in the format matching existing schedule.json"""
+        if game_info.empty:
+            raise ValueError("Game info is required")
+        
+        return {
+            "id": str(game_info.iloc[0, 0]) if len(game_info.columns) > 0 else "",
+            "Date": str(game_info.iloc[0, 1]) if len(game_info.columns) > 1 else "",
+            "Home": str(game_info.iloc[0, 2]) if len(game_info.columns) > 2 else "",
+            "Away": str(game_info.iloc[0, 3]) if len(game_info.columns) > 3 else "",
+            "Time": str(game_info.iloc[0, 4]) if len(game_info.columns) > 4 else "",
+            "Ref1": str(game_info.iloc[0, 5]) if len(game_info.columns) > 5 else "",
+            "Ref2": str(game_info.iloc[0, 6]) if len(game_info.columns) > 6 else "",
+            "GameLink": str(game_info.iloc[0, 7]) if len(game_info.columns) > 7 else "",
+            "Score": str(game_info.iloc[0, 8]) if len(game_info.columns) > 8 else "",
+            "Played": str(game_info.iloc[0, 9]) if len(game_info.columns) > 9 else "",
+            "Lineups": {
+                "Home": home_lineup,
+                "Away": away_lineup
+            },
+            "Goals": goals,
+            "Penalties": penalties
+        }
     
     @staticmethod
-    def _extract_penalties(events):
-        """Extract penalty events from game events."""
-        penalties = []
-        for event in events:
-            if event.get('PenaltyPlayer'):  # Penalty event
-                penalties.append({
-                    "id": len(penalties) + 1,
-                    "Time": event.get('eventTime', ''),
-                    "Team": event.get('Team', ''),
-                    "Player": event.get('PenaltyPlayer', ''),
-                    "Infraction": event.get('Infraction', ''),
-                    "Minutes": event.get('PIM', '')
-                })
-        return penalties
+    def format_penalties(df):
+        """Format penalties data to match existing schedule.json structure"""
+        if df.empty:
+            return []
+        
+        penalties_df = df.iloc[:, :5].copy()  # Take first 5 columns
+        if len(penalties_df.columns) == 5:
+            penalties_df.columns = ["Time", "Team", "Player", "Infraction", "Minutes"]
+            penalties_df.loc[:, "id"] = range(1, len(penalties_df) + 1)
+            
+            # Format to match existing structure with proper field names
+            formatted_penalties = []
+            for _, row in penalties_df.iterrows():
+                penalty = {
+                    "id": int(row["id"]),
+                    "Time": str(row["Time"]),
+                    "Team": str(row["Team"]), 
+                    "Player": str(row["Player"]),
+                    "Infraction": str(row["Infraction"]),
+                    "Minutes": str(row["Minutes"])
+                }
+                formatted_penalties.append(penalty)
+            return formatted_penalties
+        else:
+            raise ValueError(f"Expected 5 columns for penalties, but got {len(penalties_df.columns)} columns")
+    
+    @staticmethod
+    def format_goals(df):
+        """Format goals data to match existing schedule.json structure"""
+        if df.empty:
+            return []
+        
+        goals_df = df.iloc[:, :5].copy()  # Take first 5 columns
+        if len(goals_df.columns) == 5:
+            goals_df.columns = ["Time", "Team", "ScoredBy", "Asst1", "Asst2"]
+            goals_df.loc[:, "id"] = range(1, len(goals_df) + 1)
+            
+            # Format to match existing structure 
+            formatted_goals = []
+            for _, row in goals_df.iterrows():
+                goal = {
+                    "id": int(row["id"]),
+                    "Time": str(row["Time"]),
+                    "Team": str(row["Team"]),
+                    "ScoredBy": str(row["ScoredBy"]),
+                    "Asst1": str(row["Asst1"]) if pd.notna(row["Asst1"]) and str(row["Asst1"]).strip() else None,
+                    "Asst2": str(row["Asst2"]) if pd.notna(row["Asst2"]) and str(row["Asst2"]).strip() else None
+                }
+                formatted_goals.append(goal)
+            return formatted_goals
+        else:
+            raise ValueError(f"Expected 5 columns for goals, but got {len(goals_df.columns)} columns")
@@ -0,0 +1,128 @@
+"""
+Partitioned schedule formatting.
+Splits the games table by season (and large seasons by game-id ranges),
+formats each partition in a process pool and merges the entries back in the
+games table's order, so the result matches GameFormatter.build_complete_schedule.
+Workers receive each partition's tables as packed numpy arrays instead of
+pickled DataFrames.
+"""
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from .schedule import GameFormatter
+
+
+def pack_table(df):
+    """
+    Typed table -> (column names, [(kind, values, mask)]) of plain numpy arrays
+    Strings become fixed-width unicode arrays, nullable ints int64 values plus a
+    missing mask; both pickle as flat buffers.
+    """
+    columns = []
+    for name in df.columns:
+        series = df[name]
+        if isinstance(series.dtype, pd.Int64Dtype):
+            columns.append(("Int64", series.fillna(0).to_numpy(dtype=np.int64), series.isna().to_numpy()))
+        elif pd.api.types.is_float_dtype(series.dtype):
+            columns.append(("float", series.to_numpy(dtype=np.float64), None))
+        else:
+            columns.append(("str", series.to_numpy(dtype=str), None))
+    return list(df.columns), columns
+
+
+def unpack_table(packed):
+    """pack_table output -> the typed DataFrame it was packed from"""
+    names, columns = packed
+    data = {}
+    for name, (kind, values, mask) in zip(names, columns):
+        if kind == "Int64":
+            data[name] = pd.arrays.IntegerArray(values, mask)
+        elif kind == "float":
+            data[name] = values
+        else:
+            data[name] = pd.Series(values.astype(object)).astype(str)
+    return pd.DataFrame(data, columns=names)
+
+
+def partition_games(games_df, max_games=500):
+    """
+    Row positions of each partition: one per season (SeasonId), seasons larger
+    than max_games split into consecutive game-id ranges
+    """
+    seasons = games_df["SeasonId"] if "SeasonId" in games_df.columns else pd.Series([""] * len(games_df))
+    game_ids = pd.to_numeric(games_df["id"], errors="coerce")
+    partitions = []
+    for _, positions in seasons.groupby(seasons.to_numpy(), sort=True).indices.items():
+        # Ranges follow game ids (non-numeric ids last), each range kept in table order
+        order = positions[np.lexsort((positions, game_ids.iloc[positions].fillna(np.inf).to_numpy()))]
+        for start in range(0, len(order), max_games):
+            partitions.append(np.sort(order[start:start + max_games]))
+    return partitions
+
+
+def format_partition(positions, games, events, games_played):
+    """Worker: format one partition; returns [(row position, schedule entry)] in table order"""
+    games_df = unpack_table(games)
+    entries = GameFormatter.iter_complete_schedule(
+        games_df, unpack_table(events) if events else None, unpack_table(games_played) if games_played else None
+    )
+    # Games that fail to format are skipped, so match entries back to rows by id
+    positions_by_id = defaultdict(deque)
+    for position, game_id in zip(positions.tolist(), games_df["id"].tolist()):
+        positions_by_id[game_id].append(position)
+    return [(positions_by_id[entry["id"]].popleft(), entry) for entry in entries]
+
+
+def iter_schedule_entries(games_df, events_df, games_played_df=None, workers=1, max_games=500):
+    """
+    Schedule entries formatted in-process (workers=1, or a single partition) or in a
+    process pool of workers processes (None = CPU count)
+    """
+    if workers == 1 or len(partition_games(games_df, max_games)) <= 1:
+        return GameFormatter.iter_complete_schedule(games_df, events_df, games_played_df)
+    return iter_complete_schedule_parallel(games_df, events_df, games_played_df, workers, max_games)
+
+
+def iter_complete_schedule_parallel(games_df, events_df, games_played_df=None, workers=None, max_games=500):
+    """
+    Yield the entries of GameFormatter.build_complete_schedule, formatted in a process pool
+    Partitions run concurrently; entries come back in the games table's row order, each
+    yielded as soon as every partition that could hold an earlier row has finished.
+    """
+    # By first row, so each finished prefix releases every row before the next partition starts
+    partitions = sorted(partition_games(games_df, max_games), key=lambda positions: positions[0])
+    if not partitions:
+        return
+
+    def rows_for(df, game_ids):
+        if df is None or df.empty:
+            return None
+        return pack_table(df[df["gameId"].isin(game_ids)])
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for positions in partitions:
+            partition = games_df.iloc[positions]
+            game_ids = set(partition["id"].tolist())
+            futures.append(pool.submit(
+                format_partition, positions, pack_table(partition),
+                rows_for(events_df, game_ids), rows_for(games_played_df, game_ids)
+            ))
+
+        try:
+            # (row position, entry) from finished partitions not yet yielded; positions are unique
+            pending = []
+            for index, future in enumerate(futures):
+                for item in future.result():
+                    heapq.heappush(pending, item)
+                next_start = partitions[index + 1][0] if index + 1 < len(partitions) else np.inf
+                while pending and pending[0][0] < next_start:
+                    yield heapq.heappop(pending)[1]
+        finally:
+            # A consumer that stops early shouldn't wait for partitions it will never read
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,74 @@
+"""
+Season archive operations module.
+Archives a closed season's schedule.json and players.json into the columnar
+season archive (src/data/archive.py), and recomputes goalie stats and
+standings over archived seasons from its memory-mapped columns.
+"""
+import os
+from src.data.archive import SeasonArchive
+from src.data.schedule_columns import ScheduleColumns
+from src.formatters.base import OutputManager
+from src.formatters.goalie_stats import GoalieStatsFormatter
+from src.utils import config
+
+
+class ArchiveOperations:
+    """Handles season archive operations."""
+
+    def __init__(self, archive_dir=None, league=None):
+        self.output_manager = OutputManager()
+        self.archive = SeasonArchive(archive_dir or config.ARCHIVE_DIR)
+        # Team ids of archive_goalie_stats.json (default: the registry's default league)
+        self.league = league
+
+    def archive_season(self, schedule_file_path="./output/schedule.json",
+                       players_file_path="./output/players.json", season_id=None):
+        """
+        Write one season (default CURRENT_SEASON_ID) to the archive, replacing any earlier copy
+        Returns the archived partition's metadata, or None if there is no schedule
+        """
+        season_id = str(season_id or config.CURRENT_SEASON_ID)
+        print(f"🗄️  Archiving season {season_id} from {schedule_file_path}...")
+
+        schedule_data = self.output_manager.load_json(schedule_file_path)
+        if not schedule_data:
+            print(f"❌ No schedule data found in {schedule_file_path}")
+            return None
+        players = self.output_manager.load_json(players_file_path) if os.path.exists(players_file_path) else None
+        if not isinstance(players, list):
+            print(f"⚠️  No players found in {players_file_path}; archiving without season stats")
+            players = []
+
+        meta = self.archive.write_season(season_id, schedule_data, players)
+
+        rows = ", ".join(f"{count} {table}" for table, count in meta["rows"].items())
+        print(f"✅ Season {season_id} archived to {self.archive.partition(season_id)} ({meta['format']}): {rows}")
+        return meta
+
+    def archive_stats(self, season_ids=None, output_dir="./output"):
+        """
+        Goalie stats and standings over archived seasons (all if None)
+        Writes archive_goalie_stats.json (goalie_stats.json layout) and archive_standings.json.
+        Returns (goalie records, standings rows), or None if nothing is archived
+        """
+        seasons = self.archive.seasons()
+        if season_ids is not None:
+            missing = [str(season) for season in season_ids if str(season) not in seasons]
+            if missing:
+                print(f"❌ Seasons not archived: {', '.join(missing)}")
+                return None
+            seasons = [str(season) for season in season_ids]
+        if not seasons:
+            print(f"❌ No archived seasons in {self.archive.root}")
+            return None
+        print(f"📈 Recomputing goalie stats and standings for seasons {', '.join(seasons)}...")
+
+        columns = ScheduleColumns(self.archive, seasons)
+        goalie_stats = GoalieStatsFormatter.format_goalie_stats(columns.goalie_stats(), self.league)
+        standings = columns.standings(self.league)
+
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_manager.save_json(goalie_stats, os.path.join(output_dir, "archive_goalie_stats.json"))
+        self.output_manager.save_json(standings, os.path.join(output_dir, "archive_standings.json"))
+        print(f"✅ {int(columns.played.sum())} played games: {len(goalie_stats)} goalies, {len(standings)} teams")
+        return goalie_stats, standings
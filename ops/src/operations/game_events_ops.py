@@ -0,0 +1,117 @@
+"""
+Game events ingestion module.
+Python port of appscript/gameEvents.gs (runGames / get_game_events / record_games_played):
+copies goals, penalties and lineups from game sheets into the master
+gameEvents and gamesPlayed sheets, appending one batch of rows to each.
+"""
+import re
+from src.data.sheets_client import SheetsClient
+from src.data.async_sheets_client import fetch_many
+from src.formatters.game_events import (
+    GameEventsFormatter, GAME_EVENTS_HEADERS, GAMES_PLAYED_HEADERS
+)
+from src.utils import config
+
+SPREADSHEET_URL_PATTERN = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
+
+
+def spreadsheet_id_from_link(link):
+    """Extract a spreadsheet ID from a Google Sheets URL (or return the ID unchanged)."""
+    match = SPREADSHEET_URL_PATTERN.search(str(link))
+    return match.group(1) if match else str(link).strip()
+
+
+class GameEventsOperations:
+    """Ingests game sheets into the master gameEvents and gamesPlayed sheets."""
+
+    def __init__(self, sheets_client=None):
+        self.sheets_client = sheets_client or SheetsClient(readonly=False)
+        self.formatter = GameEventsFormatter()
+
+    def get_game_links(self):
+        """Read game spreadsheet IDs from the master 'gamelinks' sheet."""
+        df_links = self.sheets_client.get_range(config.GAME_LINKS_RANGE)
+        if df_links.empty or len(df_links.columns) < 2:
+            return []
+        links = [link for link in df_links.iloc[:, 1].tolist() if link and str(link).strip()]
+        return [spreadsheet_id_from_link(link) for link in links]
+
+    def _load_key_index(self, range_name, key_columns):
+        """
+        Read only the key columns of a destination sheet.
+        Returns (set of existing keys, whether the sheet has a header row).
+        Raises HttpError if the sheet can't be read, so an unreadable sheet
+        is never mistaken for an empty one.
+        """
+        df = self.sheets_client.get_range(range_name, required=True)
+        if df.empty:
+            return set(), False
+
+        keys = set()
+        for row in df.iloc[1:].itertuples(index=False):
+            key = tuple(str(row[i]).strip() if i < len(row) and row[i] is not None else "" for i in key_columns)
+            keys.add(key)
+        return keys, True
+
+    def ingest_games(self, game_spreadsheet_ids=None):
+        """
+        Ingest events and lineups from game spreadsheets
+        Args:
+            game_spreadsheet_ids: IDs or URLs to ingest; defaults to the 'gamelinks' sheet
+        Returns dict with counts of appended events and games played rows
+        """
+        print("📥 Ingesting game events and lineups...")
+
+        if game_spreadsheet_ids is None:
+            game_spreadsheet_ids = self.get_game_links()
+        game_spreadsheet_ids = list(dict.fromkeys(spreadsheet_id_from_link(sid) for sid in game_spreadsheet_ids))
+        if not game_spreadsheet_ids:
+            print("❌ No game spreadsheets to ingest")
+            return {"events": 0, "games_played": 0}
+
+        # Fetch every game sheet concurrently (sheets that can't be read are reported and left out)
+        frames_by_sheet = fetch_many(game_spreadsheet_ids, config.GAME_RANGES)
+
+        # Hash indexes of rows already in the destination sheets
+        event_keys, events_have_header = self._load_key_index(config.GAME_EVENTS_KEYS_RANGE, (1, 0))
+        played_keys, played_have_header = self._load_key_index(config.GAMES_PLAYED_KEYS_RANGE, (0, 1, 2))
+
+        new_events = []
+        new_games_played = []
+        for spreadsheet_id in game_spreadsheet_ids:
+            if spreadsheet_id not in frames_by_sheet:
+                continue
+            game = self.formatter.format_game_sheet(frames_by_sheet[spreadsheet_id])
+            if game is None:
+                print(f"⚠️  Missing gameId or team names in {spreadsheet_id} - skipped")
+                continue
+
+            for row in game["events"]:
+                key = (str(row[1]), str(row[0]))
+                if key not in event_keys:
+                    event_keys.add(key)
+                    new_events.append(row)
+
+            for row in game["games_played"]:
+                key = (str(row[0]), str(row[1]), str(row[2]))
+                if key not in played_keys:
+                    played_keys.add(key)
+                    new_games_played.append(row)
+
+        appends = {}
+        if new_events:
+            rows = new_events if events_have_header else [GAME_EVENTS_HEADERS] + new_events
+            appends[f"{config.GAME_EVENTS_SHEET}!A1"] = rows
+        if new_games_played:
+            rows = new_games_played if played_have_header else [GAMES_PLAYED_HEADERS] + new_games_played
+            appends[f"{config.GAMES_PLAYED_SHEET}!A1"] = rows
+
+        if not appends:
+            print("ℹ️  No new data to append")
+        else:
+            # Appended after each sheet's table rather than at a computed row
+            for range_name, rows in appends.items():
+                self.sheets_client.append_values(range_name, rows)
+            print(f"✅ Appended {len(new_events)} game events and {len(new_games_played)} games played rows")
+
+        return {"events": len(new_events), "games_played": len(new_games_played)}
@@ -0,0 +1,51 @@
+"""
+Head-to-head operations module.
+Keeps head_to_head.npz / head_to_head.json up to date from schedule.json,
+applying only the games played since the last run.
+"""
+import os
+from src.formatters.base import OutputManager
+from src.formatters.head_to_head import HeadToHeadMatrix
+
+
+class HeadToHeadOperations:
+    """Handles head-to-head matrix operations."""
+
+    def __init__(self):
+        self.output_manager = OutputManager()
+        # Latest matrix, kept for in-process lookups (watch mode / read API)
+        self.matrix = None
+
+    def build_head_to_head(self, schedule_file_path="./output/schedule.json", output_dir="./output", rebuild=False):
+        """
+        Update the team x team matrix with newly played games
+        The saved .npz is reused unless a game already counted changed (score fix,
+        un-played game), in which case the matrix is rebuilt from the whole schedule.
+        Returns the HeadToHeadMatrix, or None if there is no schedule
+        """
+        print("🆚 Building head-to-head matrix from schedule.json...")
+
+        schedule_data = self.output_manager.load_json(schedule_file_path)
+        if not schedule_data:
+            print(f"❌ No schedule data found in {schedule_file_path}")
+            return None
+
+        npz_path = os.path.join(output_dir, "head_to_head.npz")
+        matrix = self.matrix
+        if matrix is None and not rebuild and os.path.exists(npz_path):
+            try:
+                matrix = HeadToHeadMatrix.load(npz_path)
+            except (OSError, KeyError, ValueError) as e:
+                print(f"⚠️  Could not load {npz_path} ({e}); rebuilding")
+        if matrix is None or rebuild or matrix.needs_rebuild(schedule_data):
+            matrix = HeadToHeadMatrix()
+
+        matrix.add_games(schedule_data)
+        print(f"📊 {matrix.added} new games applied ({len(matrix.games)} total, {len(matrix.teams)} teams)")
+
+        os.makedirs(output_dir, exist_ok=True)
+        matrix.save(npz_path)
+        self.output_manager.save_json(matrix.to_dict(), os.path.join(output_dir, "head_to_head.json"))
+
+        self.matrix = matrix
+        return matrix
@@ -0,0 +1,54 @@
+"""
+Leaderboard operations module.
+Writes leaders.json (top-k skaters and goalies per category, league and per
+team) from the player game log index, updating only what new games changed.
+"""
+import os
+from src.formatters.base import OutputManager
+from src.formatters.leaders import Leaderboards
+from src.formatters.player_logs import PlayerLogIndex
+from src.utils import config
+
+
+class LeaderboardOperations:
+    """Handles leaderboard operations."""
+
+    def __init__(self):
+        self.output_manager = OutputManager()
+        # Latest leaderboards and the index they were built from (watch mode / read API)
+        self.leaders = None
+        self._index = None
+
+    def build_leaders(self, schedule_file_path="./output/schedule.json",
+                      players_file_path="./output/players.json", output_dir="./output", index=None,
+                      season_id=None):
+        """
+        Update leaders.json
+        With the index kept by PlayerLogOperations only the players in index.changed
+        are re-ranked; otherwise the index is built from schedule.json.
+        Returns the Leaderboards, or None if there is no schedule
+        """
+        print("🏆 Building leaderboards...")
+
+        season_id = season_id or config.CURRENT_SEASON_ID
+
+        if index is None:
+            schedule_data = self.output_manager.load_json(schedule_file_path)
+            if not schedule_data:
+                print(f"❌ No schedule data found in {schedule_file_path}")
+                return None
+            players = self.output_manager.load_json(players_file_path) if os.path.exists(players_file_path) else None
+            index = PlayerLogIndex(players if isinstance(players, list) else []).add_schedule(
+                schedule_data, season_id
+            )
+
+        if self.leaders is not None and index is self._index:
+            scopes = self.leaders.update(index, index.changed)
+            print(f"📊 {len(index.changed)} players updated, {len(scopes)} boards recomputed")
+        else:
+            self.leaders = Leaderboards(season_id, config.LEADERS_TOP_K, config.LEADERS_MIN_GP)
+            self.leaders.update(index)
+        self._index = index
+
+        self.output_manager.save_json(self.leaders.to_dict(), os.path.join(output_dir, "leaders.json"))
+        return self.leaders
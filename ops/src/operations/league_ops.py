@@ -0,0 +1,141 @@
+"""
+Multi-league operations module.
+Runs operations for every registered league (src/utils/leagues.py) at once.
+Each league gets its own UHLOpsManager, Sheets client (range discovery cache)
+and output directory; only the Sheets rate limiter is shared, since every
+league reads through the same service account.
+"""
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.utils import config
+from src.utils.leagues import load_leagues, LeagueConfigError
+
+# Operations a league run can include: name -> (UHLOpsManager method, keyword arguments)
+LEAGUE_OPERATIONS = {
+    "players": ("process_players", {}),
+    "standings": ("process_standings", {}),
+    "games": ("process_all_games", {}),
+    "schedule": ("build_complete_schedule", {"keep_games": False}),
+    "goalie-stats": ("calculate_goalie_stats", {}),
+    "player-logs": ("build_player_logs", {}),
+    "head-to-head": ("build_head_to_head", {}),
+    "leaders": ("build_leaders", {}),
+}
+# Run order when no operations are given (player logs feed the leaderboards)
+DEFAULT_LEAGUE_OPERATIONS = (
+    "players", "standings", "schedule", "goalie-stats", "player-logs", "head-to-head", "leaders"
+)
+
+
+class LeagueOutput:
+    """
+    stdout wrapper that prefixes each line with the league its thread is running
+    Lines are written whole, so concurrent leagues don't interleave mid-line.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def set_league(self, key):
+        self._local.key = key
+        self._local.buffer = ""
+
+    def write(self, text):
+        key = getattr(self._local, "key", None)
+        if key is None:
+            return self.stream.write(text)
+        self._local.buffer += text
+        *lines, self._local.buffer = self._local.buffer.split("\n")
+        if lines:
+            with self._lock:
+                self.stream.write("".join(f"[{key}] {line}\n" for line in lines))
+        return len(text)
+
+    def flush(self):
+        key = getattr(self._local, "key", None)
+        if key is not None and self._local.buffer:
+            with self._lock:
+                self.stream.write(f"[{key}] {self._local.buffer}")
+            self._local.buffer = ""
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class LeagueOperations:
+    """Handles running operations across registered leagues."""
+
+    def __init__(self, manager_factory, leagues=None):
+        """
+        manager_factory: league -> UHLOpsManager for that league
+        leagues: League objects by key (default: load_leagues())
+        """
+        self.manager_factory = manager_factory
+        self.leagues = leagues if leagues is not None else load_leagues()
+
+    def select(self, league_keys=None):
+        """Registered leagues to run (all if None), in registry order"""
+        if league_keys is None:
+            return list(self.leagues.values())
+        unknown = [key for key in league_keys if key not in self.leagues]
+        if unknown:
+            raise LeagueConfigError(f"Unknown leagues: {', '.join(unknown)} (registered: {', '.join(self.leagues)})")
+        return [self.leagues[key] for key in league_keys]
+
+    def run_league(self, league, operations):
+        """Run operations in order for one league into its output directory; returns results by operation"""
+        os.makedirs(league.output_dir, exist_ok=True)
+        manager = self.manager_factory(league)
+        results = {}
+        for operation in operations:
+            method, kwargs = LEAGUE_OPERATIONS[operation]
+            results[operation] = getattr(manager, method)(output_dir=league.output_dir, **kwargs)
+        return results
+
+    def run(self, operations=None, league_keys=None, workers=None):
+        """
+        Run operations (default DEFAULT_LEAGUE_OPERATIONS) for the selected leagues concurrently
+        workers leagues run at once (default LEAGUE_WORKERS, or every league). A failing
+        league is reported and does not stop the others.
+        Returns {league key: (results by operation, or None, error message or None)}
+        """
+        operations = list(operations or DEFAULT_LEAGUE_OPERATIONS)
+        unknown = [operation for operation in operations if operation not in LEAGUE_OPERATIONS]
+        if unknown:
+            raise ValueError(f"Unknown league operations: {', '.join(unknown)} "
+                             f"(expected {', '.join(LEAGUE_OPERATIONS)})")
+        leagues = self.select(league_keys)
+        workers = workers or config.LEAGUE_WORKERS or len(leagues)
+        print(f"🏒 Running {', '.join(operations)} for {len(leagues)} leagues ({workers} at a time)...")
+
+        output = LeagueOutput(sys.stdout)
+
+        def run_one(league):
+            output.set_league(league.key)
+            try:
+                return self.run_league(league, operations), None
+            except Exception as e:
+                print(f"❌ {type(e).__name__}: {e}")
+                return None, str(e) or type(e).__name__
+            finally:
+                output.flush()
+                output.set_league(None)
+
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="uhl-league") as pool:
+                outcomes = dict(zip([league.key for league in leagues], pool.map(run_one, leagues)))
+        finally:
+            sys.stdout = output.stream
+
+        failed = [key for key, (_, error) in outcomes.items() if error]
+        for league in leagues:
+            status = f"❌ {outcomes[league.key][1]}" if league.key in failed else f"✅ {league.output_dir}"
+            print(f"  {league.key:<12} {status}")
+        print(f"✅ {len(leagues) - len(failed)}/{len(leagues)} leagues processed")
+        return outcomes
@@ -0,0 +1,75 @@
+"""
+Player game log operations module.
+Builds player_logs/<id>.json and an in-memory PlayerLogIndex from schedule.json.
+"""
+import json
+import os
+from src.formatters.base import OutputManager
+from src.formatters.player_logs import PlayerLogIndex
+from src.utils import config
+
+
+class PlayerLogOperations:
+    """Handles player game log operations."""
+
+    def __init__(self):
+        self.output_manager = OutputManager()
+        # Latest index, kept for in-process lookups (watch mode / read API)
+        self.index = None
+        self._players_fingerprint = None
+
+    def build_player_logs(self, schedule_file_path="./output/schedule.json",
+                          players_file_path="./output/players.json", output_dir="./output", season_id=None):
+        """
+        Build game logs for every player in one pass over the schedule
+        Writes player_logs/<id>.json per player and player_logs/index.json
+        A kept index only adds games played since the last build (and only rewrites
+        those players' files) unless a game already added was edited.
+        Returns the PlayerLogIndex, or None if there is no schedule
+        """
+        print("📒 Building player game logs from schedule.json...")
+
+        schedule_data = self.output_manager.load_json(schedule_file_path)
+        if not schedule_data:
+            print(f"❌ No schedule data found in {schedule_file_path}")
+            return None
+
+        # players.json may be missing or a planning-phase status payload
+        players = self.output_manager.load_json(players_file_path) if os.path.exists(players_file_path) else None
+        if not isinstance(players, list):
+            players = []
+
+        season_id = season_id or config.CURRENT_SEASON_ID
+        # Player ids come from players.json, so a players change also rebuilds
+        players_fingerprint = PlayerLogIndex.fingerprint(players)
+        index = self.index
+        if (index is None or players_fingerprint != self._players_fingerprint
+                or index.needs_rebuild(schedule_data, season_id)):
+            index = PlayerLogIndex(players)
+            rebuilt = True
+        else:
+            rebuilt = False
+        index.add_schedule(schedule_data, season_id)
+
+        logs_dir = os.path.join(output_dir, "player_logs")
+        os.makedirs(logs_dir, exist_ok=True)
+        for player_id in (index.logs if rebuilt else index.changed):
+            with open(os.path.join(logs_dir, f"{player_id}.json"), 'w') as f:
+                json.dump(index.logs[player_id], f, indent=4)
+        if rebuilt:
+            # Players no longer in the index (removed from players.json, or no games left)
+            current = {f"{player_id}.json" for player_id in index.logs} | {"index.json"}
+            stale = [name for name in os.listdir(logs_dir) if name.endswith(".json") and name not in current]
+            for name in stale:
+                os.remove(os.path.join(logs_dir, name))
+            if stale:
+                print(f"🗑️  Removed {len(stale)} stale game logs")
+        self.output_manager.save_json(index.summary(), os.path.join(logs_dir, "index.json"))
+
+        if rebuilt:
+            print(f"✅ Game logs for {len(index.logs)} players saved to {logs_dir}")
+        else:
+            print(f"✅ Game logs for {len(index.changed)} updated players saved to {logs_dir}")
+        self.index = index
+        self._players_fingerprint = players_fingerprint
+        return index
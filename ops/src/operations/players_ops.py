@@ -4,6 +4,7 @@ Handles all player-related business logic.
 """
 import os
 from src.data.sheets_client import SheetsClient
+from src.data.rate_limit import SheetsUnavailableError
 from src.formatters.players import PlayerFormatter
 from src.formatters.base import OutputManager
 from src.utils import config
@@ -23,8 +24,8 @@ class PlayerOperations:
         
         try:
             # Fetch player data using config ranges
-            df_players = self.sheets_client.get_range(config.PLAYERS_RANGE)
-            df_season = self.sheets_client.get_range(config.PLAYERS_SEASON_RANGE)
+            df_players = self.sheets_client.get_sheet("players")
+            df_season = self.sheets_client.get_sheet("players_season")
             
             if df_players.empty:
                 print("❌ No players data found")
@@ -50,6 +51,9 @@ class PlayerOperations:
             print(f"✅ {len(combined_data)} players saved to {output_path}")
             return combined_data
             
+        except SheetsUnavailableError:
+            # Outages must reach the caller rather than become an "error" status file
+            raise
         except Exception as e:
             print(f"❌ Error processing players: {e}")
             return self._save_status(f"Error processing players: {e}", "error", output_dir)
@@ -0,0 +1,58 @@
+"""
+Referee assignment operations module.
+Fills empty Ref1/Ref2 fields of upcoming games in schedule.json from the
+referee availability file.
+"""
+import os
+from src.formatters.base import OutputManager
+from src.scheduling.referees import RefereeAssigner
+from src.utils import config
+
+
+class RefereeOperations:
+    """Handles referee assignment operations."""
+
+    def __init__(self):
+        self.output_manager = OutputManager()
+
+    def assign_referees(self, schedule_file_path="./output/schedule.json", referees_file_path=None,
+                        output_dir="./output"):
+        """
+        Assign referees to unplayed games whose Ref1/Ref2 are TBD or blank
+        Refs already named in schedule.json are kept. Returns the updated schedule,
+        or None if the schedule or referee file is missing
+        """
+        print("🦓 Assigning referees...")
+
+        referees_file_path = referees_file_path or config.REFEREES_FILE
+        if not os.path.exists(referees_file_path):
+            print(f"❌ Referee file not found: {referees_file_path}")
+            return None
+        referees = self.output_manager.load_json(referees_file_path)
+        if not isinstance(referees, list) or not referees:
+            print(f"❌ No referees listed in {referees_file_path}")
+            return None
+
+        schedule_data = self.output_manager.load_json(schedule_file_path)
+        if not schedule_data:
+            print(f"❌ No schedule data found in {schedule_file_path}")
+            return None
+
+        try:
+            assigner = RefereeAssigner(referees, config.REF_MAX_GAMES_PER_NIGHT, config.REFS_PER_GAME)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return None
+        unfilled = assigner.assign(schedule_data)
+
+        self.output_manager.save_json(schedule_data, os.path.join(output_dir, "schedule.json"))
+
+        print(f"{'Referee':<20} {'Games':<5}")
+        print("-" * 26)
+        for name, games in sorted(assigner.loads.items(), key=lambda item: (-item[1], item[0])):
+            print(f"{name:<20} {games:<5}")
+        if unfilled:
+            print(f"⚠️  {len(unfilled)} games still need referees: {', '.join(unfilled)}")
+        else:
+            print("✅ Every upcoming game has referees")
+        return schedule_data
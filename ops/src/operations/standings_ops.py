@@ -4,7 +4,8 @@ Handles team standings business logic.
 """
 import os
 from src.data.sheets_client import SheetsClient
-from src.formatters.goalie_stats import StandingsFormatter, GoalieStatsFormatter
+from src.data.rate_limit import SheetsUnavailableError
+from src.formatters.goalie_stats import StandingsFormatter, GoalieStatsFormatter, GOALIE_GAME_FIELDS
 from src.formatters.base import OutputManager
 from src.utils import config
 
@@ -23,7 +24,7 @@ class StandingsOperations:
         
         try:
             # Fetch standings data
-            df_standings = self.sheets_client.get_range(config.STANDINGS_RANGE)
+            df_standings = self.sheets_client.get_sheet("standings")
             
             if df_standings.empty:
                 print("❌ No standings data found")
@@ -44,6 +45,8 @@ class StandingsOperations:
             print(f"✅ Standings data saved to {output_path}")
             return standings
             
+        except SheetsUnavailableError:
+            raise
         except Exception as e:
             print(f"❌ Error processing standings: {e}")
             return []
@@ -61,35 +64,43 @@ class GoalieStatsOperations:
         print("Calculating goalie statistics from schedule.json...")
         
         try:
-            if not os.path.exists(schedule_file_path):
-                print(f"❌ Schedule file not found: {schedule_file_path}")
+            # Streamed one game at a time; only played games' goalie lines are kept
+            games = self.output_manager.stream_json(schedule_file_path, fields=GOALIE_GAME_FIELDS)
+            schedule_data = list(self.formatter.goalie_games(games)) if games is not None else None
+            if schedule_data is None:
+                print(f"❌ No schedule data found in {schedule_file_path}")
                 return []
             
             # Calculate stats
-            goalie_stats = self.formatter.calculate_goalie_stats_from_schedule(schedule_file_path)
+            goalie_stats = self.formatter.calculate_goalie_stats_from_schedule(schedule_data)
+            formatted_stats = self.formatter.format_goalie_stats(goalie_stats)
             
-            if not goalie_stats:
+            if not formatted_stats:
                 print("⚠️  No goalie statistics calculated")
                 return []
             
             # Save to output
             os.makedirs(output_dir, exist_ok=True)
             output_path = os.path.join(output_dir, "goalie_stats.json")
-            self.output_manager.save_json(goalie_stats, output_path)
+            self.output_manager.save_json(formatted_stats, output_path)
             
             # Print summary
-            print(f"\nCalculated statistics for {len(goalie_stats)} goalies:")
-            print("Name                 Team       GP  W   L   T   SO  GA  GAA   Record  ")
+            print(f"\nCalculated statistics for {len(formatted_stats)} goalies:")
+            print(f"{'Name':<20} {'Team':<5} {'GP':<3} {'W':<3} {'L':<3} {'T':<3} {'SO':<3} {'GA':<3} {'GAA':<5} {'Record':<8}")
             print("-" * 80)
             
-            for goalie in goalie_stats:
-                record = f"{goalie['W']}-{goalie['L']}-{goalie['T']}"
-                print(f"{goalie['name']:<20} {goalie['team']:<10} {goalie['GP']:<3} {goalie['W']:<3} "
-                      f"{goalie['L']:<3} {goalie['T']:<3} {goalie['SO']:<3} {goalie['GA']:<3} "
-                      f"{goalie['GAA']:<5.2f} {record:<7}")
+            for goalie in formatted_stats:
+                full_name = f"{goalie['firstName']} {goalie['lastName']}"
+                season = goalie['seasons'][0]
+                record = f"{season['W']}-{season['L']}-{season['T']}"
+                print(f"{full_name:<20} {season['Team']:<5} {season['GP']:<3} {season['W']:<3} "
+                      f"{season['L']:<3} {season['T']:<3} {season['SO']:<3} {season['GA']:<3} "
+                      f"{season['GAA']:<5} {record:<8}")
             
-            return goalie_stats
+            return formatted_stats
             
+        except SheetsUnavailableError:
+            raise
         except Exception as e:
             print(f"❌ Error calculating goalie stats: {e}")
             return []
@@ -0,0 +1,248 @@
+"""
+Watch mode operations module.
+Keeps one authenticated client and the fetched sheets warm in memory, polls
+Drive for spreadsheet changes (or a local trigger file) and re-runs only the
+stages whose input sheets actually changed.
+"""
+import os
+import time
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from src.data.rate_limit import SheetsUnavailableError
+from src.data.schema import SchemaError
+from src.utils import config
+
+DRIVE_METADATA_SCOPE = 'https://www.googleapis.com/auth/drive.metadata.readonly'
+
+# Stages in run order, with the player spreadsheet sheets (SHEET_EXTENTS names) each one reads
+STAGE_INPUTS = {
+    "players": ("players", "players_season"),
+    "standings": ("standings",),
+    "all-games": ("games",),
+    "schedule": ("games", "game_events", "games_played"),
+}
+# Stages computed from another stage's output rather than from sheets
+STAGE_DEPENDENTS = {
+    "players": ("player-logs", "leaders"),
+    "schedule": ("goalie-stats", "player-logs", "leaders", "head-to-head"),
+}
+STAGE_ORDER = [
+    "players", "standings", "all-games", "schedule", "goalie-stats", "player-logs", "leaders", "head-to-head",
+    "single-game"
+]
+
+
+class DriveChangeDetector:
+    """Detects spreadsheet edits from their Drive modifiedTime (one cheap metadata call each)."""
+
+    def __init__(self, credentials, guard):
+        self.guard = guard
+        self.service = build('drive', 'v3', credentials=credentials.with_scopes([DRIVE_METADATA_SCOPE]))
+        self._modified = {}
+        self._pending = {}
+
+    def changed(self, spreadsheet_ids):
+        """
+        Return the IDs whose modifiedTime moved since the last commit() (all of them on the first check)
+        The new times are only remembered once commit() confirms the change was processed.
+        """
+        changed = []
+        for spreadsheet_id in spreadsheet_ids:
+            request = self.service.files().get(
+                fileId=spreadsheet_id, fields="modifiedTime", supportsAllDrives=True
+            )
+            modified = self.guard.call(request.execute, f"Checking {spreadsheet_id} for changes").get("modifiedTime")
+            if self._modified.get(spreadsheet_id) != modified:
+                self._pending[spreadsheet_id] = modified
+                changed.append(spreadsheet_id)
+        return changed
+
+    def commit(self):
+        """Remember the modifiedTimes seen by the last changed() call"""
+        self._modified.update(self._pending)
+        self._pending = {}
+
+
+class LocalTrigger:
+    """Fires when a trigger file is created or touched (e.g. `touch output/.refresh`)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._mtime = self._read_mtime()
+
+    def _read_mtime(self):
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def fired(self):
+        mtime = self._read_mtime()
+        if mtime is not None and mtime != self._mtime:
+            self._mtime = mtime
+            return True
+        return False
+
+
+class WatchOperations:
+    """Long-running refresh loop around a UHLOpsManager with a WarmSheetsClient."""
+
+    def __init__(self, manager, output_dir="./output", poll_seconds=None, trigger_file=None, listeners=None):
+        self.manager = manager
+        self.sheets_client = manager.sheets_client
+        self.output_dir = output_dir
+        self.poll_seconds = poll_seconds or config.WATCH_POLL_SECONDS
+        self.trigger = LocalTrigger(trigger_file or config.WATCH_TRIGGER_FILE)
+
+        # Latest output of every stage, kept in memory for other consumers
+        self.outputs = {}
+        # Callables (stage, output) notified after each stage runs, e.g. the read API store
+        self.listeners = list(listeners or [])
+        self._fingerprints = {}
+        # Fingerprints read this cycle, kept once its stages have run
+        self._pending_fingerprints = {}
+        # Spreadsheet types of a failed cycle, re-read until a cycle succeeds
+        self._retry_types = set()
+
+        try:
+            self.detector = DriveChangeDetector(self.sheets_client.credentials, self.sheets_client.guard)
+        except Exception as e:
+            print(f"⚠️  Drive change detection unavailable ({e}); sheets will be re-read every poll")
+            self.detector = None
+
+    def _run_stage(self, stage):
+        if stage == "players":
+            return self.manager.process_players(self.output_dir)
+        if stage == "standings":
+            return self.manager.process_standings(self.output_dir)
+        if stage == "all-games":
+            return self.manager.process_all_games(self.output_dir)
+        if stage == "schedule":
+            return self.manager.build_complete_schedule(self.output_dir)
+        if stage == "goalie-stats":
+            return self.manager.calculate_goalie_stats(self.output_dir)
+        if stage == "player-logs":
+            return self.manager.build_player_logs(self.output_dir)
+        if stage == "leaders":
+            return self.manager.build_leaders(self.output_dir)
+        if stage == "head-to-head":
+            return self.manager.build_head_to_head(self.output_dir)
+        if stage == "single-game":
+            return self.manager.process_single_game(self.output_dir)
+        raise ValueError(f"Unknown stage: {stage}")
+
+    def _changed_spreadsheets(self):
+        """Return the spreadsheet types ('player', 'game') that may have changed since the last poll."""
+        all_types = {"player", "game"}
+        if self.trigger.fired():
+            print(f"🔔 Trigger file {self.trigger.path} touched")
+            return all_types
+        if self.detector is None:
+            return all_types
+
+        ids = {"player": self.sheets_client.player_spreadsheet_id}
+        if self.sheets_client.game_spreadsheet_id:
+            ids["game"] = self.sheets_client.game_spreadsheet_id
+        try:
+            changed = set(self.detector.changed(list(ids.values())))
+        except HttpError as e:
+            print(f"⚠️  Drive change detection failed ({e}); sheets will be re-read every poll")
+            self.detector = None
+            return all_types
+        return {spreadsheet_type for spreadsheet_type, sid in ids.items() if sid in changed}
+
+    def affected_stages(self, spreadsheet_types):
+        """
+        Re-read the sheets of the changed spreadsheets and work out which stages need to run
+        Player sheets are compared by content hash, so an edit to gameEvents re-runs the
+        schedule but leaves players and standings alone.
+        """
+        stages = set()
+
+        if "player" in spreadsheet_types:
+            self.sheets_client.refresh("player")
+            names = sorted({name for inputs in STAGE_INPUTS.values() for name in inputs})
+            fingerprints = self.sheets_client.fingerprints(names)
+            changed = {name for name in names if self._fingerprints.get(name) != fingerprints[name]}
+            self._pending_fingerprints = fingerprints
+            if changed:
+                print(f"📝 Changed sheets: {', '.join(sorted(changed))}")
+            stages.update(stage for stage, inputs in STAGE_INPUTS.items() if changed.intersection(inputs))
+
+        if "game" in spreadsheet_types and self.sheets_client.game_spreadsheet_id:
+            self.sheets_client.refresh("game")
+            stages.add("single-game")
+
+        for stage in list(stages):
+            stages.update(STAGE_DEPENDENTS.get(stage, ()))
+        return stages
+
+    def run_stages(self, stages):
+        """Run the given stages in dependency order and keep their outputs"""
+        started = time.monotonic()
+        ordered = [stage for stage in STAGE_ORDER if stage in stages]
+        for stage in ordered:
+            self.outputs[stage] = self._run_stage(stage)
+            for listener in self.listeners:
+                listener(stage, self.outputs[stage])
+        print(f"✅ Refreshed {', '.join(ordered)} in {time.monotonic() - started:.1f}s")
+        return ordered
+
+    def poll_once(self):
+        """
+        One watch cycle; returns the stages that were re-run
+        Change markers (modifiedTime, sheet fingerprints) are only kept once every stage
+        has run, so a cycle that raises is repeated in full on the next poll.
+        """
+        spreadsheet_types = self._changed_spreadsheets() | self._retry_types
+        if not spreadsheet_types:
+            return []
+        self._retry_types = spreadsheet_types
+
+        stages = self.affected_stages(spreadsheet_types)
+        ordered = self.run_stages(stages) if stages else []
+
+        if self.detector is not None:
+            self.detector.commit()
+        self._fingerprints.update(self._pending_fingerprints)
+        self._pending_fingerprints = {}
+        self._retry_types = set()
+        return ordered
+
+    def run(self, max_cycles=None):
+        """
+        Poll until interrupted (Ctrl+C)
+        The first cycle builds every output; later cycles only re-run affected stages.
+        A failing cycle (Sheets outage, layout change, auth/network or write errors) is
+        reported and retried, waiting twice as long after each consecutive failure (up to
+        WATCH_MAX_BACKOFF_SECONDS), leaving the last good outputs in place. Only Ctrl+C
+        stops the loop.
+        """
+        print(f"👀 Watching for changes every {self.poll_seconds:g}s "
+              f"(touch {self.trigger.path} to force a refresh)")
+        cycles = 0
+        failures = 0
+        try:
+            while True:
+                try:
+                    self.poll_once()
+                    failures = 0
+                except (SheetsUnavailableError, SchemaError) as e:
+                    failures += 1
+                    print(f"⚠️  Refresh failed, keeping previous outputs: {e}")
+                except Exception as e:
+                    # Anything else (token refresh, sockets, disk) must not end the daemon
+                    failures += 1
+                    print(f"❌ Refresh failed with {type(e).__name__}, keeping previous outputs: {e}")
+
+                cycles += 1
+                if max_cycles is not None and cycles >= max_cycles:
+                    break
+                wait = self.poll_seconds
+                if failures:
+                    wait = min(wait * 2 ** (failures - 1), max(config.WATCH_MAX_BACKOFF_SECONDS, wait))
+                    print(f"⏳ Retrying in {wait:g}s")
+                time.sleep(wait)
+        except KeyboardInterrupt:
+            print("\n👋 Watch stopped")
+        return self.outputs
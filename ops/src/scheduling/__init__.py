@@ -0,0 +1 @@
+# Schedule generation modules
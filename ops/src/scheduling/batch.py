@@ -0,0 +1,146 @@
+"""
+Batch schedule outputs.
+Writes generated seasons as CSV plus Parquet/Feather under
+schedules/season=<year>/division=<name>/, keeps schedules/index.json listing
+every season and division, and loads them back as one DataFrame.
+pyarrow is required (requirements.txt); without it only the CSVs are written
+and read, with a warning.
+"""
+import json
+import os
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401 - pandas uses it for Parquet and Feather
+    COLUMNAR_AVAILABLE = True
+except ImportError:  # degraded CSV-only mode; see warn_csv_only()
+    COLUMNAR_AVAILABLE = False
+
+SCHEDULES_DIR = "schedules"
+INDEX_FILE = "index.json"
+SCHEDULE_DATE_FORMAT = "%m-%d-%Y"
+# Columns season_frame adds to the generated rows (not stored in the CSVs)
+DERIVED_COLUMNS = ("Season", "Division", "GameDate")
+
+_warned_csv_only = False
+
+
+def warn_csv_only():
+    """Warn once per process that schedules fall back to CSV because pyarrow is missing"""
+    global _warned_csv_only
+    if not COLUMNAR_AVAILABLE and not _warned_csv_only:
+        print("⚠️  pyarrow not installed; schedules are written and read as CSV only "
+              "(pip install -r requirements.txt for Parquet/Feather)")
+        _warned_csv_only = True
+
+
+def partition_dir(output_dir, season, division):
+    """Hive-style partition directory, readable as one dataset by pyarrow/pandas"""
+    return os.path.join(output_dir, SCHEDULES_DIR, f"season={season}", f"division={division}")
+
+
+def season_frame(records, season, division):
+    """Generated schedule rows as a typed DataFrame (numeric ids, real dates)"""
+    df = pd.DataFrame(records)
+    if df.empty:
+        return df
+    df.insert(0, "Season", int(season))
+    df.insert(1, "Division", str(division))
+    if "id" in df:
+        df["id"] = pd.to_numeric(df["id"])
+    if "Date" in df:
+        df["GameDate"] = pd.to_datetime(df["Date"], format=SCHEDULE_DATE_FORMAT)
+    return df
+
+
+def write_season(records, output_dir, season, division):
+    """
+    Write one season/division as schedule.csv, .parquet and .feather (CSV only without pyarrow)
+    Returns the index entry for it
+    """
+    directory = partition_dir(output_dir, season, division)
+    os.makedirs(directory, exist_ok=True)
+
+    # The CSV keeps the sheet import columns as generated
+    csv_path = os.path.join(directory, "schedule.csv")
+    pd.DataFrame(records).to_csv(csv_path, index=False)
+    files = {"csv": os.path.relpath(csv_path, output_dir)}
+
+    warn_csv_only()
+    if COLUMNAR_AVAILABLE and records:
+        df = season_frame(records, season, division)
+        parquet_path = os.path.join(directory, "schedule.parquet")
+        feather_path = os.path.join(directory, "schedule.feather")
+        df.to_parquet(parquet_path, index=False)
+        df.to_feather(feather_path)
+        files["parquet"] = os.path.relpath(parquet_path, output_dir)
+        files["feather"] = os.path.relpath(feather_path, output_dir)
+
+    teams = sorted({record["Home"] for record in records} | {record["Away"] for record in records})
+    return {
+        "season": int(season),
+        "division": str(division),
+        "games": len(records),
+        "teams": teams,
+        "start": records[0]["Date"] if records else "",
+        "end": records[-1]["Date"] if records else "",
+        "files": files,
+    }
+
+
+def write_index(entries, output_dir):
+    """
+    Merge entries into schedules/index.json (one per season and division)
+    Re-generated seasons replace their previous entry.
+    """
+    path = os.path.join(output_dir, SCHEDULES_DIR, INDEX_FILE)
+    index = {(entry["season"], entry["division"]): entry for entry in load_index(output_dir)}
+    index.update({(entry["season"], entry["division"]): entry for entry in entries})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump([index[key] for key in sorted(index)], f, indent=4)
+    return path
+
+
+def load_index(output_dir):
+    """Season index entries, or [] before the first batch run"""
+    path = os.path.join(output_dir, SCHEDULES_DIR, INDEX_FILE)
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def read_csv_season(path, entry, columns=None):
+    """One indexed CSV as a typed season frame, parsing only the CSV columns that columns needs"""
+    usecols = None
+    if columns:
+        needed = set(columns) - set(DERIVED_COLUMNS)
+        if "GameDate" in columns:
+            needed.add("Date")
+        usecols = lambda name: name in needed  # noqa: E731
+    df = season_frame(pd.read_csv(path, dtype=str, usecols=usecols), entry["season"], entry["division"])
+    return df[columns] if columns and not df.empty else df
+
+
+def load_seasons(output_dir, seasons=None, divisions=None, columns=None):
+    """
+    Load indexed schedules into one DataFrame, reading Parquet where available
+    seasons / divisions filter via the index before any file is opened;
+    columns limits what is read from Parquet files (and CSVs, in the degraded mode).
+    """
+    warn_csv_only()
+    frames = []
+    for entry in load_index(output_dir):
+        if seasons is not None and entry["season"] not in seasons:
+            continue
+        if divisions is not None and entry["division"] not in divisions:
+            continue
+        files = entry["files"]
+        if COLUMNAR_AVAILABLE and "parquet" in files:
+            frames.append(pd.read_parquet(os.path.join(output_dir, files["parquet"]), columns=columns))
+        else:
+            frames.append(read_csv_season(os.path.join(output_dir, files["csv"]), entry, columns))
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
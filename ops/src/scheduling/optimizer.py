@@ -0,0 +1,248 @@
+"""
+Schedule optimizer.
+Improves a round-robin seed with simulated annealing: games swap or move between
+(date, slot, rink) cells while an incrementally maintained cost tracks
+double-booked teams, team unavailable dates, back-to-backs and uneven
+early/late slots. Only the teams of the moved games are re-scored per step.
+"""
+import math
+import random
+import time
+import numpy as np
+
+# Cost per violation; hard constraints outweigh any amount of soft ones in practice
+DEFAULT_WEIGHTS = {
+    "double_booked": 1000.0,
+    "unavailable": 1000.0,
+    "back_to_back": 10.0,
+    "slot_balance": 1.0,
+}
+
+
+class ScheduleConstraints:
+    """
+    What a good schedule avoids
+    blackout_dates: dates with no games at all (holidays)
+    unavailable: team index -> dates that team cannot play
+    min_rest_days: games of a team fewer days apart than this are back-to-backs
+    """
+
+    def __init__(self, blackout_dates=None, unavailable=None, min_rest_days=2, weights=None):
+        self.blackout_dates = set(blackout_dates or [])
+        self.unavailable = {team: set(dates) for team, dates in (unavailable or {}).items()}
+        self.min_rest_days = min_rest_days
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+
+    def open_dates(self, dates):
+        """Candidate game dates without the blackouts"""
+        return [date for date in dates if date not in self.blackout_dates]
+
+
+class ScheduleOptimizer:
+    """
+    Simulated annealing over the game -> cell assignment of a RoundRobinSchedule
+    Pairings and home/away are kept; only dates, slots and rinks change. dates are
+    the schedule's date list (blackouts already removed); dates the seed leaves
+    empty give the optimizer room to move games.
+    """
+
+    def __init__(self, schedule, dates, constraints=None, seed=None):
+        self.schedule = schedule
+        self.dates = list(dates)
+        self.constraints = constraints or ScheduleConstraints()
+        self.weights = self.constraints.weights
+        self.random = random.Random(seed)
+
+        blackouts = sorted(self.constraints.blackout_dates.intersection(self.dates))
+        if blackouts:
+            raise ValueError(f"Blackout dates must be removed from the schedule dates: {blackouts}")
+        if schedule.dates_needed > len(self.dates):
+            raise ValueError(f"Schedule needs {schedule.dates_needed} game dates, only {len(self.dates)} available")
+
+        self.team_count = schedule.team_count
+        self.slots = schedule.slots
+        self.rinks = schedule.rinks
+        self.cells_per_date = self.slots * self.rinks
+
+        # Game state as plain lists (faster than numpy for single-element updates)
+        self.home = schedule.home.tolist()
+        self.away = schedule.away.tolist()
+        self.cell = (
+            (schedule.date_index * self.cells_per_date) + schedule.slot * self.rinks + schedule.rink
+        ).tolist()
+        self.occupant = [-1] * (len(self.dates) * self.cells_per_date)
+        for game, cell in enumerate(self.cell):
+            self.occupant[cell] = game
+
+        # Dates close enough to each date to count as back-to-back
+        ordinals = [date.toordinal() for date in self.dates]
+        rest = self.constraints.min_rest_days
+        self.neighbors = [
+            [other for other, other_ordinal in enumerate(ordinals)
+             if other != index and abs(other_ordinal - ordinal) < rest]
+            for index, ordinal in enumerate(ordinals)
+        ]
+        self.unavailable = [
+            {index for index, date in enumerate(self.dates) if date in self.constraints.unavailable.get(team, ())}
+            for team in range(self.team_count)
+        ]
+
+        # Per-team counts by date and by slot
+        self.team_dates = [[0] * len(self.dates) for _ in range(self.team_count)]
+        self.team_slots = [[0] * self.slots for _ in range(self.team_count)]
+        games_per_team = np.bincount(schedule.home, minlength=self.team_count) + \
+            np.bincount(schedule.away, minlength=self.team_count)
+        self.slot_target = (games_per_team / self.slots).tolist()
+        # Slot deltas are relative to empty slots; this makes the cost sum((count - target)^2)
+        self._slot_offset = self.weights["slot_balance"] * self.slots * sum(
+            target ** 2 for target in self.slot_target
+        )
+        # Best achievable cost: games that do not split evenly over the slots
+        remainders = (games_per_team % self.slots).tolist()
+        fractions = [target % 1 for target in self.slot_target]
+        self.floor = self.weights["slot_balance"] * sum(
+            remainder * (1 - fraction) ** 2 + (self.slots - remainder) * fraction ** 2
+            for remainder, fraction in zip(remainders, fractions)
+        )
+
+        self.cost = self._slot_offset
+        for game, cell in enumerate(self.cell):
+            self.cost += self._place(game, cell, 1)
+
+    def _appearance(self, team, date, slot, sign):
+        """Update one team appearance and return the change in cost"""
+        dates = self.team_dates[team]
+        slots = self.team_slots[team]
+        weights = self.weights
+        if sign < 0:
+            dates[date] -= 1
+            slots[slot] -= 1
+
+        delta = 0.0
+        if dates[date] > 0:
+            delta += weights["double_booked"]
+        if date in self.unavailable[team]:
+            delta += weights["unavailable"]
+        nearby = 0
+        for other in self.neighbors[date]:
+            nearby += dates[other]
+        delta += weights["back_to_back"] * nearby
+        # (c + 1 - target)^2 - (c - target)^2
+        delta += weights["slot_balance"] * (2 * (slots[slot] - self.slot_target[team]) + 1)
+
+        if sign > 0:
+            dates[date] += 1
+            slots[slot] += 1
+        return delta * sign
+
+    def _place(self, game, cell, sign):
+        date, position = divmod(cell, self.cells_per_date)
+        slot = position // self.rinks
+        return (self._appearance(self.home[game], date, slot, sign)
+                + self._appearance(self.away[game], date, slot, sign))
+
+    def _move(self, game, cell):
+        """Move a game to a cell, swapping with its occupant; returns the change in cost"""
+        source = self.cell[game]
+        other = self.occupant[cell]
+        delta = self._place(game, source, -1)
+        if other >= 0:
+            delta += self._place(other, cell, -1)
+        delta += self._place(game, cell, 1)
+        self.cell[game], self.occupant[cell] = cell, game
+        if other >= 0:
+            delta += self._place(other, source, 1)
+            self.cell[other], self.occupant[source] = source, other
+        else:
+            self.occupant[source] = -1
+        return delta
+
+    def optimize(self, max_seconds=5.0, max_iterations=None, start_temperature=None, end_temperature=0.05):
+        """
+        Anneal until the time or iteration budget runs out or nothing is left to improve
+        Returns the best cost found; the schedule's date_index / slot / rink arrays
+        are updated to the best assignment.
+        """
+        if not self.cell:
+            return 0.0
+        if start_temperature is None:
+            start_temperature = self.weights["back_to_back"] * 2
+        iterations = max_iterations or 2_000_000
+        cell_count = len(self.occupant)
+        game_count = len(self.cell)
+
+        best_cost, best_cells = self.cost, list(self.cell)
+        started = time.monotonic()
+        temperature = start_temperature
+        cooling = (end_temperature / start_temperature) ** (1.0 / iterations)
+
+        for iteration in range(iterations):
+            if iteration % 1000 == 0:
+                elapsed = time.monotonic() - started
+                if elapsed >= max_seconds:
+                    break
+                if max_iterations is None and iteration:
+                    # Time-boxed runs cool on the clock instead of the iteration count
+                    temperature = start_temperature * (end_temperature / start_temperature) ** (elapsed / max_seconds)
+
+            game = self.random.randrange(game_count)
+            cell = self.random.randrange(cell_count)
+            if cell == self.cell[game]:
+                continue
+
+            source = self.cell[game]
+            delta = self._move(game, cell)
+            if delta <= 0 or self.random.random() < math.exp(-delta / temperature):
+                self.cost += delta
+                if self.cost < best_cost - 1e-9:
+                    best_cost, best_cells = self.cost, list(self.cell)
+                    if best_cost <= self.floor + 1e-9:
+                        break
+            else:
+                # Undo: the game goes back, which also returns any swapped occupant
+                self._move(game, source)
+            if max_iterations is not None:
+                temperature *= cooling
+
+        self._apply(best_cells)
+        return best_cost
+
+    def _apply(self, cells):
+        """Write an assignment back into the schedule arrays"""
+        self.cost = self._slot_offset
+        self.cell = list(cells)
+        self.occupant = [-1] * len(self.occupant)
+        self.team_dates = [[0] * len(self.dates) for _ in range(self.team_count)]
+        self.team_slots = [[0] * self.slots for _ in range(self.team_count)]
+        for game, cell in enumerate(self.cell):
+            self.occupant[cell] = game
+            self.cost += self._place(game, cell, 1)
+
+        cells = np.array(self.cell)
+        date_index, position = np.divmod(cells, self.cells_per_date)
+        self.schedule.date_index = date_index
+        self.schedule.slot = position // self.rinks
+        self.schedule.rink = position % self.rinks
+        self.schedule.dates_needed = int(date_index.max()) + 1
+
+    def violations(self):
+        """Counts of each constraint violation in the current assignment"""
+        double_booked = unavailable = back_to_back = 0
+        for team in range(self.team_count):
+            dates = self.team_dates[team]
+            for date, count in enumerate(dates):
+                if not count:
+                    continue
+                double_booked += count - 1
+                if date in self.unavailable[team]:
+                    unavailable += count
+                back_to_back += count * sum(dates[other] for other in self.neighbors[date] if other > date)
+        slot_spread = max(
+            (max(slots) - min(slots) for slots in self.team_slots), default=0
+        )
+        return {
+            "double_booked": double_booked,
+            "unavailable": unavailable,
+            "back_to_back": back_to_back,
+            "max_slot_spread": slot_spread,
+        }
@@ -0,0 +1,278 @@
+"""
+Referee assignment.
+Fills the Ref1/Ref2 fields of schedule rows from referee availability, solving
+each game night as a min-cost flow (referee -> time slot -> game). Costs grow
+with every game a referee already has, so the season's work is spread evenly.
+"""
+import heapq
+from collections import deque, defaultdict
+from datetime import datetime
+from src.formatters.base import team_key
+
+REF_FIELDS = ("Ref1", "Ref2")
+# Placeholder values meaning "no referee yet"
+UNASSIGNED = ("", "tbd", "null", "none")
+
+
+def is_unassigned(value):
+    return str(value or "").strip().lower() in UNASSIGNED
+
+
+def parse_date(value):
+    """Parse 'MM-DD-YYYY' (schedule format) or 'YYYY-MM-DD'; returns a date or None."""
+    for date_format in ("%m-%d-%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(str(value).strip(), date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+class MinCostFlow:
+    """
+    Successive shortest paths min-cost max-flow on a small integer graph
+    Paths are found with Dijkstra over reduced costs (Johnson potentials), so
+    edge costs must be non-negative when added.
+    """
+
+    def __init__(self, node_count):
+        self.graph = [[] for _ in range(node_count)]
+        # Edge: [to, capacity, cost, index of the reverse edge]
+        self.edges = []
+
+    def add_edge(self, source, target, capacity, cost):
+        """Add an edge and return its id (for reading the flow back with flow())"""
+        if cost < 0:
+            raise ValueError(f"Edge costs must be non-negative (got {cost})")
+        self.graph[source].append(len(self.edges))
+        self.edges.append([target, capacity, cost, len(self.edges) + 1])
+        self.graph[target].append(len(self.edges))
+        self.edges.append([source, 0, -cost, len(self.edges) - 1])
+        return len(self.edges) - 2
+
+    def flow(self, edge_id):
+        """Units sent along an edge"""
+        return self.edges[edge_id ^ 1][1]
+
+    def solve(self, source, sink):
+        """Push as much flow as possible at minimum cost; returns (flow, cost)"""
+        total_flow = total_cost = 0
+        # Reduced costs cost + potential[u] - potential[v] stay >= 0 on every residual edge
+        potential = [0] * len(self.graph)
+        while self._update_potential(source, sink, potential):
+            # Every path of reduced cost 0 is now a shortest path; push along all of them at once
+            pushed = self._push_shortest_paths(source, sink, potential)
+            total_flow += pushed
+            total_cost += pushed * (potential[sink] - potential[source])
+        return total_flow, total_cost
+
+    def _update_potential(self, source, sink, potential):
+        """Dijkstra over reduced costs; folds the distances into potential, False if sink is unreachable"""
+        graph, edges = self.graph, self.edges
+        distance = [float("inf")] * len(graph)
+        distance[source] = 0
+        heap = [(0, source)]
+        while heap:
+            reached, node = heapq.heappop(heap)
+            if reached > distance[node]:
+                continue
+            if node == sink:
+                # Everything still queued is at least as far as the sink
+                break
+            node_potential = potential[node]
+            for edge_id in graph[node]:
+                target, capacity, cost, _ = edges[edge_id]
+                if capacity > 0:
+                    candidate = reached + cost + node_potential - potential[target]
+                    if candidate < distance[target]:
+                        distance[target] = candidate
+                        heapq.heappush(heap, (candidate, target))
+        limit = distance[sink]
+        if limit == float("inf"):
+            return False
+        for node, node_distance in enumerate(distance):
+            potential[node] += min(node_distance, limit)
+        return True
+
+    def _push_shortest_paths(self, source, sink, potential):
+        """Blocking flow over the residual edges of reduced cost 0 (Dinic levels keep it acyclic)"""
+        graph, edges = self.graph, self.edges
+
+        def admissible(node, edge):
+            return edge[1] > 0 and edge[2] + potential[node] - potential[edge[0]] == 0
+
+        level = [-1] * len(graph)
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for edge_id in graph[node]:
+                edge = edges[edge_id]
+                if level[edge[0]] < 0 and admissible(node, edge):
+                    level[edge[0]] = level[node] + 1
+                    queue.append(edge[0])
+
+        pushed = 0
+        pointer = [0] * len(graph)
+        path, node = [], source
+        while True:
+            if node == sink:
+                push = min(edges[edge_id][1] for edge_id in path)
+                for edge_id in path:
+                    edges[edge_id][1] -= push
+                    edges[edges[edge_id][3]][1] += push
+                pushed += push
+                path, node = [], source
+                continue
+            out = graph[node]
+            while pointer[node] < len(out):
+                edge = edges[out[pointer[node]]]
+                if level[edge[0]] == level[node] + 1 and admissible(node, edge):
+                    break
+                pointer[node] += 1
+            else:
+                # Dead end: back up and skip the edge that led here
+                if node == source:
+                    return pushed
+                edge_id = path.pop()
+                node = edges[edges[edge_id][3]][0]
+                pointer[node] += 1
+                continue
+            path.append(out[pointer[node]])
+            node = edges[out[pointer[node]]][0]
+
+
+class RefereeAssigner:
+    """
+    Assigns referees to schedule rows (dicts with id, Date, Time, Home, Away, Ref1, Ref2)
+    referees: [{"name", "unavailable": [MM-DD-YYYY or YYYY-MM-DD dates], "teams": [teams they play for],
+    "max_games_per_night"}]. A referee never works a game involving their own team or
+    a game at the same time as their own game, and never two games at the same time.
+    Refs already named in a row are kept and count toward the referee's load.
+    """
+
+    def __init__(self, referees, max_games_per_night=2, refs_per_game=2):
+        if not 1 <= refs_per_game <= len(REF_FIELDS):
+            raise ValueError(f"refs_per_game must be between 1 and {len(REF_FIELDS)}")
+        self.referees = [
+            {
+                "name": str(ref["name"]).strip(),
+                "unavailable": self._unavailable_dates(ref),
+                "teams": {team_key(team) for team in ref.get("teams", [])},
+                "max_games_per_night": int(ref.get("max_games_per_night", max_games_per_night)),
+            }
+            for ref in referees if str(ref.get("name", "")).strip()
+        ]
+        self.refs_per_game = refs_per_game
+        self.loads = {ref["name"]: 0 for ref in self.referees}
+
+    @staticmethod
+    def _unavailable_dates(ref):
+        dates = set()
+        for value in ref.get("unavailable", []):
+            date = parse_date(value)
+            if date is None:
+                raise ValueError(f"Invalid unavailable date for referee {ref['name']}: {value}")
+            dates.add(date)
+        return dates
+
+    def assign(self, games, only_unplayed=True):
+        """
+        Fill empty Ref1/Ref2 fields in place, one night at a time in date order
+        Returns the ids of games left with empty referee fields.
+        """
+        by_name = {ref["name"].lower(): ref for ref in self.referees}
+        nights = defaultdict(list)
+        for game in games:
+            for field in REF_FIELDS[:self.refs_per_game]:
+                ref = by_name.get(str(game.get(field, "") or "").strip().lower())
+                if ref is not None:
+                    self.loads[ref["name"]] += 1
+            if only_unplayed and str(game.get("Played", "")).lower() == "y":
+                continue
+            nights[str(game.get("Date", ""))].append(game)
+
+        unfilled = []
+        for date in sorted(nights, key=self._date_key):
+            unfilled.extend(self._assign_night(date, nights[date], by_name))
+        return unfilled
+
+    @staticmethod
+    def _date_key(date):
+        parsed = parse_date(date)
+        return (0, parsed.isoformat()) if parsed else (1, date)
+
+    def _assign_night(self, date, games, by_name):
+        # Referees already on a game tonight: their times are taken and count toward the nightly cap
+        busy = defaultdict(set)
+        for game in games:
+            for field in REF_FIELDS[:self.refs_per_game]:
+                name = str(game.get(field, "") or "").strip().lower()
+                if name in by_name:
+                    busy[by_name[name]["name"]].add(str(game.get("Time", "")))
+        # Teams playing at each time tonight (their referees are on the ice)
+        playing = defaultdict(set)
+        for game in games:
+            playing[str(game.get("Time", ""))].update((team_key(game.get("Home")), team_key(game.get("Away"))))
+
+        open_games = [
+            (game, [field for field in REF_FIELDS[:self.refs_per_game] if is_unassigned(game.get(field))])
+            for game in games
+        ]
+        open_games = [(game, fields) for game, fields in open_games if fields]
+        if not open_games:
+            return []
+
+        night = parse_date(date)
+        refs = [
+            ref for ref in self.referees
+            if night not in ref["unavailable"] and len(busy[ref["name"]]) < ref["max_games_per_night"]
+        ]
+        times = sorted({str(game.get("Time", "")) for game, _ in open_games})
+
+        # Nodes: source, referees, (referee, time) for times they can work, games, sink
+        source = 0
+        ref_node = {ref["name"]: 1 + i for i, ref in enumerate(refs)}
+        slot_node = {}
+        for ref in refs:
+            for time in times:
+                if time not in busy[ref["name"]] and not ref["teams"] & playing[time]:
+                    slot_node[(ref["name"], time)] = 1 + len(refs) + len(slot_node)
+        game_node = [1 + len(refs) + len(slot_node) + i for i in range(len(open_games))]
+        sink = 1 + len(refs) + len(slot_node) + len(open_games)
+        network = MinCostFlow(sink + 1)
+
+        for ref in refs:
+            name = ref["name"]
+            tonight = len(busy[name])
+            # Convex cost: the k-th game of the season costs 2k + 1, so loads even out
+            for k in range(ref["max_games_per_night"] - tonight):
+                network.add_edge(source, ref_node[name], 1, 2 * (self.loads[name] + k) + 1)
+            for time in times:
+                if (name, time) in slot_node:
+                    network.add_edge(ref_node[name], slot_node[(name, time)], 1, 0)
+
+        assignment_edges = []
+        for (game, fields), node in zip(open_games, game_node):
+            network.add_edge(node, sink, len(fields), 0)
+            time = str(game.get("Time", ""))
+            on_game = {str(game.get(field, "") or "").strip().lower() for field in REF_FIELDS}
+            for ref in refs:
+                # Only slots a referee can work link to games
+                if ref["name"].lower() in on_game or (ref["name"], time) not in slot_node:
+                    continue
+                edge_id = network.add_edge(slot_node[(ref["name"], time)], node, 1, 0)
+                assignment_edges.append((edge_id, game, fields, ref["name"]))
+
+        network.solve(source, sink)
+
+        for edge_id, game, fields, name in assignment_edges:
+            if network.flow(edge_id):
+                field = next(field for field in fields if is_unassigned(game.get(field)))
+                game[field] = name
+                self.loads[name] += 1
+
+        return [
+            str(game.get("id", "")) for game, fields in open_games
+            if any(is_unassigned(game.get(field)) for field in fields)
+        ]
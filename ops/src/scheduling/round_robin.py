@@ -0,0 +1,173 @@
+"""
+Round-robin schedule generation.
+Circle method (Berger tables) for any number of teams, built with numpy index
+arithmetic so a season for hundreds of teams takes milliseconds. Handles byes,
+repeated meetings with alternating home/away, and packing games into rink and
+time slots.
+"""
+import numpy as np
+
+SCHEDULE_DATE_FORMAT = "%m-%d-%Y"
+
+
+def circle_rounds(team_count):
+    """
+    One full round robin as (home, away) index arrays of shape (rounds, games per round)
+    Odd team counts get a phantom team (index team_count); playing it is a bye.
+    Each team's home and away games differ by at most one.
+    """
+    if team_count < 2:
+        raise ValueError(f"A round robin needs at least 2 teams, got {team_count}")
+
+    n = team_count + team_count % 2
+    rotating = n - 1
+    rounds = np.arange(rotating)[:, None]
+    offsets = np.arange(1, n // 2)[None, :]
+
+    # Team n-1 stays fixed and alternates home/away; the others rotate around it
+    fixed_home = (rounds[:, 0] % 2) == 0
+    fixed_opponent = rounds[:, 0]
+    home = np.concatenate([
+        np.where(fixed_home, n - 1, fixed_opponent)[:, None], (rounds + offsets) % rotating
+    ], axis=1)
+    away = np.concatenate([
+        np.where(fixed_home, fixed_opponent, n - 1)[:, None], (rounds - offsets) % rotating
+    ], axis=1)
+    return home, away
+
+
+def pack_rounds(home, away, games_per_round, capacity):
+    """
+    Date index and cell (slot * rinks + rink) for games listed round by round.
+    A round first takes leftover cells on the previous round's last date for games
+    whose teams are both free that day; its other games go on new dates.
+    """
+    home, away = home.tolist(), away.tolist()
+    date_index = np.empty(len(home), dtype=np.int64)
+    cell = np.empty(len(home), dtype=np.int64)
+    date, used, busy = -1, capacity, set()
+
+    def place(game):
+        nonlocal used
+        date_index[game], cell[game] = date, used
+        used += 1
+        busy.update((home[game], away[game]))
+
+    for start in range(0, len(home), games_per_round):
+        carried = []
+        for game in range(start, start + games_per_round):
+            if used < capacity and home[game] not in busy and away[game] not in busy:
+                place(game)
+            else:
+                carried.append(game)
+        for game in carried:
+            if used == capacity:
+                date, used, busy = date + 1, 0, set()
+            place(game)
+    return date_index, cell
+
+
+class RoundRobinSchedule:
+    """
+    A season of round robins laid out on game dates.
+    Games are flat numpy arrays (round, home, away, date_index, slot, rink) of team
+    and slot indexes; byes holds the team with a bye in each round (-1 for none).
+    A round with more games than rinks x slots runs over several dates, and the next
+    round fills the cells it leaves free on a date where none of its teams already
+    plays. Slots rotate from round to round so no pairing is always the early game.
+    """
+
+    def __init__(self, team_count, meetings=1, rinks=1, slots=1):
+        if meetings < 1 or rinks < 1 or slots < 1:
+            raise ValueError("meetings, rinks and slots must be at least 1")
+        self.team_count = team_count
+        self.meetings = meetings
+        self.rinks = rinks
+        self.slots = slots
+
+        home, away = circle_rounds(team_count)
+        cycle_rounds = home.shape[0]
+
+        # Later meetings repeat the cycle, mirrored every other time
+        mirrored = (np.arange(meetings) % 2 == 1)[:, None, None]
+        home_all = np.where(mirrored, away[None], home[None]).reshape(-1, home.shape[1])
+        away_all = np.where(mirrored, home[None], away[None]).reshape(-1, home.shape[1])
+
+        # The phantom team is the fixed one (column 0): its opponent has a bye
+        if team_count % 2:
+            self.byes = np.where(home_all[:, 0] == team_count, away_all[:, 0], home_all[:, 0])
+            home_all, away_all = home_all[:, 1:], away_all[:, 1:]
+        else:
+            self.byes = np.full(home_all.shape[0], -1)
+        games_per_round = home_all.shape[1]
+        self.round_count = cycle_rounds * meetings
+
+        self.round = np.repeat(np.arange(self.round_count), games_per_round)
+        self.home = home_all.ravel()
+        self.away = away_all.ravel()
+
+        # Rotate positions within the round, then fill dates slot by slot across rinks
+        position = (np.tile(np.arange(games_per_round), self.round_count) + self.round) % games_per_round
+        order = np.lexsort((position, self.round))
+        packed_date, packed_cell = pack_rounds(self.home[order], self.away[order], games_per_round, rinks * slots)
+        self.date_index = np.empty_like(packed_date)
+        self.date_index[order] = packed_date
+        cell = np.empty_like(packed_cell)
+        cell[order] = packed_cell
+        self.slot = cell // rinks
+        self.rink = cell % rinks
+        self.dates_needed = int(self.date_index.max()) + 1
+
+    @classmethod
+    def fill(cls, team_count, date_count, rinks=1, slots=1):
+        """As many meetings as fit in date_count dates (at least one)"""
+        schedule = cls(team_count, 1, rinks, slots)
+        # Packing across meetings never needs more dates than laying them end to end
+        meetings = max(1, date_count // schedule.dates_needed)
+        if meetings > 1:
+            schedule = cls(team_count, meetings, rinks, slots)
+        while True:
+            longer = cls(team_count, schedule.meetings + 1, rinks, slots)
+            if longer.dates_needed > date_count:
+                return schedule
+            schedule = longer
+
+    def __len__(self):
+        return len(self.home)
+
+    def home_away_counts(self):
+        """(home games, away games) per team index"""
+        return (np.bincount(self.home, minlength=self.team_count),
+                np.bincount(self.away, minlength=self.team_count))
+
+    def to_records(self, team_ids, team_names, dates, time_slots, rink_names=None):
+        """
+        Schedule rows in game order: id, Date, Time, HomeTeamID, AwayTeamID, Home, Away
+        (plus Rink when there is more than one rink)
+        """
+        if len(dates) < self.dates_needed:
+            raise ValueError(f"Schedule needs {self.dates_needed} game dates, only {len(dates)} available")
+
+        order = np.lexsort((self.rink, self.slot, self.date_index))
+        date_strings = [date.strftime(SCHEDULE_DATE_FORMAT) for date in dates[:self.dates_needed]]
+        if self.rinks > 1:
+            rink_labels = list(rink_names) if rink_names else [str(rink + 1) for rink in range(self.rinks)]
+        columns = zip(
+            self.date_index[order].tolist(), self.slot[order].tolist(), self.rink[order].tolist(),
+            self.home[order].tolist(), self.away[order].tolist()
+        )
+        records = []
+        for game_id, (date_index, slot, rink, home, away) in enumerate(columns, 1):
+            record = {
+                "id": str(game_id),
+                "Date": date_strings[date_index],
+                "Time": time_slots[slot],
+                "HomeTeamID": team_ids[home],
+                "AwayTeamID": team_ids[away],
+                "Home": team_names[home],
+                "Away": team_names[away],
+            }
+            if self.rinks > 1:
+                record["Rink"] = rink_labels[rink]
+            records.append(record)
+        return records
@@ -5,7 +5,7 @@ DEFAULT_PLAYER_SPREADSHEET_ID = "16sG5OBgkP4no3dIt2-h8G8uSsK7S-o7-5gWDtHuPG6k"
 DEFAULT_GAME_SPREADSHEET_ID = "1XUoZxS4rbOJzv47grAqhEOpGcZui7okWJcfaLt7R67Q"  # New game sheet for single game processing
 
 ## Sheet Ranges
-GAMES_RANGE = "games!A2:Z55"  # Expanded to get all possible columns
+GAMES_RANGE = "games!A1:Z55"  # Header row included (validated by GAMES_SCHEMA)
 PLAYERS_RANGE = "players!A2:C53"  # Fixed to skip header
 PLAYERS_SEASON_RANGE = "players!D2:O53"  # Fixed to skip header
 STANDINGS_RANGE = "standings!A2:L5"
@@ -23,16 +23,41 @@ GAME_RANGES = {
 # Game events range (from main spreadsheet)
 GAME_EVENTS_RANGE = "gameEvents!A1:P100"
 
+# Dynamic range discovery (use the parent config)
+from config.settings import SHEET_EXTENTS, RANGE_DISCOVERY_TTL_SECONDS
+
+# Game events ingestion settings (use the parent config)
+from config.settings import (
+    GAME_EVENTS_SHEET, GAMES_PLAYED_SHEET, GAME_LINKS_RANGE,
+    GAME_EVENTS_KEYS_RANGE, GAMES_PLAYED_KEYS_RANGE
+)
+
+# Schedule output settings (use the parent config)
+from config.settings import SCHEDULE_OUTPUT_FORMAT, SCHEDULE_WORKERS, SCHEDULE_PARTITION_GAMES
+
+# Season settings (use the parent config)
+from config.settings import CURRENT_SEASON_ID, CURRENT_SEASON_YEAR, SCHEDULE_BATCH_WORKERS
+
+# League registry settings (use the parent config)
+from config.settings import LEAGUES_FILE, DEFAULT_LEAGUE, DEFAULT_TEAMS, LEAGUE_WORKERS
+
+# Leaderboard settings (use the parent config)
+from config.settings import LEADERS_TOP_K, LEADERS_MIN_GP
+
+# Referee assignment settings (use the parent config)
+from config.settings import REFEREES_FILE, REF_MAX_GAMES_PER_NIGHT, REFS_PER_GAME
+
+# Season archive settings (use the parent config)
+from config.settings import ARCHIVE_DIR
+
+# Watch mode settings (use the parent config)
+from config.settings import WATCH_POLL_SECONDS, WATCH_TRIGGER_FILE, WATCH_MAX_BACKOFF_SECONDS
+
+# Read API settings (use the parent config)
+from config.settings import API_HOST, API_PORT, API_CACHE_MAX_AGE_SECONDS
+
 ## File Paths (use the parent config)
 from config.settings import SERVICE_ACCOUNT_FILE, GOOGLE_CREDS_FILE, TOKEN_FILE
 
 ## Output Directories
 OUTPUT_DIR = "./output"
-
-## Team Mappings
-TEAM_NAMES = {
-    1: "New York",
-    2: "Detroit", 
-    3: "Chicago",
-    4: "Boston"
-}
@@ -0,0 +1,102 @@
+"""
+League registry.
+Maps each league to its spreadsheets, sheet extents, teams, current season and
+output directory. Leagues are read from config.LEAGUES_FILE; without it the
+registry holds a single league built from the settings (DEFAULT_LEAGUE).
+"""
+import json
+import os
+from config import settings as config
+from src.formatters.base import team_key
+
+
+class LeagueConfigError(ValueError):
+    """Raised when the league registry is missing a league or a required field."""
+
+
+class League:
+    """One league's spreadsheets, sheet extents, teams, season and output directory"""
+
+    def __init__(self, key, name=None, player_spreadsheet_id=None, game_spreadsheet_id=None,
+                 season_id=None, teams=None, sheet_extents=None, output_dir=None, archive_dir=None):
+        self.key = key
+        self.name = name or key.upper()
+        self.player_spreadsheet_id = player_spreadsheet_id
+        self.game_spreadsheet_id = game_spreadsheet_id
+        self.season_id = str(season_id or config.CURRENT_SEASON_ID)
+        # Team names by team id (the ids used in players.json and goalie_stats.json)
+        self.teams = {str(team_id): name for team_id, name in (teams or {}).items()}
+        # Sheet extents that differ from config.SHEET_EXTENTS replace them by name
+        self.sheet_extents = {**config.SHEET_EXTENTS, **(sheet_extents or {})}
+        self.output_dir = output_dir or os.path.join(str(config.OUTPUT_DIR), "leagues", key)
+        self.archive_dir = archive_dir or os.path.join(self.output_dir, "archive")
+        self._team_ids = {team_key(name): team_id for team_id, name in self.teams.items()}
+
+    @classmethod
+    def from_dict(cls, key, data):
+        """League from one leagues.json entry; spreadsheet ids and teams are required"""
+        missing = [field for field in ("player_spreadsheet_id", "teams") if not data.get(field)]
+        if missing:
+            raise LeagueConfigError(f"League '{key}' in {config.LEAGUES_FILE} has no {', '.join(missing)}")
+        return cls(
+            key,
+            name=data.get("name"),
+            player_spreadsheet_id=data["player_spreadsheet_id"],
+            game_spreadsheet_id=data.get("game_spreadsheet_id"),
+            season_id=data.get("season_id"),
+            teams=data["teams"],
+            sheet_extents=data.get("sheet_extents"),
+            output_dir=data.get("output_dir"),
+            archive_dir=data.get("archive_dir"),
+        )
+
+    @classmethod
+    def default(cls):
+        """The built-in league: the configured spreadsheets and teams, writing to ./output"""
+        return cls(
+            config.DEFAULT_LEAGUE,
+            player_spreadsheet_id=config.DEFAULT_PLAYER_SPREADSHEET_ID,
+            game_spreadsheet_id=config.DEFAULT_GAME_SPREADSHEET_ID,
+            teams=config.DEFAULT_TEAMS,
+            output_dir="./output",
+            archive_dir=config.ARCHIVE_DIR,
+        )
+
+    def team_id(self, team_name, default=None):
+        """Team id for a team name (ignoring case and spacing)"""
+        return self._team_ids.get(team_key(team_name), default)
+
+    def team_name(self, team_id, default="Unknown"):
+        """Team name for a team id"""
+        return self.teams.get(str(team_id), default)
+
+    def __repr__(self):
+        return f"League({self.key!r}, season={self.season_id!r}, teams={len(self.teams)})"
+
+
+def load_leagues(path=None):
+    """
+    Registered leagues by key, in file order
+    leagues.json is an object of league entries (see config.LEAGUES_FILE); without
+    it the registry is the built-in default league.
+    """
+    path = path or config.LEAGUES_FILE
+    if not os.path.exists(path):
+        league = League.default()
+        return {league.key: league}
+
+    with open(path, 'r') as f:
+        entries = json.load(f)
+    if not isinstance(entries, dict) or not entries:
+        raise LeagueConfigError(f"{path} must be an object of leagues keyed by league id")
+    return {key: League.from_dict(key, data) for key, data in entries.items()}
+
+
+def get_league(key=None, path=None):
+    """One registered league (default: DEFAULT_LEAGUE, or the first registered league)"""
+    leagues = load_leagues(path)
+    if key is None:
+        return leagues.get(config.DEFAULT_LEAGUE) or next(iter(leagues.values()))
+    if key not in leagues:
+        raise LeagueConfigError(f"Unknown league '{key}' (registered: {', '.join(leagues)})")
+    return leagues[key]
@@ -2,20 +2,51 @@
 Unified UHL Operations Manager
 Consolidates games, players, and standings operations into a single interface.
 """
+import json
 import os
 import sys
-from sheets_client import SheetsClient
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from sheets_client import SheetsClient, SheetsUnavailableError
+from src.data.sheets_client import WarmSheetsClient
+from src.data.async_sheets_client import fetch_many
+from src.operations.game_events_ops import GameEventsOperations
+from src.operations.watch_ops import WatchOperations
+from src.operations.player_logs_ops import PlayerLogOperations
+from src.operations.head_to_head_ops import HeadToHeadOperations
+from src.operations.leaders_ops import LeaderboardOperations
+from src.operations.referee_ops import RefereeOperations
+from src.operations.archive_ops import ArchiveOperations
+from src.operations.league_ops import LeagueOperations, LEAGUE_OPERATIONS
+from src.utils.leagues import get_league, LeagueConfigError
+from src.operations.schedule_ops import schedule_output_paths
+from src.formatters.schedule_partitions import iter_schedule_entries
+from src.api.server import LeagueDataStore, run_server
+from src.data.schema import SchemaError
 from formatters import GameFormatter, PlayerFormatter, StandingsFormatter, GoalieStatsFormatter, OutputManager
+from src.formatters.goalie_stats import GOALIE_GAME_FIELDS
+from src.data.json_stream import JSONStreamError
 from config import settings as config
 
 class UHLOpsManager:
-    def __init__(self, player_spreadsheet_id=None, game_spreadsheet_id=None):
-        self.sheets_client = SheetsClient(player_spreadsheet_id, game_spreadsheet_id)
+    def __init__(self, player_spreadsheet_id=None, game_spreadsheet_id=None, sheets_client=None, league=None):
+        # Spreadsheets, sheet extents, teams and season of the league (default: the registry's default league)
+        self.league = league or get_league()
+        self.sheets_client = sheets_client or SheetsClient(
+            player_spreadsheet_id or self.league.player_spreadsheet_id,
+            game_spreadsheet_id or self.league.game_spreadsheet_id,
+            sheet_extents=self.league.sheet_extents
+        )
         self.game_formatter = GameFormatter()
         self.player_formatter = PlayerFormatter()
         self.standings_formatter = StandingsFormatter()
         self.goalie_stats_formatter = GoalieStatsFormatter()
         self.output_manager = OutputManager()
+        # Keep the game log index, head-to-head matrix and leaderboards in memory
+        # so watch mode only applies new games
+        self.player_logs = PlayerLogOperations()
+        self.head_to_head = HeadToHeadOperations()
+        self.leaders = LeaderboardOperations()
     
     def process_players(self, output_dir="./output"):
         """Process all players data with TBD handling"""
@@ -23,8 +54,8 @@ class UHLOpsManager:
         
         try:
             # Fetch player data using config ranges
-            df_players = self.sheets_client.get_range(config.PLAYERS_RANGE)
-            df_season = self.sheets_client.get_range(config.PLAYERS_SEASON_RANGE)
+            df_players = self.sheets_client.get_sheet("players")
+            df_season = self.sheets_client.get_sheet("players_season")
             
             if df_players.empty:
                 print("❌ No players data found")
@@ -32,7 +63,8 @@ class UHLOpsManager:
             
             # Format data (handles TBD gracefully)
             players = self.player_formatter.format_players(df_players)
-            seasons = self.player_formatter.format_season_stats(df_season) if not df_season.empty else []
+            seasons = (self.player_formatter.format_season_stats(df_season, self.league.season_id)
+                       if not df_season.empty else [])
             
             # Check if we got valid data
             if not players:
@@ -62,6 +94,9 @@ class UHLOpsManager:
             
             return combined_data
             
+        except SheetsUnavailableError:
+            # Outages (429/503, open circuit) propagate so main() exits non-zero
+            raise
         except Exception as e:
             print(f"❌ Error processing players: {e}")
             # Save error status
@@ -83,7 +118,7 @@ class UHLOpsManager:
         print("Processing standings data...")
         
         # Fetch standings data using config range
-        df_standings = self.sheets_client.get_range(config.STANDINGS_RANGE)
+        df_standings = self.sheets_client.get_sheet("standings")
         
         if df_standings.empty:
             print("No standings data found")
@@ -111,27 +146,17 @@ class UHLOpsManager:
         
         try:
             # Fetch game data using config ranges from game spreadsheet
-            game_info = self.sheets_client.get_range(config.GAME_RANGES["game_info"], 'game')
-            team1_lineup = self.sheets_client.get_range(config.GAME_RANGES["team1_lineup"], 'game')
-            team2_lineup = self.sheets_client.get_range(config.GAME_RANGES["team2_lineup"], 'game')
-            goals_data = self.sheets_client.get_range(config.GAME_RANGES["goals"], 'game')
-            penalties_data = self.sheets_client.get_range(config.GAME_RANGES["penalties"], 'game')
+            frames = {
+                name: self.sheets_client.get_range(range_name, 'game')
+                for name, range_name in config.GAME_RANGES.items()
+            }
             
-            if game_info.empty:
+            # Format lineups, goals and penalties into a complete game structure
+            game_data = self.game_formatter.format_game_sheet(frames)
+            if game_data is None:
                 print("No game info found")
                 return None
             
-            # Format data
-            home_lineup = self.game_formatter.format_lineups(team1_lineup)
-            away_lineup = self.game_formatter.format_lineups(team2_lineup)
-            goals = self.game_formatter.format_goals(goals_data)
-            penalties = self.game_formatter.format_penalties(penalties_data)
-            
-            # Create complete game structure
-            game_data = self.game_formatter.create_schedule_entry(
-                game_info, home_lineup, away_lineup, goals, penalties
-            )
-            
             # Create output directory if it doesn't exist
             os.makedirs(output_dir, exist_ok=True)
             
@@ -141,28 +166,98 @@ class UHLOpsManager:
             
             return game_data
             
+        except SheetsUnavailableError:
+            raise
         except Exception as e:
             print(f"Error processing game: {e}")
             return None
     
+    def process_games_batch(self, game_spreadsheet_ids, output_dir="./output"):
+        """
+        Process many game spreadsheets in one run
+        Fetches all sheets concurrently, formats them in a process pool and writes
+        per-game outputs plus a merged schedule.json.
+        """
+        game_spreadsheet_ids = list(dict.fromkeys(game_spreadsheet_ids))
+        print(f"🏒 Processing {len(game_spreadsheet_ids)} game spreadsheets...")
+        
+        if not game_spreadsheet_ids:
+            print("❌ No game spreadsheet IDs provided")
+            return None
+        
+        # One batchGet per spreadsheet, all in flight at once
+        frames_by_sheet = fetch_many(game_spreadsheet_ids, config.GAME_RANGES)
+        
+        # Formatting is CPU-bound pandas work, so spread it across processes
+        games = {}
+        with ProcessPoolExecutor(max_workers=config.GAMES_BATCH_WORKERS) as pool:
+            futures = {
+                pool.submit(GameFormatter.format_game_sheet, frames): spreadsheet_id
+                for spreadsheet_id, frames in frames_by_sheet.items()
+            }
+            for future in as_completed(futures):
+                spreadsheet_id = futures[future]
+                try:
+                    game_data = future.result()
+                except Exception as e:
+                    print(f"❌ Error formatting game sheet {spreadsheet_id}: {e}")
+                    continue
+                if game_data is None:
+                    print(f"⚠️  No game info found in {spreadsheet_id}")
+                    continue
+                games[spreadsheet_id] = game_data
+        
+        # Keep the input order so reruns produce identical output
+        processed = [games[sid] for sid in game_spreadsheet_ids if sid in games]
+        
+        # Save one file per game
+        games_dir = os.path.join(output_dir, "games")
+        os.makedirs(games_dir, exist_ok=True)
+        for spreadsheet_id in game_spreadsheet_ids:
+            if spreadsheet_id not in games:
+                continue
+            game_id = games[spreadsheet_id].get("id") or spreadsheet_id
+            self.output_manager.save_json(
+                games[spreadsheet_id], os.path.join(games_dir, f"game_{game_id}.json")
+            )
+        
+        # Merge into the existing schedule
+        schedule_path = os.path.join(output_dir, "schedule.json")
+        existing_schedule = []
+        if os.path.exists(schedule_path):
+            existing_schedule = self.output_manager.load_json(schedule_path) or []
+        schedule_data = self.game_formatter.merge_into_schedule(existing_schedule, processed)
+        self.output_manager.save_json(schedule_data, schedule_path)
+        
+        print(f"✅ {len(processed)}/{len(game_spreadsheet_ids)} games processed and merged into {schedule_path}")
+        return processed
+    
+    def ingest_game_events(self, game_spreadsheet_ids=None):
+        """Copy goals, penalties and lineups from game sheets into gameEvents/gamesPlayed"""
+        # Ingestion writes to the player spreadsheet, so it needs a read-write client
+        writer = SheetsClient(self.sheets_client.player_spreadsheet_id, readonly=False,
+                              sheet_extents=self.league.sheet_extents)
+        return GameEventsOperations(writer).ingest_games(game_spreadsheet_ids)
+    
     def process_all_games(self, output_dir="./output"):
         """Process all games from player spreadsheet with TBD handling"""
         print("🏒 Processing games schedule...")
         
         try:
-            # Fetch games data from player spreadsheet using config range
-            df_games = self.sheets_client.get_range(config.GAMES_RANGE)
+            # Fetch games data from player spreadsheet (row 1 is the header GAMES_SCHEMA checks)
+            df_games = self.sheets_client.get_sheet("games").iloc[1:].reset_index(drop=True)
             
             if df_games.empty:
                 print("❌ No games data found")
                 return None
             
-            # Check season status first
-            season_status = GameFormatter.check_season_status(df_games)
+            # Check season status first (one TBD scan shared with formatting)
+            tbd_scan = GameFormatter.scan_tbd(df_games)
+            season_status = GameFormatter.check_season_status(df_games, tbd_scan)
             print(f"📊 Season Status: {season_status['message']}")
             
             # Format games data (handles TBD gracefully)
-            games_data = self.game_formatter.format_all_games(df_games)
+            games_data = self.game_formatter.format_all_games(df_games, tbd_scan)
             
             # Create output directory if it doesn't exist
             os.makedirs(output_dir, exist_ok=True)
@@ -183,6 +278,8 @@ class UHLOpsManager:
             
             return games_data
             
+        except SheetsUnavailableError:
+            raise
         except Exception as e:
             print(f"❌ Error processing games: {e}")
             # Save error status
@@ -204,7 +301,7 @@ class UHLOpsManager:
         print("Analyzing game events data...")
         
         # Fetch game events data from player spreadsheet using config range
-        df_events = self.sheets_client.get_range(config.GAME_EVENTS_RANGE)
+        df_events = self.sheets_client.get_sheet("game_events")
         
         if df_events.empty:
             print("No game events data found")
@@ -233,49 +330,55 @@ class UHLOpsManager:
         
         return raw_data
     
-    def build_complete_schedule(self, output_dir="./output"):
-        """Build complete schedule.json matching the existing format"""
+    def build_complete_schedule(self, output_dir="./output", keep_games=True):
+        """
+        Build complete schedule.json matching the existing format
+        Games are written as they are formatted (schedule.json and/or schedule.ndjson, per
+        SCHEDULE_OUTPUT_FORMAT). Returns the games, or only their count with keep_games=False.
+        """
         print("Building complete schedule with games, events, and lineups...")
         
-        # Fetch games data
-        df_games = self.sheets_client.get_range(config.GAMES_RANGE)
+        # Fetch games data as a typed table (raises SchemaError if the sheet layout drifted)
+        df_games = self.sheets_client.get_table("games")
         if df_games.empty:
             print("No games data found")
             return None
         
         # Fetch game events data  
-        df_events = self.sheets_client.get_range(config.GAME_EVENTS_RANGE)
+        df_events = self.sheets_client.get_table("game_events")
         if df_events.empty:
             print("No game events data found - schedule will be created with empty goals/penalties")
-            # Create empty dataframe for events processing
-            import pandas as pd
-            df_events = pd.DataFrame()
         
         # Fetch gamesPlayed data for lineups
         df_games_played = None
         try:
-            df_games_played = self.sheets_client.get_range(config.GAMES_PLAYED_RANGE)
+            df_games_played = self.sheets_client.get_table("games_played")
             if df_games_played.empty:
                 print("⚠️  No gamesPlayed data found - lineups will be empty")
             else:
                 print(f"Found gamesPlayed data with {len(df_games_played)} rows")
+        except (SchemaError, SheetsUnavailableError):
+            raise
         except Exception as e:
             print(f"⚠️  Could not fetch gamesPlayed data: {e} - lineups will be empty")
         
-        print(f"Processing {len(df_games)} games and {len(df_events)-1} events...")
-        
-        # Build complete schedule with lineup data
-        schedule_data = self.game_formatter.build_complete_schedule(df_games, df_events, df_games_played)
+        print(f"Processing {len(df_games)} games and {len(df_events)} events...")
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Save output
-        output_path = os.path.join(output_dir, "schedule.json")
-        self.output_manager.save_json(schedule_data, output_path)
-        
-        print(f"Generated complete schedule with {len(schedule_data)} games")
-        return schedule_data
+        # Build complete schedule with lineup data, writing each game as it is formatted
+        json_path, ndjson_path = schedule_output_paths(output_dir, config.SCHEDULE_OUTPUT_FORMAT)
+        schedule_data = [] if keep_games else None
+        count = self.output_manager.save_stream(
+            # Partitions (seasons / game-id ranges) run in a process pool with SCHEDULE_WORKERS > 1
+            iter_schedule_entries(df_games, df_events, df_games_played,
+                                  config.SCHEDULE_WORKERS, config.SCHEDULE_PARTITION_GAMES),
+            json_path, ndjson_path, collect=schedule_data
+        )
+        
+        print(f"Generated complete schedule with {count} games")
+        return schedule_data if keep_games else count
     
     def create_initial_schedule(self, output_dir="./output"):
         """Create initial schedule.json from Google Sheets games data matching existing format"""
@@ -284,8 +387,8 @@ class UHLOpsManager:
         try:
             import pandas as pd
             
-            # Read from Google Sheets games range instead of CSV
-            df_games = self.sheets_client.get_range(config.GAMES_RANGE)
+            # Read from Google Sheets games range instead of CSV (below the header row)
+            df_games = self.sheets_client.get_sheet("games").iloc[1:].reset_index(drop=True)
             
             if df_games.empty:
                 print("❌ No games data found in Google Sheets")
@@ -402,7 +505,8 @@ class UHLOpsManager:
             import pandas as pd
             
             # Read the generated CSV schedule
-            csv_path = os.path.join(output_dir, "2025_2026_schedule.csv")
+            year = config.CURRENT_SEASON_YEAR
+            csv_path = os.path.join(output_dir, f"{year}_{year + 1}_schedule.csv")
             
             if not os.path.exists(csv_path):
                 print(f"❌ Generated schedule CSV not found at {csv_path}")
@@ -422,8 +526,9 @@ class UHLOpsManager:
                     "Home": row['Home'],
                     "Away": row['Away'],
                     "Time": row['Time'],
-                    "Ref1": "TBD",
-                    "Ref2": "",
+                    # Generated with --referees the CSV already carries assignments
+                    "Ref1": row['Ref1'] if 'Ref1' in df.columns and pd.notna(row['Ref1']) else "TBD",
+                    "Ref2": row['Ref2'] if 'Ref2' in df.columns and pd.notna(row['Ref2']) else "",
                     "GameLink": f"/gameSummary/{row['id'] - 1}",
                     "Score": "",
                     "Played": "N",  # Default for new season
@@ -443,17 +548,21 @@ class UHLOpsManager:
         """Calculate goalie statistics from existing schedule.json"""
         print("Calculating goalie statistics from schedule.json...")
         
-        # Load schedule data
+        # Stream schedule data one game at a time, keeping only played games' goalie lines
         schedule_path = os.path.join(output_dir, "schedule.json")
-        schedule_data = self.output_manager.load_json(schedule_path)
-        
-        if not schedule_data:
+        games = self.output_manager.stream_json(schedule_path, fields=GOALIE_GAME_FIELDS)
+        if games is None:
             print("No schedule data found. Please generate schedule first.")
             return None
+        try:
+            schedule_data = list(self.goalie_stats_formatter.goalie_games(games))
+        except JSONStreamError as e:
+            print(f"❌ {e}")
+            return None
         
         # Calculate goalie stats
         goalie_stats = self.goalie_stats_formatter.calculate_goalie_stats_from_schedule(schedule_data)
-        formatted_stats = self.goalie_stats_formatter.format_goalie_stats(goalie_stats)
+        formatted_stats = self.goalie_stats_formatter.format_goalie_stats(goalie_stats, self.league)
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
@@ -467,18 +576,10 @@ class UHLOpsManager:
         print(f"{'Name':<20} {'Team':<10} {'GP':<3} {'W':<3} {'L':<3} {'T':<3} {'SO':<3} {'GA':<3} {'GAA':<5} {'Record':<8}")
         print("-" * 80)
         
-        # Team ID to name mapping
-        team_names = {
-            "1": "New York",
-            "2": "Detroit", 
-            "3": "Chicago",
-            "4": "Boston"
-        }
-        
         for stats in formatted_stats[:10]:  # Show top 10
             full_name = f"{stats['firstName']} {stats['lastName']}"
             season = stats['seasons'][0] if stats['seasons'] else {}
-            team_name = team_names.get(season.get('Team', ''), 'Unknown')
+            team_name = self.league.team_name(season.get('Team', ''))
             gp = season.get('GP', '0')
             w = season.get('W', '0')
             l = season.get('L', '0')
@@ -495,6 +596,56 @@ class UHLOpsManager:
         
         return formatted_stats
 
+    def build_player_logs(self, output_dir="./output"):
+        """Build per-player game logs from existing schedule.json (see src/operations/player_logs_ops.py)"""
+        return self.player_logs.build_player_logs(
+            os.path.join(output_dir, "schedule.json"), os.path.join(output_dir, "players.json"), output_dir,
+            season_id=self.league.season_id
+        )
+
+    def build_head_to_head(self, output_dir="./output"):
+        """Update the team x team head-to-head matrix from schedule.json (see src/operations/head_to_head_ops.py)"""
+        return self.head_to_head.build_head_to_head(os.path.join(output_dir, "schedule.json"), output_dir)
+
+    def build_leaders(self, output_dir="./output"):
+        """Update leaders.json from the game log index (see src/operations/leaders_ops.py)"""
+        return self.leaders.build_leaders(
+            os.path.join(output_dir, "schedule.json"), os.path.join(output_dir, "players.json"), output_dir,
+            index=self.player_logs.index, season_id=self.league.season_id
+        )
+
+    def assign_referees(self, referees_file=None, output_dir="./output"):
+        """Fill TBD referees of upcoming games in schedule.json (see src/operations/referee_ops.py)"""
+        return RefereeOperations().assign_referees(
+            os.path.join(output_dir, "schedule.json"), referees_file, output_dir
+        )
+
+    def archive_season(self, season_id=None, schedule_file=None, output_dir="./output"):
+        """Archive a closed season as columnar tables (see src/operations/archive_ops.py)"""
+        return ArchiveOperations(self.league.archive_dir, self.league).archive_season(
+            schedule_file or os.path.join(output_dir, "schedule.json"), os.path.join(output_dir, "players.json"),
+            season_id or self.league.season_id
+        )
+
+    def archive_stats(self, season_ids=None, output_dir="./output"):
+        """Goalie stats and standings over archived seasons (see src/operations/archive_ops.py)"""
+        return ArchiveOperations(self.league.archive_dir, self.league).archive_stats(season_ids, output_dir)
+
+    def watch(self, output_dir="./output"):
+        """Keep outputs up to date, re-running stages as the spreadsheets change (see src/operations/watch_ops.py)"""
+        return WatchOperations(self, output_dir).run()
+
+    def serve(self, output_dir="./output"):
+        """
+        Run watch mode in the background and serve its outputs over the read API (src/api/server.py)
+        The last saved outputs are served until the first refresh finishes.
+        """
+        store = LeagueDataStore()
+        store.load_output_dir(output_dir)
+        watcher = WatchOperations(self, output_dir, listeners=[store.on_stage])
+        threading.Thread(target=watcher.run, name="uhl-watch", daemon=True).start()
+        run_server(store)
+
     def process_all(self, include_games=False):
         """Process all data types"""
         print("=== UHL Operations - Processing All Data ===")
@@ -517,23 +668,80 @@ class UHLOpsManager:
                 print(f"All games processed: {len(results['all_games']) if results.get('all_games') else 0}")
                 print(f"Single game processed: {'Yes' if results.get('single_game') else 'No'}")
             
+        except SheetsUnavailableError:
+            raise
         except Exception as e:
             print(f"Error during processing: {e}")
             return None
         
         return results
 
+def load_game_manifest(args):
+    """
+    Resolve game spreadsheet IDs from command line arguments.
+    Each argument may be a spreadsheet ID, a comma-separated list of IDs,
+    or a manifest file (JSON list, or one ID per line).
+    """
+    spreadsheet_ids = []
+    for arg in args:
+        if os.path.isfile(arg):
+            with open(arg, 'r') as f:
+                content = f.read()
+            if arg.endswith('.json'):
+                entries = json.loads(content)
+                spreadsheet_ids.extend(
+                    entry.get('spreadsheet_id', '') if isinstance(entry, dict) else str(entry)
+                    for entry in entries
+                )
+            else:
+                spreadsheet_ids.extend(
+                    line.strip() for line in content.splitlines()
+                    if line.strip() and not line.strip().startswith('#')
+                )
+        else:
+            spreadsheet_ids.extend(part.strip() for part in arg.split(','))
+    return [sid for sid in spreadsheet_ids if sid]
+
+def run_leagues(args):
+    """
+    `leagues [operations] [leagues]`: run operations (comma-separated, default
+    DEFAULT_LEAGUE_OPERATIONS) for the registered leagues (default all) concurrently
+    """
+    operations = args[0].split(',') if args and args[0] != "all" else None
+    league_keys = args[1].split(',') if len(args) > 1 else None
+    try:
+        runner = LeagueOperations(lambda league: UHLOpsManager(league=league))
+        outcomes = runner.run(operations, league_keys)
+    except (LeagueConfigError, ValueError) as e:
+        print(f"❌ {e}")
+        print(f"Operations: {', '.join(LEAGUE_OPERATIONS)}")
+        sys.exit(1)
+    # Exit non-zero if any league failed so scheduled runs notice
+    if any(error for _, error in outcomes.values()):
+        sys.exit(1)
+
 def main():
     """Main function for command line usage"""
     if len(sys.argv) < 2:
-        print("Usage: python uhl_ops.py [players|standings|games|single-game|all-games|game-events|schedule|create-schedule|goalie-stats|all] [player_sheet_id] [game_sheet_id]")
+        print("Usage: python uhl_ops.py [players|standings|games|single-game|games-batch|ingest-games|all-games|game-events|schedule|create-schedule|goalie-stats|player-logs|head-to-head|leaders|assign-refs|archive-season|archive-stats|leagues|watch|serve|all] [player_sheet_id] [game_sheet_id]")
         print("Examples:")
         print("  python uhl_ops.py players")
         print("  python uhl_ops.py schedule              # Generate complete schedule.json")
         print("  python uhl_ops.py create-schedule       # Create initial schedule.json from generated CSV")
         print("  python uhl_ops.py goalie-stats          # Calculate goalie statistics from schedule.json")
+        print("  python uhl_ops.py player-logs           # Build per-player game logs from schedule.json")
+        print("  python uhl_ops.py head-to-head          # Update the team vs team matrix from schedule.json")
+        print("  python uhl_ops.py leaders               # Build leaders.json (top skaters and goalies)")
+        print("  python uhl_ops.py assign-refs [referees.json]  # Fill TBD referees of upcoming games")
+        print("  python uhl_ops.py archive-season [season_id] [schedule.json]  # Archive a season as columnar tables")
+        print("  python uhl_ops.py archive-stats [1,2,...]  # Goalie stats + standings over archived seasons")
+        print("  python uhl_ops.py leagues [players,schedule,...] [league1,league2,...]  # Run every registered league at once")
         print("  python uhl_ops.py game-events")
         print("  python uhl_ops.py single-game <player_sheet_id> <game_sheet_id>") 
+        print("  python uhl_ops.py games-batch <manifest.json|game_ids.txt|id1,id2,...>")
+        print("  python uhl_ops.py ingest-games [manifest.json|id1,id2,...]  # Append game sheets to gameEvents/gamesPlayed")
+        print("  python uhl_ops.py watch [player_sheet_id] [game_sheet_id]  # Rebuild outputs as the sheets change")
+        print("  python uhl_ops.py serve [player_sheet_id] [game_sheet_id]  # Watch mode + read API")
         print("  python uhl_ops.py all <player_sheet_id>")
         return
     
@@ -543,8 +751,23 @@ def main():
     player_sheet_id = sys.argv[2] if len(sys.argv) > 2 else None
     game_sheet_id = sys.argv[3] if len(sys.argv) > 3 else None
     
+    # games-batch / ingest-games take game spreadsheet IDs / manifests, assign-refs a referee file,
+    # archive-season / archive-stats season ids
+    if operation in ("games-batch", "ingest-games", "assign-refs", "archive-season", "archive-stats"):
+        player_sheet_id, game_sheet_id = None, None
+    
+    if operation == "leagues":
+        run_leagues(sys.argv[2:])
+        return
+    
     try:
-        manager = UHLOpsManager(player_sheet_id, game_sheet_id)
+        # Watch mode keeps fetched sheets in memory between refreshes
+        league = get_league()
+        sheets_client = WarmSheetsClient(
+            player_sheet_id or league.player_spreadsheet_id, game_sheet_id or league.game_spreadsheet_id,
+            sheet_extents=league.sheet_extents
+        ) if operation in ("watch", "serve") else None
+        manager = UHLOpsManager(player_sheet_id, game_sheet_id, sheets_client, league)
         
         if operation == "players":
             manager.process_players()
@@ -555,7 +778,7 @@ def main():
         elif operation == "game-events":
             manager.analyze_game_events()
         elif operation == "schedule":
-            manager.build_complete_schedule()
+            manager.build_complete_schedule(keep_games=False)
         elif operation == "create-schedule" or operation == "initial-schedule":
             manager.create_initial_schedule()
         elif operation == "goalie-stats" or operation == "goalies":
@@ -566,10 +789,45 @@ def main():
                 print("Usage: python uhl_ops.py single-game <player_sheet_id> <game_sheet_id>")
                 return
             manager.process_single_game()
+        elif operation == "games-batch":
+            game_sheet_ids = load_game_manifest(sys.argv[2:])
+            if not game_sheet_ids:
+                print("❌ At least one game spreadsheet ID or manifest file is required")
+                print("Usage: python uhl_ops.py games-batch <manifest.json|game_ids.txt|id1,id2,...>")
+                return
+            manager.process_games_batch(game_sheet_ids)
+        elif operation == "ingest-games":
+            # Without arguments the game sheets listed in the 'gamelinks' sheet are ingested
+            game_sheet_ids = load_game_manifest(sys.argv[2:]) or None
+            manager.ingest_game_events(game_sheet_ids)
+        elif operation == "player-logs":
+            manager.build_player_logs()
+        elif operation == "head-to-head":
+            manager.build_head_to_head()
+        elif operation == "leaders":
+            manager.build_leaders()
+        elif operation == "assign-refs":
+            manager.assign_referees(sys.argv[2] if len(sys.argv) > 2 else None)
+        elif operation == "archive-season":
+            manager.archive_season(sys.argv[2] if len(sys.argv) > 2 else None,
+                                   sys.argv[3] if len(sys.argv) > 3 else None)
+        elif operation == "archive-stats":
+            manager.archive_stats(sys.argv[2].split(',') if len(sys.argv) > 2 else None)
+        elif operation == "watch":
+            manager.watch()
+        elif operation == "serve":
+            manager.serve()
         elif operation == "all":
             manager.process_all(include_games=True)
         else:
-            print("Invalid operation. Use: players, standings, games, single-game, all-games, game-events, schedule, goalie-stats, or all")
+            print("Invalid operation. Use: players, standings, games, single-game, games-batch, ingest-games, all-games, game-events, schedule, goalie-stats, player-logs, head-to-head, leaders, assign-refs, archive-season, archive-stats, leagues, watch, serve, or all")
+    except SheetsUnavailableError as e:
+        # Exit non-zero so weekly_update.sh stops instead of publishing empty outputs
+        print(f"❌ Google Sheets unavailable: {e}")
+        sys.exit(1)
+    except SchemaError as e:
+        print(f"❌ Sheet layout changed: {e}")
+        sys.exit(1)
     except ValueError as e:
         print(f"Configuration Error: {e}")
         print("\nTo fix this:")
@@ -1,34 +1,19 @@
 import csv
-import psycopg2
+import sys
+from pathlib import Path
 
-def update_player_statistics_from_csv(file_path):
-    try:
-        # Connect to the database
-        conn = psycopg2.connect(
-            dbname="uhl_db",
-            user="uhl_user",
-            password="uhl_password",
-            host="localhost",
-            port="5432"
-        )
-        cur = conn.cursor()
+# Shared database access (db/) lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-        # Begin transaction
-        conn.autocommit = False
+from db import transaction, execute_prepared  # noqa: E402
 
-        # Open the CSV file
-        with open(file_path, mode='r') as file:
+def update_player_statistics_from_csv(file_path):
+    try:
+        # One transaction on a pooled connection; rows go out in prepared batches
+        with transaction() as cur, open(file_path, mode='r') as file:
             csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                update_stat_query = """
-                UPDATE PlayerStatistics
-                SET GamesPlayed = %s,
-                    Goals = %s,
-                    Assists = %s,
-                    PenaltyMinutes = %s
-                WHERE SeasonID = %s AND PlayerID = %s AND TeamID = %s
-                """
-                cur.execute(update_stat_query, (
+            execute_prepared(cur, "update_player_statistics", (
+                (
                     row['GamesPlayed'],
                     row['Goals'],
                     row['Assists'],
@@ -36,23 +21,16 @@ def update_player_statistics_from_csv(file_path):
                     row['SeasonID'],
                     row['PlayerID'],
                     row['TeamID']
-                ))
-
-        # Commit the transaction
-        conn.commit()
+                )
+                for row in csv_reader
+            ))
 
         print("Player statistics updated successfully")
 
     except Exception as e:
-        # Rollback the transaction in case of error
-        conn.rollback()
+        # The transaction has been rolled back
         print(f"An error occurred: {e}")
 
-    finally:
-        # Close the cursor and connection
-        cur.close()
-        conn.close()
-
 if __name__ == "__main__":
     csv_file_path = '/path/to/player_statistics_update.csv'
-    update_player_statistics_from_csv(csv_file_path)
\ No newline at end of file
+    update_player_statistics_from_csv(csv_file_path)
@@ -1,31 +1,19 @@
 import csv
-import psycopg2
+import sys
+from pathlib import Path
 
-def load_player_statistics_from_csv(file_path):
-    try:
-        # Connect to the database
-        conn = psycopg2.connect(
-            dbname="uhl_db",
-            user="uhl_user",
-            password="uhl_password",
-            host="localhost",
-            port="5432"
-        )
-        cur = conn.cursor()
+# Shared database access (db/) lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-        # Begin transaction
-        conn.autocommit = False
+from db import transaction, execute_prepared  # noqa: E402
 
-        # Open the CSV file
-        with open(file_path, mode='r') as file:
+def load_player_statistics_from_csv(file_path):
+    try:
+        # One transaction on a pooled connection; rows go out in prepared batches
+        with transaction() as cur, open(file_path, mode='r') as file:
             csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                insert_stat_query = """
-                INSERT INTO PlayerStatistics (SeasonID, PlayerID, TeamID, GamesPlayed, Goals, Assists, PenaltyMinutes)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (SeasonID, PlayerID) DO NOTHING;
-                """
-                cur.execute(insert_stat_query, (
+            execute_prepared(cur, "insert_player_statistics", (
+                (
                     row['SeasonID'],
                     row['PlayerID'],
                     row['TeamID'],
@@ -33,23 +21,16 @@ def load_player_statistics_from_csv(file_path):
                     row['Goals'],
                     row['Assists'],
                     row['PenaltyMinutes']
-                ))
-
-        # Commit the transaction
-        conn.commit()
+                )
+                for row in csv_reader
+            ))
 
         print("Player statistics loaded successfully")
 
     except Exception as e:
-        # Rollback the transaction in case of error
-        conn.rollback()
+        # The transaction has been rolled back
         print(f"An error occurred: {e}")
 
-    finally:
-        # Close the cursor and connection
-        cur.close()
-        conn.close()
-
 if __name__ == "__main__":
     csv_file_path = '/path/to/player_statistics.csv'
-    load_player_statistics_from_csv(csv_file_path)
\ No newline at end of file
+    load_player_statistics_from_csv(csv_file_path)
@@ -1,5 +1,11 @@
 import csv
-import psycopg2
+import sys
+from pathlib import Path
+
+# Shared database access (db/) lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from db import transaction, execute_prepared  # noqa: E402
 
 def bulk_update_player_team_seasons(file_path):
     """
@@ -17,46 +23,19 @@ def bulk_update_player_team_seasons(file_path):
     The function will update the PlayerTeamSeasons table based on the PlayerID, TeamID, and SeasonID provided in the CSV file.
     """
     try:
-        # Connect to the database
-        conn = psycopg2.connect(
-            dbname="uhl_db",
-            user="uhl_user",
-            password="uhl_password",
-            host="localhost",
-            port="5432"
-        )
-        cur = conn.cursor()
-
-        # Begin transaction
-        conn.autocommit = False
-
-        # Open the CSV file
-        with open(file_path, mode='r') as file:
+        # One transaction on a pooled connection; rows go out in prepared batches
+        with transaction() as cur, open(file_path, mode='r') as file:
             csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                update_query = """
-                INSERT INTO PlayerTeamSeasons (PlayerID, TeamID, SeasonID, IsCurrent)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (PlayerID, TeamID, SeasonID)
-                DO UPDATE SET IsCurrent = EXCLUDED.IsCurrent;
-                """
-                cur.execute(update_query, (
-                    row['PlayerID'],
-                    row['TeamID'],
-                    row['SeasonID'],
-                    row['IsCurrent']
-                ))
-
-        # Commit the transaction
-        conn.commit()
+            execute_prepared(cur, "upsert_player_team_season", (
+                (row['PlayerID'], row['TeamID'], row['SeasonID'], row['IsCurrent'])
+                for row in csv_reader
+            ))
 
     except Exception as e:
+        # The transaction has been rolled back
         print(f"An error occurred: {e}")
-        conn.rollback()
-    finally:
-        cur.close()
-        conn.close()
 
 # Example usage
-file_path = 'player_team_seasons.csv'
-bulk_update_player_team_seasons(file_path)
\ No newline at end of file
+if __name__ == "__main__":
+    file_path = 'player_team_seasons.csv'
+    bulk_update_player_team_seasons(file_path)
@@ -1,37 +1,27 @@
 import csv
-import psycopg2
+import sys
+from pathlib import Path
+
+# Shared database access (db/) lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from db import transaction, execute_prepared  # noqa: E402
 
 def update_players_from_csv(file_path):
     try:
-        conn = psycopg2.connect(
-            dbname="uhl_db",
-            user="uhl_user",
-            password="uhl_password",
-            host="localhost",
-            port="5432"
-        )
-        cursor = conn.cursor()
-
-        with open(file_path, mode='r') as file:
+        # One transaction on a pooled connection; rows go out in prepared batches
+        with transaction() as cur, open(file_path, mode='r') as file:
             csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                update_query = """
-                UPDATE Players
-                SET TeamID = %s
-                WHERE PlayerID = %s;
-                """
-                cursor.execute(update_query, (row['TeamID'], row['PlayerID']))
+            execute_prepared(cur, "update_player_team", (
+                (row['TeamID'], row['PlayerID'])
+                for row in csv_reader
+            ))
 
-        conn.commit()
         print("Players updated successfully.")
 
     except Exception as e:
+        # The transaction has been rolled back
         print(f"An error occurred: {e}")
-        conn.rollback()
-
-    finally:
-        cursor.close()
-        conn.close()
 
 if __name__ == "__main__":
-    update_players_from_csv('input.csv')
\ No newline at end of file
+    update_players_from_csv('input.csv')
@@ -1,55 +1,34 @@
 import csv
-import psycopg2
+import sys
+from pathlib import Path
 
-def load_players_from_csv(file_path):
-    try:
-        # Connect to the database
-        conn = psycopg2.connect(
-            dbname="uhl_db",
-            user="uhl_user",
-            password="uhl_password",
-            host="localhost",
-            port="5432"
-        )
-        cur = conn.cursor()
+# Shared database access (db/) lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-        # Begin transaction
-        conn.autocommit = False
+from db import transaction, execute_prepared  # noqa: E402
 
-        # Open the CSV file
-        with open(file_path, mode='r') as file:
+def load_players_from_csv(file_path):
+    try:
+        # One transaction on a pooled connection; rows go out in prepared batches
+        with transaction() as cur, open(file_path, mode='r') as file:
             csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                # Convert empty strings to None
-                jersey_number = row['JerseyNumber'] if row['JerseyNumber'] else None
-
-                insert_user_query = """
-                INSERT INTO Players (FirstName, LastName, Position, JerseyNumber, Email)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (Email) DO UPDATE
-                SET FirstName = EXCLUDED.FirstName,
-                    LastName = EXCLUDED.LastName,
-                    Position = EXCLUDED.Position,
-                    JerseyNumber = EXCLUDED.JerseyNumber;
-                """
-                cur.execute(insert_user_query, (
+            execute_prepared(cur, "upsert_player", (
+                (
                     row['FirstName'],
                     row['LastName'],
                     row['Position'],
-                    jersey_number,
+                    # Convert empty strings to None
+                    row['JerseyNumber'] if row['JerseyNumber'] else None,
                     row['Email']
-                ))
-
-        # Commit the transaction
-        conn.commit()
+                )
+                for row in csv_reader
+            ))
 
     except Exception as e:
+        # The transaction has been rolled back
         print(f"An error occurred: {e}")
-        conn.rollback()
-    finally:
-        cur.close()
-        conn.close()
 
 # Example usage
-csv_file_path = 'input.csv'
-load_players_from_csv(csv_file_path)
\ No newline at end of file
+if __name__ == "__main__":
+    csv_file_path = 'input.csv'
+    load_players_from_csv(csv_file_path)
@@ -1,50 +1,28 @@
 import csv
-import psycopg2
+import sys
+from pathlib import Path
 
-def load_team_seasons_from_csv(file_path):
-    try:
-        # Connect to the database
-        conn = psycopg2.connect(
-            dbname="uhl_db",
-            user="uhl_user",
-            password="uhl_password",
-            host="localhost",
-            port="5432"
-        )
-        cur = conn.cursor()
+# Shared database access (db/) lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-        # Begin transaction
-        conn.autocommit = False
+from db import transaction, execute_prepared  # noqa: E402
 
-        # Open the CSV file
-        with open(file_path, mode='r') as file:
+def load_team_seasons_from_csv(file_path):
+    try:
+        # One transaction on a pooled connection; rows go out in prepared batches
+        with transaction() as cur, open(file_path, mode='r') as file:
             csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                insert_team_season_query = """
-                INSERT INTO TeamSeasons (TeamID, SeasonID)
-                VALUES (%s, %s)
-                ON CONFLICT DO NOTHING;
-                """
-                cur.execute(insert_team_season_query, (
-                    row['TeamID'],
-                    row['SeasonID']
-                ))
-
-        # Commit the transaction
-        conn.commit()
+            execute_prepared(cur, "insert_team_season", (
+                (row['TeamID'], row['SeasonID'])
+                for row in csv_reader
+            ))
 
         print("TeamSeasons loaded successfully")
 
     except Exception as e:
-        # Rollback the transaction in case of error
-        conn.rollback()
+        # The transaction has been rolled back
         print(f"An error occurred: {e}")
 
-    finally:
-        # Close the cursor and connection
-        cur.close()
-        conn.close()
-
 if __name__ == "__main__":
     csv_file_path = 'input.csv'
-    load_team_seasons_from_csv(csv_file_path)
\ No newline at end of file
+    load_team_seasons_from_csv(csv_file_path)